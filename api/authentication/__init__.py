@@ -0,0 +1,4 @@
+from .jwt import TOKEN_VERSION_CLAIM, CachedJWTAuthentication
+from .last_login import LastLoginRecorder, last_login_recorder
+
+__all__ = ['TOKEN_VERSION_CLAIM', 'CachedJWTAuthentication', 'LastLoginRecorder', 'last_login_recorder']
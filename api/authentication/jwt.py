@@ -0,0 +1,78 @@
+import base64
+import json
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from api.cache import token_cache
+
+# Claim holding the user's token version when the token was issued
+TOKEN_VERSION_CLAIM = 'token_version'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that caches accepted tokens per process, keyed by jti,
+    so repeated requests with the same token run no user query.
+    With AUTH_TOKEN_USER the user is built from the token claims
+    (simplejwt's TokenUser) and never loaded from the database.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        jti = self.get_token_id(raw_token)
+        if jti is not None:
+            cached = token_cache.get(jti, raw_token)
+            if cached is not None:
+                return cached
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_user(validated_token)
+        self.check_revocation(validated_token)
+
+        if jti is not None:
+            token_cache.set(jti, raw_token, user, validated_token)
+        return user, validated_token
+
+    def get_user(self, validated_token):
+        """
+        Return the token user in token-user mode, the database user otherwise.
+        """
+        if not settings.AUTH_TOKEN_USER:
+            return super().get_user(validated_token)
+
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+        return api_settings.TOKEN_USER_CLASS(validated_token)
+
+    def check_revocation(self, validated_token):
+        """
+        Refuse tokens issued before the user's password changed or the
+        user was deactivated: their token_version claim is behind the
+        user's current version. Skipped without AUTH_TOKEN_VERSIONS.
+        """
+        if not settings.AUTH_TOKEN_VERSIONS:
+            return
+        user_version = token_cache.user_version(validated_token[api_settings.USER_ID_CLAIM])
+        if validated_token.get(TOKEN_VERSION_CLAIM, 0) < user_version:
+            raise AuthenticationFailed(_('Token has been revoked'), code='token_revoked')
+
+    @staticmethod
+    def get_token_id(raw_token):
+        """
+        Read the jti claim without verifying the token, or return None.
+        """
+        try:
+            payload = raw_token.split(b'.')[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + b'=' * (-len(payload) % 4)))
+            return claims.get(api_settings.JTI_CLAIM)
+        except (IndexError, ValueError, TypeError, AttributeError):
+            return None
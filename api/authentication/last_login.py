@@ -0,0 +1,85 @@
+import atexit
+import logging
+import threading
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.db import DatabaseError, connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginRecorder:
+    """
+    Batches the last_login writes of token issuance.
+    Logins are collected in memory and written by a background thread every
+    LAST_LOGIN_FLUSH_INTERVAL seconds with a single UPDATE, so issuing a
+    token does not wait on a write to auth_user. An interval of 0 writes
+    synchronously, like simplejwt's UPDATE_LAST_LOGIN.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._thread = None
+
+    def record(self, user):
+        """
+        Record a login for the user.
+        """
+        if not settings.LAST_LOGIN_FLUSH_INTERVAL:
+            update_last_login(None, user)
+            return
+
+        user.last_login = timezone.now()
+        with self._lock:
+            self._pending[user.pk] = user.last_login
+            if self._thread is None:
+                self._start()
+
+    def flush(self):
+        """
+        Write the pending logins and return how many users were updated.
+        Logins are kept for the next flush if the write fails.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        User = get_user_model()
+        try:
+            User.objects.bulk_update(
+                [User(pk=pk, last_login=last_login) for pk, last_login in pending.items()],
+                ['last_login'],
+                batch_size=500,
+            )
+        except DatabaseError:
+            with self._lock:
+                for pk, last_login in pending.items():
+                    self._pending.setdefault(pk, last_login)
+            raise
+        return len(pending)
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name='last-login-flush', daemon=True)
+        self._thread.start()
+        atexit.register(self._flush_quietly)
+
+    def _run(self):
+        stop = threading.Event()
+        while not stop.wait(settings.LAST_LOGIN_FLUSH_INTERVAL or 1):
+            self._flush_quietly()
+
+    def _flush_quietly(self):
+        try:
+            self.flush()
+        except DatabaseError:
+            logger.exception('Could not write last_login')
+        finally:
+            # The flush thread holds its own connection; do not keep it idle
+            connection.close()
+
+
+last_login_recorder = LastLoginRecorder()
@@ -0,0 +1,22 @@
+from .http import HTTPError, LoadGenerator
+from .runner import InProcessRunner, LiveRunner, run_scenarios
+from .scenarios import SCENARIOS, BenchmarkContext, Scenario
+from .seed import copy_tasks, seed_statuses, seed_user
+from .stats import compare, percentiles, summarize
+
+__all__ = [
+    'HTTPError',
+    'LoadGenerator',
+    'InProcessRunner',
+    'LiveRunner',
+    'run_scenarios',
+    'SCENARIOS',
+    'BenchmarkContext',
+    'Scenario',
+    'copy_tasks',
+    'seed_statuses',
+    'seed_user',
+    'compare',
+    'percentiles',
+    'summarize',
+]
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import time
+from .stats import summarize
+
+
+class HTTPError(Exception):
+    """
+    Raised when the server under test answers a setup request with an error.
+    """
+
+
+class LoadGenerator:
+    """
+    Minimal asyncio HTTP/1.1 load generator.
+    Each simulated client keeps one keep-alive connection and sends requests
+    back to back until the deadline. Only needs the standard library.
+    """
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+
+    async def obtain_token(self, username, password):
+        """
+        Obtain a JWT access token from /api/auth/token/.
+        """
+        body = json.dumps({'username': username, 'password': password}).encode()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            status, payload = await self.request(reader, writer, 'POST', '/api/auth/token/', {
+                'Host': f'{self.host}:{self.port}',
+                'Content-Type': 'application/json',
+                'Connection': 'close',
+            }, body)
+        finally:
+            writer.close()
+        if status != 200:
+            raise HTTPError(f'Could not obtain a token (HTTP {status}): {payload[:200]!r}')
+        return json.loads(payload)['access']
+
+    async def run(self, make_request, headers, concurrency, duration):
+        """
+        Run concurrent clients for duration seconds and summarize the results.
+        make_request(n) returns the (method, path, body) of the n-th request.
+        """
+        latencies = []
+        status_codes = {}
+        errors = 0
+        deadline = time.perf_counter() + duration
+
+        async def client(offset):
+            nonlocal errors
+            reader = writer = None
+            n = offset
+            while time.perf_counter() < deadline:
+                method, path, body = make_request(n)
+                n += concurrency
+                try:
+                    if writer is None:
+                        reader, writer = await asyncio.open_connection(self.host, self.port)
+                    start = time.perf_counter()
+                    status, _ = await self.request(reader, writer, method, path, headers, body)
+                    latencies.append(time.perf_counter() - start)
+                    status_codes[status] = status_codes.get(status, 0) + 1
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    errors += 1
+                    if writer is not None:
+                        writer.close()
+                    reader = writer = None
+            if writer is not None:
+                writer.close()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client(i) for i in range(concurrency)))
+        return summarize(latencies, time.perf_counter() - started, status_codes, errors)
+
+    async def request(self, reader, writer, method, path, headers, body=b''):
+        """
+        Send one HTTP/1.1 request and return (status, body).
+        """
+        head = f'{method} {path} HTTP/1.1\r\n'
+        head += ''.join(f'{name}: {value}\r\n' for name, value in headers.items())
+        if body and 'Content-Type' not in headers:
+            head += 'Content-Type: application/json\r\n'
+        head += f'Content-Length: {len(body)}\r\n\r\n'
+        writer.write(head.encode() + body)
+        await writer.drain()
+
+        status_line = await reader.readuntil(b'\r\n')
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get('transfer-encoding') == 'chunked':
+            payload = b''
+            while True:
+                size = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                payload += (await reader.readexactly(size + 2))[:-2]
+                if size == 0:
+                    break
+            return status, payload
+        if status == 304 or method == 'HEAD':
+            return status, b''
+        if 'content-length' not in response_headers:
+            raise ValueError('response has neither Content-Length nor chunked encoding')
+        return status, await reader.readexactly(int(response_headers['content-length']))
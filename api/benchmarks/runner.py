@@ -0,0 +1,113 @@
+import asyncio
+import json
+import time
+from datetime import timezone as dt_timezone
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.test import Client, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+from api.pagination.counts import counter_table_count
+from .http import LoadGenerator
+from .stats import summarize
+
+
+class InProcessRunner:
+    """
+    Runs scenarios sequentially through Django's test client, without a
+    server or network in between. Measures the full request/response
+    cycle including middleware.
+    """
+    mode = 'inprocess'
+
+    def __init__(self, context, user, requests=200, warmup=10):
+        self.context = context
+        self.requests = requests
+        self.warmup = warmup
+        self.anonymous = Client(raise_request_exception=False)
+        self.authenticated = Client(
+            raise_request_exception=False,
+            HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}',
+        )
+
+    def run(self, scenario):
+        client = self.authenticated if scenario.authenticated else self.anonymous
+        make_request = scenario.build(self.context)
+        latencies = []
+        status_codes = {}
+        errors = 0
+
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            for n in range(self.warmup + self.requests):
+                method, path, body = make_request(n)
+                start = time.perf_counter()
+                try:
+                    response = client.generic(
+                        method, path,
+                        json.dumps(body) if body is not None else '',
+                        content_type='application/json',
+                    )
+                except Exception:
+                    errors += 1
+                    continue
+                elapsed = time.perf_counter() - start
+                if n < self.warmup:
+                    continue
+                latencies.append(elapsed)
+                status_codes[response.status_code] = status_codes.get(response.status_code, 0) + 1
+
+        return summarize(latencies, sum(latencies), status_codes, errors)
+
+
+class LiveRunner:
+    """
+    Runs scenarios against a running server with the asyncio load
+    generator: concurrency keep-alive clients for duration seconds each.
+    """
+    mode = 'live'
+
+    def __init__(self, context, url, concurrency=32, duration=10):
+        url = urlsplit(url)
+        if url.scheme != 'http' or not url.hostname:
+            raise ValueError('url must be an http:// URL')
+        self.context = context
+        self.netloc = url.netloc
+        self.concurrency = concurrency
+        self.duration = duration
+        self.generator = LoadGenerator(url.hostname, url.port or 80)
+        self.token = None
+
+    def run(self, scenario):
+        headers = {'Host': self.netloc, 'Accept': 'application/json', 'Connection': 'keep-alive'}
+        if scenario.authenticated:
+            if self.token is None:
+                self.token = asyncio.run(self.generator.obtain_token(self.context.username, self.context.password))
+            headers['Authorization'] = f'Bearer {self.token}'
+        make_request = scenario.build(self.context)
+
+        def encoded(n):
+            method, path, body = make_request(n)
+            return method, path, json.dumps(body).encode() if body is not None else b''
+
+        return asyncio.run(self.generator.run(encoded, headers, self.concurrency, self.duration))
+
+
+def run_scenarios(runner, scenarios, progress=None):
+    """
+    Run each scenario with runner and return the report: mode, dataset
+    size and one summary per scenario.
+    """
+    report = {
+        'mode': runner.mode,
+        'started_at': timezone.now().astimezone(dt_timezone.utc).isoformat(),
+        'dataset': {
+            'tasks': counter_table_count(),
+            'statuses': len(runner.context.status_ids),
+        },
+        'scenarios': {},
+    }
+    for scenario in scenarios:
+        report['scenarios'][scenario.name] = runner.run(scenario)
+        if progress is not None:
+            progress(scenario, report['scenarios'][scenario.name])
+    return report
@@ -0,0 +1,131 @@
+import random
+from urllib.parse import urlencode
+from django.db.models import Max, Min
+from django.urls import reverse
+from api.models import Status, Task
+from .seed import BENCHMARK_PASSWORD, BENCHMARK_USERNAME, WORDS
+
+
+class BenchmarkContext:
+    """
+    Data the scenarios draw their requests from: a sample of existing task
+    ids, the status ids and the credentials of the benchmark user.
+    """
+
+    def __init__(self, task_ids, status_ids, username=BENCHMARK_USERNAME, password=BENCHMARK_PASSWORD, seed=0):
+        self.task_ids = task_ids
+        self.status_ids = status_ids
+        self.username = username
+        self.password = password
+        self.rng = random.Random(seed)
+
+    @classmethod
+    def load(cls, sample=1000, seed=0, **kwargs):
+        """
+        Sample up to sample task ids by probing random primary keys between
+        the lowest and highest id, which stays cheap on large tables.
+        """
+        rng = random.Random(seed)
+        bounds = Task.objects.aggregate(low=Min('pk'), high=Max('pk'))
+        task_ids = []
+        if bounds['low'] is not None:
+            candidates = {rng.randint(bounds['low'], bounds['high']) for _ in range(sample * 2)}
+            task_ids = sorted(Task.objects.filter(pk__in=candidates).values_list('pk', flat=True)[:sample])
+        status_ids = list(Status.objects.order_by('pk').values_list('pk', flat=True))
+        return cls(task_ids, status_ids, seed=seed, **kwargs)
+
+    def pick(self, values, n):
+        return values[n % len(values)]
+
+
+class Scenario:
+    """
+    A named benchmark scenario.
+    build(context) returns a function mapping the request number to the
+    (method, path, body) to send; body is a dict sent as JSON, or None.
+    Scenarios with authenticated=False send no Authorization header.
+    """
+
+    def __init__(self, name, description, build, authenticated=True):
+        self.name = name
+        self.description = description
+        self.build = build
+        self.authenticated = authenticated
+
+    def __repr__(self):
+        return f'<Scenario {self.name}>'
+
+
+def list_path(**params):
+    return f'{reverse("task-list")}?{urlencode(params)}'
+
+
+def build_list(context):
+    path = list_path(page_size=50)
+    return lambda n: ('GET', path, None)
+
+
+def build_list_filter(context):
+    paths = [list_path(status=status_id, page_size=50) for status_id in context.status_ids]
+    return lambda n: ('GET', context.pick(paths, n), None)
+
+
+def build_list_search(context):
+    paths = [list_path(search=word, page_size=50) for word in WORDS]
+    return lambda n: ('GET', context.pick(paths, n), None)
+
+
+def build_list_ordering(context):
+    paths = [
+        list_path(ordering=ordering, page_size=50)
+        for ordering in ('created_at', '-updated_at', 'updated_at', 'name', '-name')
+    ]
+    return lambda n: ('GET', context.pick(paths, n), None)
+
+
+def build_detail(context):
+    paths = [reverse('task-detail', kwargs={'pk': task_id}) for task_id in context.task_ids]
+    return lambda n: ('GET', context.pick(paths, n), None)
+
+
+def build_create(context):
+    path = reverse('task-list')
+
+    def make_request(n):
+        return 'POST', path, {
+            'name': f'Benchmark task {n}',
+            'content': ' '.join(context.rng.choices(WORDS, k=12)),
+            'status': context.pick(context.status_ids, n),
+        }
+    return make_request
+
+
+def build_mark_complete(context):
+    path = reverse('mark-tasks-as-complete')
+    ids = context.task_ids
+
+    def make_request(n):
+        start = (n * 10) % len(ids)
+        return 'POST', path, {'task_ids': ids[start:start + 10]}
+    return make_request
+
+
+def build_token(context):
+    path = reverse('token_obtain_pair')
+    body = {'username': context.username, 'password': context.password}
+    return lambda n: ('POST', path, body)
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario('list', 'First page of the task list', build_list),
+        Scenario('list-filter', 'Task list filtered by each status in turn', build_list_filter),
+        Scenario('list-search', 'Full-text search over name and content', build_list_search),
+        Scenario('list-ordering', 'Task list under each ordering in turn', build_list_ordering),
+        Scenario('detail', 'Task detail for sampled ids', build_detail),
+        Scenario('create', 'Create a task', build_create),
+        Scenario('mark-complete', 'Mark ten sampled tasks as complete', build_mark_complete),
+        Scenario('token', 'Obtain a JWT pair with username and password', build_token, authenticated=False),
+    )
+}
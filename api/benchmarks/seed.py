@@ -0,0 +1,127 @@
+import io
+import random
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+from api.cache import list_response_cache
+from api.models import Status, Task
+
+DEFAULT_STATUSES = [
+    ('Por Hacer', '#6B7280'),
+    ('En Progreso', '#3B82F6'),
+    ('Completado', '#10B981'),
+    ('Bloqueado', '#EF4444'),
+]
+
+BENCHMARK_USERNAME = 'benchmark'
+BENCHMARK_PASSWORD = 'benchmark'
+
+WORDS = (
+    'revisar actualizar crear corregir documentar desplegar migrar probar '
+    'optimizar validar api base datos usuario tarea informe cliente servidor '
+    'consulta índice caché error prueba módulo función clase formulario '
+    'reporte equipo versión dependencia configuración seguridad rendimiento'
+).split()
+
+
+def seed_statuses(count):
+    """
+    Return count statuses: the default four first, then generated ones.
+    Existing statuses with the same name are reused.
+    """
+    definitions = DEFAULT_STATUSES[:count]
+    definitions += [(f'Estado {i}', f'#{i * 2654435761 % 0xFFFFFF:06X}') for i in range(len(definitions) + 1, count + 1)]
+    statuses = [
+        Status.objects.get_or_create(name=name, defaults={'hexa_color': color})[0]
+        for name, color in definitions
+    ]
+    return statuses
+
+
+def seed_user(username=BENCHMARK_USERNAME, password=BENCHMARK_PASSWORD):
+    """
+    Create the user the scenarios log in as, or reset its password if it
+    changed (a password change revokes the user's tokens).
+    """
+    user = User.objects.filter(username=username).first()
+    if user is None:
+        return User.objects.create_user(username=username, password=password)
+    if not user.check_password(password):
+        user.set_password(password)
+        user.save()
+    return user
+
+
+class TaskRows(io.TextIOBase):
+    """
+    File-like object producing count task rows in COPY text format.
+    Rows are generated lazily as COPY reads, so memory use does not grow
+    with the number of tasks.
+    """
+
+    def __init__(self, count, status_ids, rng, now, days=365):
+        self.remaining = count
+        self.status_ids = status_ids
+        self.rng = rng
+        self.now = now
+        self.days = days
+        self.buffer = ''
+
+    def readable(self):
+        return True
+
+    def row(self):
+        rng = self.rng
+        name = ' '.join(rng.choices(WORDS, k=rng.randint(2, 6))).capitalize()
+        content = ' '.join(rng.choices(WORDS, k=rng.randint(8, 40))).capitalize() + '.'
+        created_at = self.now - timedelta(seconds=rng.randrange(self.days * 86400))
+        updated_at = created_at + timedelta(seconds=rng.randrange(int((self.now - created_at).total_seconds()) + 1))
+        return f'{name}\t{content}\t{rng.choice(self.status_ids)}\t{created_at.isoformat()}\t{updated_at.isoformat()}\n'
+
+    def read(self, size=-1):
+        chunk = []
+        length = len(self.buffer)
+        while self.remaining and (size is None or size < 0 or length < size):
+            line = self.row()
+            chunk.append(line)
+            length += len(line)
+            self.remaining -= 1
+        data = self.buffer + ''.join(chunk)
+        if size is None or size < 0:
+            self.buffer = ''
+            return data
+        self.buffer = data[size:]
+        return data[:size]
+
+
+def copy_tasks(count, statuses, batch_size=100000, seed=0, progress=None):
+    """
+    Insert count generated tasks with COPY, batch_size rows per transaction.
+    Names, contents and statuses are drawn from random.Random(seed), so the
+    same arguments produce the same dataset; created_at is spread over the
+    last year. Returns the number of rows inserted.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    status_ids = [status.pk for status in statuses]
+    opts = Task._meta
+    columns = ', '.join(
+        connection.ops.quote_name(opts.get_field(name).column)
+        for name in ('name', 'content', 'status', 'created_at', 'updated_at')
+    )
+    sql = f'COPY {connection.ops.quote_name(opts.db_table)} ({columns}) FROM STDIN'
+
+    inserted = 0
+    while inserted < count:
+        batch = min(batch_size, count - inserted)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.copy_expert(sql, TaskRows(batch, status_ids, rng, now))
+        inserted += batch
+        if progress is not None:
+            progress(inserted)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE {connection.ops.quote_name(opts.db_table)}')
+    list_response_cache.invalidate(Task)
+    return inserted
@@ -0,0 +1,60 @@
+import statistics
+
+
+def percentiles(latencies):
+    """
+    Return latency percentiles in milliseconds for a list of seconds.
+    """
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000  # noqa: E731
+    return {
+        'p50': pick(0.50),
+        'p90': pick(0.90),
+        'p95': pick(0.95),
+        'p99': pick(0.99),
+        'max': ordered[-1] * 1000,
+        'mean': statistics.fmean(ordered) * 1000,
+    }
+
+
+def summarize(latencies, elapsed, status_codes, errors=0):
+    """
+    Build the result of one measurement: request count, throughput,
+    status codes and latency percentiles.
+    """
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'duration': elapsed,
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+        'status_codes': {str(code): count for code, count in sorted(status_codes.items())},
+        'latency_ms': percentiles(latencies),
+    }
+
+
+def compare(baseline, current):
+    """
+    Compare two benchmark reports scenario by scenario.
+    Returns, for each scenario in both, the throughput and latency
+    percentiles of each run and the relative change (current / baseline - 1).
+    """
+    comparison = {}
+    for name, result in current['scenarios'].items():
+        previous = baseline['scenarios'].get(name)
+        if previous is None:
+            continue
+        metrics = {'throughput': (previous['throughput'], result['throughput'])}
+        for key in ('p50', 'p95', 'p99'):
+            if key in previous['latency_ms'] and key in result['latency_ms']:
+                metrics[key] = (previous['latency_ms'][key], result['latency_ms'][key])
+        comparison[name] = {
+            key: {
+                'baseline': before,
+                'current': after,
+                'change': after / before - 1 if before else None,
+            }
+            for key, (before, after) in metrics.items()
+        }
+    return comparison
@@ -0,0 +1,9 @@
+from .status import StatusCache, status_cache
+from .responses import ListResponseCache, list_response_cache
+from .tokens import TokenCache, token_cache
+
+__all__ = [
+    'StatusCache', 'status_cache',
+    'ListResponseCache', 'list_response_cache',
+    'TokenCache', 'token_cache',
+]
@@ -0,0 +1,131 @@
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+class ListResponseCache:
+    """
+    Cache of list responses keyed on the view, the user and the normalized
+    query string. Every key embeds the generation counters of the models the
+    list reads; writes bump those counters, so entries cached before a write
+    are never read again and simply expire.
+    """
+    prefix = 'api:list-cache'
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def timeout(self):
+        return settings.LIST_CACHE_TIMEOUT
+
+    def make_key(self, name, models, request):
+        """
+        Build the cache key for a list request.
+        """
+        generations = self.generations(models)
+        user = request.user.pk if request.user.is_authenticated else 'anon'
+        query = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            for value in values
+            if value != ''
+        )
+        digest = hashlib.md5(repr(query).encode(), usedforsecurity=False).hexdigest()
+        return f'{self.prefix}:{name}:{":".join(map(str, generations))}:{user}:{digest}'
+
+    def get(self, name, key):
+        """
+        Return the cached entry, or None, counting the hit or miss.
+        """
+        entry = cache.get(key)
+        self._count(name, 'hits' if entry is not None else 'misses')
+        return entry
+
+    def set(self, key, entry):
+        cache.set(key, entry, self.timeout)
+
+    def generations(self, models):
+        keys = [self._generation_key(model) for model in models]
+        values = cache.get_many(keys)
+        for key in keys:
+            if key not in values:
+                # First use, or the counter was evicted: start above any
+                # value it may have had before
+                cache.add(key, time.time_ns(), None)
+                values[key] = cache.get(key)
+        return [values[key] for key in keys]
+
+    def invalidate(self, *models):
+        """
+        Bump the generation of each model now and again after commit,
+        since another request may cache the old rows while the transaction
+        is still open. Inside deferred_invalidation() the bump happens
+        once, when the block exits.
+        """
+        deferred = getattr(self._local, 'deferred', None)
+        if deferred is not None:
+            deferred.update(models)
+            return
+
+        self._bump(models)
+        transaction.on_commit(lambda: self._bump(models))
+
+    @contextmanager
+    def deferred_invalidation(self):
+        """
+        Collect invalidations made inside the block (e.g. one post_delete
+        per row of a bulk delete) and bump each generation once on exit.
+        """
+        if getattr(self._local, 'deferred', None) is not None:
+            yield
+            return
+
+        self._local.deferred = set()
+        try:
+            yield
+        finally:
+            models, self._local.deferred = self._local.deferred, None
+            if models:
+                self.invalidate(*models)
+
+    def stats(self, *names):
+        """
+        Return the hit and miss counters of each named list.
+        """
+        keys = {
+            (name, counter): f'{self.prefix}:{counter}:{name}'
+            for name in names
+            for counter in ('hits', 'misses')
+        }
+        values = cache.get_many(keys.values())
+        stats = {name: {'hits': 0, 'misses': 0} for name in names}
+        for (name, counter), key in keys.items():
+            stats[name][counter] = values.get(key, 0)
+        return stats
+
+    def _bump(self, models):
+        for model in models:
+            key = self._generation_key(model)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, time.time_ns(), None)
+
+    def _count(self, name, counter):
+        key = f'{self.prefix}:{counter}:{name}'
+        try:
+            cache.incr(key)
+        except ValueError:
+            if not cache.add(key, 1, None):
+                cache.incr(key)
+
+    def _generation_key(self, model):
+        return f'{self.prefix}:generation:{model._meta.label_lower}'
+
+
+list_response_cache = ListResponseCache()
@@ -0,0 +1,91 @@
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from api.models import Status
+
+
+class StatusCache:
+    """
+    Process-wide cache of Status rows keyed by id and by case-folded name.
+    The status table is tiny and rarely written, so it is loaded whole and
+    kept in memory. A version token stored in Django's cache framework tells
+    every worker process when its copy is stale. Without a shared cache the
+    token is only seen by the process that wrote it, so other processes
+    reload on a lookup miss and every STATUS_CACHE_TTL seconds.
+    """
+    version_key = 'api:status-cache:version'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._loaded_at = 0
+        self._by_id = {}
+        self._by_name = {}
+        self._ordered = []
+
+    def get(self, pk):
+        """
+        Return the Status with the given id, or None.
+        """
+        status = self._load()[0].get(pk)
+        if status is None:
+            # Possibly created by another process
+            status = self._load(reload=True)[0].get(pk)
+        return status
+
+    def get_by_name(self, name):
+        """
+        Return the Status with the given name (case-insensitive), or None.
+        """
+        status = self._load()[1].get(name.casefold())
+        if status is None:
+            status = self._load(reload=True)[1].get(name.casefold())
+        return status
+
+    def all(self):
+        """
+        Return every Status, in the model's default ordering.
+        """
+        return list(self._load()[2])
+
+    def invalidate(self):
+        """
+        Drop the local copy and publish a new version token so every other
+        worker reloads on its next read.
+        """
+        cache.set(self.version_key, uuid.uuid4().hex, None)
+        with self._lock:
+            self._version = None
+
+    def _current_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            # First use, or the token was evicted: publish a fresh one
+            cache.add(self.version_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_key)
+        return version
+
+    def _is_fresh(self, version):
+        if version is None or version != self._version:
+            return False
+        ttl = settings.STATUS_CACHE_TTL
+        return ttl is None or time.monotonic() - self._loaded_at < ttl
+
+    def _load(self, reload=False):
+        version = self._current_version()
+        with self._lock:
+            if not reload and self._is_fresh(version):
+                return self._by_id, self._by_name, self._ordered
+
+            ordered = list(Status.objects.all())
+            self._by_id = {status.pk: status for status in ordered}
+            self._by_name = {status.name.casefold(): status for status in ordered}
+            self._ordered = ordered
+            self._version = version
+            self._loaded_at = time.monotonic()
+            return self._by_id, self._by_name, self._ordered
+
+
+status_cache = StatusCache()
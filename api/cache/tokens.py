@@ -0,0 +1,123 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+
+
+class TokenCache:
+    """
+    Per-process LRU of authenticated access tokens keyed by jti.
+    A hit skips signature verification and the user lookup for a token this
+    process has already accepted. Entries expire after AUTH_CACHE_TTL
+    seconds or with the token, whichever comes first. A version token in
+    Django's cache flushes every worker's copy when a user changes, and a
+    per-user counter, embedded in the tokens issued to the user, refuses
+    tokens issued before a password change or deactivation.
+    Both live in Django's cache, so the cache must be shared by every worker
+    (see AUTH_CACHE_TTL and AUTH_TOKEN_VERSIONS in settings).
+    """
+    version_key = 'api:token-cache:version'
+    user_version_key = 'api:token-cache:user-version:{}'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._entries = OrderedDict()
+
+    def get(self, jti, raw_token):
+        """
+        Return the cached (user, token) pair, or None.
+        The raw token must match byte for byte: a jti alone proves nothing
+        until the signature is checked.
+        """
+        if not settings.AUTH_CACHE_TTL:
+            return None
+
+        version = self._current_version()
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+                return None
+
+            entry = self._entries.get(jti)
+            if entry is None or entry[0] != raw_token:
+                return None
+            if entry[3] <= time.time():
+                del self._entries[jti]
+                return None
+            self._entries.move_to_end(jti)
+            return entry[1], entry[2]
+
+    def set(self, jti, raw_token, user, token):
+        if not settings.AUTH_CACHE_TTL:
+            return
+
+        expires_at = min(time.time() + settings.AUTH_CACHE_TTL, token['exp'])
+        with self._lock:
+            self._entries[jti] = (raw_token, user, token, expires_at)
+            self._entries.move_to_end(jti)
+            while len(self._entries) > settings.AUTH_CACHE_MAX_SIZE:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """
+        Drop the local entries and publish a new version token so every
+        other worker drops theirs on its next request.
+        """
+        cache.set(self.version_key, uuid.uuid4().hex, None)
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+    def revoke_user(self, user_id):
+        """
+        Refuse every token issued to the user so far, by moving the user's
+        token version past theirs. Only flushes the cached tokens without
+        AUTH_TOKEN_VERSIONS.
+        """
+        if settings.AUTH_TOKEN_VERSIONS:
+            key = self.user_version_key.format(user_id)
+            try:
+                cache.incr(key)
+            except ValueError:
+                if not cache.add(key, 1):
+                    cache.incr(key)
+            # Kept as long as a refresh token issued before now may be used
+            lifetime = max(
+                settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'], settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME']
+            ).total_seconds()
+            cache.touch(key, int(lifetime))
+        self.invalidate()
+
+    def user_version(self, user_id):
+        """
+        Return the user's token version: tokens carrying a lower one are refused.
+        Always 0 without AUTH_TOKEN_VERSIONS.
+        """
+        if not settings.AUTH_TOKEN_VERSIONS:
+            return 0
+        return cache.get(self.user_version_key.format(user_id), 0)
+
+    def user_versions(self, user_ids):
+        """
+        Return {user_id: token version} for several users in one cache read.
+        """
+        if not settings.AUTH_TOKEN_VERSIONS:
+            return {user_id: 0 for user_id in user_ids}
+        keys = {self.user_version_key.format(user_id): user_id for user_id in user_ids}
+        versions = cache.get_many(keys)
+        return {user_id: versions.get(key, 0) for key, user_id in keys.items()}
+
+    def _current_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            # First use, or the token was evicted: publish a fresh one
+            cache.add(self.version_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_key)
+        return version
+
+
+token_cache = TokenCache()
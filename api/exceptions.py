@@ -0,0 +1,20 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailed(APIException):
+    """
+    Raised when an If-Match / If-Unmodified-Since precondition does not hold.
+    """
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The resource has been modified since it was last fetched.'
+    default_code = 'precondition_failed'
+
+
+class CursorExpired(APIException):
+    """
+    Raised when a change feed cursor is older than the tombstone retention.
+    """
+    status_code = status.HTTP_410_GONE
+    default_detail = 'The cursor has expired; discard local data and sync again without ?since=.'
+    default_code = 'cursor_expired'
@@ -0,0 +1,3 @@
+from .task import TaskSearchFilter, TaskOrderingFilter
+
+__all__ = ['TaskSearchFilter', 'TaskOrderingFilter']
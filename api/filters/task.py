@@ -0,0 +1,81 @@
+import operator
+import re
+from functools import reduce
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.functions import Cast
+from rest_framework import filters
+
+# Must match the text search configuration used by the search_vector trigger
+SEARCH_CONFIG = 'simple'
+
+# Annotation holding the relevance of each row for the current search
+SEARCH_RANK_FIELD = 'search_rank'
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+class TaskSearchFilter(filters.SearchFilter):
+    """
+    Full-text search over Task name and content.
+    Keeps the ?search= parameter of DRF's SearchFilter: every term must
+    match. A task matches when its GIN-indexed search_vector matches the
+    terms as word prefixes, or when DRF's substring (ILIKE) search matches,
+    which pg_trgm indexes keep index-assisted. Both are checked in the same
+    query; rows are annotated with their relevance, 0 for substring-only
+    matches, so ordering by -search_rank lists full-text matches first.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        search_fields = self.get_search_fields(view, request)
+        if not search_terms or not search_fields:
+            return queryset
+
+        condition = self.get_substring_condition(queryset, search_fields, search_terms)
+        rank = Value(0.0, output_field=FloatField())
+        query = self.get_search_query(search_terms)
+        if query is not None:
+            condition |= Q(search_vector=query)
+            # ts_rank is a real: as double precision, the value a pagination
+            # cursor stores compares equal to the row's rank again
+            rank = Case(
+                When(search_vector=query, then=Cast(SearchRank(F('search_vector'), query), FloatField())),
+                default=rank,
+                output_field=FloatField(),
+            )
+        return queryset.filter(condition).annotate(**{SEARCH_RANK_FIELD: rank})
+
+    def get_substring_condition(self, queryset, search_fields, search_terms):
+        """
+        Build DRF's substring condition: every term in one of the fields.
+        """
+        lookups = [self.construct_search(str(field), queryset) for field in search_fields]
+        return reduce(operator.and_, (
+            reduce(operator.or_, (Q(**{lookup: term}) for lookup in lookups))
+            for term in search_terms
+        ))
+
+    def get_search_query(self, search_terms):
+        """
+        Build a prefix tsquery requiring every word of every term, or None
+        when the terms contain no words.
+        """
+        words = [word for term in search_terms for word in WORD_PATTERN.findall(term.lower())]
+        if not words:
+            return None
+        return SearchQuery(' & '.join(f'{word}:*' for word in words), config=SEARCH_CONFIG, search_type='raw')
+
+
+class TaskOrderingFilter(filters.OrderingFilter):
+    """
+    Ordering filter for Task lists.
+    Also accepts ordering by search relevance while a search is active.
+    """
+
+    def get_valid_fields(self, queryset, view, context={}):
+        valid_fields = super().get_valid_fields(queryset, view, context)
+        request = context.get('request')
+        if request is not None and request.query_params.get(filters.SearchFilter.search_param):
+            valid_fields = valid_fields + [(SEARCH_RANK_FIELD, SEARCH_RANK_FIELD)]
+        return valid_fields
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with the iteration count from PBKDF2_ITERATIONS.
+    Hashes made with another count are rehashed on the next login.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PBKDF2_ITERATIONS
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """
+    Argon2id with the costs from ARGON2_TIME_COST, ARGON2_MEMORY_COST (KiB)
+    and ARGON2_PARALLELISM. Requires argon2-cffi.
+    Hashes made with other costs are rehashed on the next login.
+    """
+
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.ARGON2_PARALLELISM
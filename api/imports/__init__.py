@@ -0,0 +1,9 @@
+from .tasks import READERS, TaskImporter, TaskImportError, read_csv, read_ndjson
+
+__all__ = [
+    'READERS',
+    'TaskImporter',
+    'TaskImportError',
+    'read_csv',
+    'read_ndjson',
+]
@@ -0,0 +1,218 @@
+import csv
+import io
+import json
+from datetime import timezone as dt_timezone
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from api.cache import list_response_cache, status_cache
+from api.models import Task, TaskArchive
+
+FIELDS = ('external_id', 'name', 'content', 'status', 'created_at')
+
+# Each chunk is COPYed into a temporary table, deduplicated on external_id
+# (the last occurrence wins) and upserted in one statement. Rows without an
+# external_id never conflict and are always inserted. Unchanged rows are
+# left alone so they keep their updated_at. Rows whose external_id belongs
+# to an archived task are skipped and counted, since inserting them would
+# bring the task back as a second, active copy.
+STAGING_SQL = """
+CREATE TEMPORARY TABLE task_import (
+    line bigint NOT NULL,
+    external_id varchar(100),
+    name varchar(200) NOT NULL,
+    content text NOT NULL,
+    status_id bigint NOT NULL,
+    created_at timestamptz
+) ON COMMIT DROP
+"""
+
+UPSERT_SQL = """
+WITH rows AS (
+    SELECT DISTINCT ON (external_id, CASE WHEN external_id IS NULL THEN line END)
+        external_id, name, content, status_id, created_at
+    FROM task_import
+    ORDER BY external_id, CASE WHEN external_id IS NULL THEN line END, line DESC
+), archived AS (
+    SELECT DISTINCT task_import.external_id
+    FROM task_import JOIN {archive} ON {archive}.{archive_external_id} = task_import.external_id
+), upserted AS (
+    INSERT INTO {task} ({external_id}, {name}, {content}, {status}, {created_at}, {updated_at})
+    SELECT external_id, name, content, status_id, coalesce(created_at, now()), now()
+    FROM rows
+    WHERE external_id IS NULL OR external_id NOT IN (SELECT external_id FROM archived)
+    ON CONFLICT ({external_id}) DO UPDATE SET
+        {name} = EXCLUDED.{name},
+        {content} = EXCLUDED.{content},
+        {status} = EXCLUDED.{status},
+        {updated_at} = EXCLUDED.{updated_at}
+    WHERE ({task}.{name}, {task}.{content}, {task}.{status})
+        IS DISTINCT FROM (EXCLUDED.{name}, EXCLUDED.{content}, EXCLUDED.{status})
+    RETURNING xmax = 0 AS inserted
+)
+SELECT
+    (SELECT count(*) FILTER (WHERE inserted) FROM upserted),
+    (SELECT count(*) FILTER (WHERE NOT inserted) FROM upserted),
+    (SELECT count(*) FROM task_import WHERE external_id IN (SELECT external_id FROM archived))
+"""
+
+
+class TaskImportError(Exception):
+    """
+    Raised for an input row that cannot be imported.
+    """
+
+    def __init__(self, line, message):
+        super().__init__(f'line {line}: {message}')
+        self.line = line
+
+
+def read_csv(file):
+    """
+    Yield (line, row) for each record of a CSV file with a header row.
+    """
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_ndjson(file):
+    """
+    Yield (line, row) for each JSON object of a newline-delimited JSON file.
+    """
+    for line, text in enumerate(file, 1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError as exc:
+            raise TaskImportError(line, f'invalid JSON ({exc})')
+        if not isinstance(row, dict):
+            raise TaskImportError(line, 'expected a JSON object')
+        yield line, row
+
+
+READERS = {
+    'csv': read_csv,
+    'ndjson': read_ndjson,
+}
+
+
+class TaskImporter:
+    """
+    Loads task records into the task table with COPY, batch_size rows per
+    transaction, upserting on external_id.
+    Status names are resolved against one in-memory map built from the
+    status cache. Only the current chunk is held in memory, so input of
+    any size is imported in constant memory. Invalid rows abort the import
+    unless skip_invalid is set, in which case they are counted and skipped;
+    chunks loaded before an error stay committed. Rows of archived tasks
+    are counted and left alone.
+    """
+
+    def __init__(self, batch_size=50000, skip_invalid=False):
+        self.batch_size = batch_size
+        self.skip_invalid = skip_invalid
+        self.statuses = {status.name.casefold(): status.pk for status in status_cache.all()}
+        self.result = {'rows': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'archived': 0, 'skipped': 0}
+
+    def run(self, records, progress=None):
+        """
+        Import (line, row) records and return the counts of rows read,
+        inserted, updated, unchanged, archived and skipped.
+        """
+        chunk = []
+        try:
+            for line, row in records:
+                self.result['rows'] += 1
+                try:
+                    chunk.append(self.clean(line, row))
+                except TaskImportError:
+                    if not self.skip_invalid:
+                        raise
+                    self.result['skipped'] += 1
+                    continue
+                if len(chunk) >= self.batch_size:
+                    self.load(chunk)
+                    chunk = []
+                    if progress is not None:
+                        progress(self.result)
+            if chunk:
+                self.load(chunk)
+                if progress is not None:
+                    progress(self.result)
+        finally:
+            if self.result['inserted'] or self.result['updated']:
+                list_response_cache.invalidate(Task)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(Task._meta.db_table)}')
+        return self.result
+
+    def clean(self, line, row):
+        """
+        Validate one record and return it as a staging row.
+        """
+        unknown = set(row) - set(FIELDS)
+        if unknown:
+            raise TaskImportError(line, f'unknown fields: {", ".join(sorted(map(str, unknown)))}')
+
+        name = (row.get('name') or '').strip()
+        if not name:
+            raise TaskImportError(line, 'name is required')
+        if len(name) > Task._meta.get_field('name').max_length:
+            raise TaskImportError(line, 'name is too long')
+
+        status_name = str(row.get('status') or '').strip()
+        status_id = self.statuses.get(status_name.casefold())
+        if status_id is None:
+            raise TaskImportError(line, f'unknown status "{status_name}"')
+
+        external_id = row.get('external_id')
+        external_id = str(external_id).strip() if external_id not in (None, '') else None
+        if external_id and len(external_id) > Task._meta.get_field('external_id').max_length:
+            raise TaskImportError(line, 'external_id is too long')
+
+        created_at = row.get('created_at') or None
+        if created_at is not None:
+            try:
+                created_at = parse_datetime(str(created_at))
+            except ValueError:
+                created_at = None
+            if created_at is None:
+                raise TaskImportError(line, 'created_at is not a valid datetime')
+            if timezone.is_naive(created_at):
+                created_at = timezone.make_aware(created_at, dt_timezone.utc)
+            created_at = created_at.isoformat()
+
+        return line, external_id, name, str(row.get('content') or ''), status_id, created_at
+
+    def load(self, chunk):
+        """
+        COPY one chunk into the staging table and upsert it.
+        """
+        # None is written as "", which FORCE_NULL reads back as NULL in the
+        # nullable columns; empty contents stay empty strings
+        buffer = io.StringIO()
+        csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC).writerows(chunk)
+        buffer.seek(0)
+
+        quote = connection.ops.quote_name
+        opts = Task._meta
+        sql = UPSERT_SQL.format(
+            task=quote(opts.db_table),
+            archive=quote(TaskArchive._meta.db_table),
+            archive_external_id=quote(TaskArchive._meta.get_field('external_id').column),
+            **{name: quote(opts.get_field(name).column) for name in (*FIELDS, 'updated_at')},
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(STAGING_SQL)
+            cursor.copy_expert('COPY task_import FROM STDIN WITH (FORMAT csv, FORCE_NULL (external_id, created_at))', buffer)
+            cursor.execute(sql)
+            inserted, updated, archived = cursor.fetchone()
+            # ON COMMIT DROP does not fire when called inside an outer transaction
+            cursor.execute('DROP TABLE task_import')
+
+        self.result['inserted'] += inserted
+        self.result['updated'] += updated
+        self.result['archived'] += archived
+        self.result['unchanged'] += len(chunk) - inserted - updated - archived
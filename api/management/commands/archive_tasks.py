@@ -0,0 +1,108 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from api.cache import list_response_cache, status_cache
+from api.models import Task, TaskArchive
+
+
+class Command(BaseCommand):
+    help = (
+        'Move old tasks in a finished status (default: Completado) from task to '
+        'task_archive in small batches, each in its own short transaction'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=90,
+            help='Archive tasks created and last updated more than this many days ago (default: 90)'
+        )
+        parser.add_argument(
+            '--before',
+            help='Archive tasks created and last updated before this ISO datetime (overrides --days)'
+        )
+        parser.add_argument(
+            '--status',
+            action='append',
+            dest='statuses',
+            help='Status name to archive; repeat for several (default: Completado)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Tasks moved per transaction (default: 1000)'
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.05,
+            help='Seconds to sleep between batches (default: 0.05)'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='Stop after moving this many tasks'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the tasks that would be archived'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be >= 1')
+        cutoff = self.get_cutoff(options)
+
+        status_ids = []
+        for name in options['statuses'] or ['Completado']:
+            status = status_cache.get_by_name(name)
+            if status is None:
+                raise CommandError(f'Status "{name}" not found')
+            status_ids.append(status.pk)
+
+        if options['dry_run']:
+            count = Task.objects.filter(status__in=status_ids, created_at__lt=cutoff, updated_at__lt=cutoff).count()
+            self.stdout.write(f'{count} task(s) would be archived (cutoff {cutoff.isoformat()})')
+            return
+
+        moved = 0
+        start = time.perf_counter()
+        try:
+            while options['limit'] is None or moved < options['limit']:
+                batch_size = options['batch_size']
+                if options['limit'] is not None:
+                    batch_size = min(batch_size, options['limit'] - moved)
+                count = TaskArchive.objects.archive_batch(status_ids, cutoff, batch_size)
+                moved += count
+                if count:
+                    self.stdout.write(f'  {moved} task(s) archived')
+                if count < batch_size:
+                    break
+                time.sleep(options['pause'])
+        finally:
+            # Raw statements send no signals
+            if moved:
+                list_response_cache.invalidate(Task)
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {moved} task(s) older than {cutoff.isoformat()} in {elapsed:.1f}s'
+        ))
+
+    def get_cutoff(self, options):
+        if not options['before']:
+            return timezone.now() - timedelta(days=options['days'])
+        try:
+            cutoff = parse_datetime(options['before'])
+        except ValueError:
+            cutoff = None
+        if cutoff is None:
+            raise CommandError('--before must be an ISO datetime, e.g. 2026-01-01T00:00:00Z')
+        if timezone.is_naive(cutoff):
+            cutoff = timezone.make_aware(cutoff)
+        return cutoff
@@ -0,0 +1,98 @@
+import io
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from api.models import Status, Task
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+from api.serializers.task import TaskSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare FastJSONRenderer/FastJSONParser against DRF\'s JSONRenderer/JSONParser '
+        'on task list payloads of increasing size'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[1000, 10000, 100000],
+            help='Number of tasks per payload (default: 1000 10000 100000)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per measurement; the best one is reported (default: 5)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'{"payload":<22}{"tasks":>8}{"drf ms":>10}{"fast ms":>10}{"speedup":>9}')
+
+        for size in options['sizes']:
+            payloads = self.build_payloads(size)
+            for label, data in payloads.items():
+                self.compare(f'render {label}', size, options['repeat'],
+                             lambda: JSONRenderer().render(data),
+                             lambda: FastJSONRenderer().render(data))
+
+            body = JSONRenderer().render(payloads['serialized'])
+            self.compare('parse', size, options['repeat'],
+                         lambda: JSONParser().parse(io.BytesIO(body)),
+                         lambda: FastJSONParser().parse(io.BytesIO(body)))
+
+    def build_payloads(self, size):
+        """
+        Build in-memory task pages shaped like the list responses: the
+        regular serializer output and the ?compact=true .values() rows.
+        """
+        status = Status(id=1, name='Por Hacer', hexa_color='#6B7280')
+        created = timezone.now()
+        tasks = [
+            Task(
+                id=n,
+                name=f'Task {n}',
+                content=f'Contenido de la tarea número {n} ' * 4,
+                status=status,
+                created_at=created - timedelta(seconds=n),
+                updated_at=created,
+            )
+            for n in range(1, size + 1)
+        ]
+        rows = [
+            {
+                'id': task.id,
+                'name': task.name,
+                'content': task.content,
+                'status': status.id,
+                'status_name': status.name,
+                'status_color': status.hexa_color,
+                'created_at': task.created_at,
+                'updated_at': task.updated_at,
+            }
+            for task in tasks
+        ]
+        return {
+            'serialized': {'next': None, 'previous': None, 'results': TaskSerializer(tasks, many=True).data},
+            'compact': {'next': None, 'previous': None, 'results': rows},
+        }
+
+    def compare(self, label, size, repeat, baseline, candidate):
+        drf = self.best_of(baseline, repeat)
+        fast = self.best_of(candidate, repeat)
+        self.stdout.write(f'{label:<22}{size:>8}{drf * 1000:>10.1f}{fast * 1000:>10.1f}{drf / fast:>8.1f}x')
+
+    @staticmethod
+    def best_of(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
@@ -0,0 +1,64 @@
+import time
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.views import TokenObtainPairView
+from api.authentication import last_login_recorder
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure token issuance (POST /api/auth/token/) in tokens per second for each '
+        'password hasher, with synchronous and batched last_login writes'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hashers',
+            nargs='+',
+            choices=sorted(settings.PASSWORD_HASHER_CLASSES),
+            default=sorted(settings.PASSWORD_HASHER_CLASSES, reverse=True),
+            help='Hashers to measure (default: pbkdf2 argon2)'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=20,
+            help='Token requests per measurement (default: 20)'
+        )
+
+    def handle(self, *args, **options):
+        view = TokenObtainPairView.as_view()
+        factory = APIRequestFactory()
+        self.stdout.write(f'{"hasher":<10}{"last_login":<12}{"tokens/s":>10}{"ms/token":>10}')
+
+        for name in options['hashers']:
+            hashers = [settings.PASSWORD_HASHER_CLASSES[name], *settings.PASSWORD_HASHERS]
+            for label, interval in (('sync', 0), ('batched', 3600)):
+                with override_settings(PASSWORD_HASHERS=hashers, LAST_LOGIN_FLUSH_INTERVAL=interval):
+                    elapsed = self.measure(view, factory, options['requests'])
+                rate = options['requests'] / elapsed
+                self.stdout.write(f'{name:<10}{label:<12}{rate:>10.1f}{elapsed * 1000 / options["requests"]:>10.1f}')
+
+    def measure(self, view, factory, requests):
+        """
+        Issue tokens for a throwaway user and return the elapsed seconds.
+        Everything is rolled back afterwards.
+        """
+        with transaction.atomic():
+            User.objects.create_user(username='benchmark-tokens', password='benchmark-password')
+            body = {'username': 'benchmark-tokens', 'password': 'benchmark-password'}
+
+            start = time.perf_counter()
+            for _ in range(requests):
+                response = view(factory.post('/api/auth/token/', body, format='json'))
+                if response.status_code != 200:
+                    raise RuntimeError(f'Token request failed: {response.status_code}')
+            elapsed = time.perf_counter() - start
+
+            last_login_recorder.flush()
+            transaction.set_rollback(True)
+        return elapsed
@@ -0,0 +1,154 @@
+import itertools
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.test import APIRequestFactory
+from api.models import Status, Task
+from api.views.task import TaskViewSet
+
+
+class Rollback(Exception):
+    """Raised to discard the seeded rows once the plans are collected."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Run EXPLAIN on every filter/ordering combination exposed by TaskViewSet '
+        'and fail if any of them falls back to a sequential scan on the task table'
+    )
+
+    # Filter values used for each filterset field combination
+    FILTERS = {
+        'status': lambda status_id: {'status': status_id},
+        'created_at': lambda status_id: {'created_at__gte': '2025-01-01T00:00:00Z', 'created_at__lte': '2025-01-31T00:00:00Z'},
+        'search': lambda status_id: {'search': 'Task 12345'},
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=200000,
+            help='Number of tasks to seed before explaining (default: 200000)'
+        )
+        parser.add_argument(
+            '--no-seed',
+            action='store_true',
+            help='Explain against the existing data instead of seeding'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                if not options['no_seed']:
+                    self.seed(options['rows'])
+                failures = self.explain_all()
+                # Never keep the seeded rows
+                raise Rollback
+        except Rollback:
+            pass
+
+        if failures:
+            raise CommandError(f'{len(failures)} query shape(s) use a sequential scan on task: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('✓ Every query shape uses an index on task'))
+
+    def seed(self, rows):
+        """
+        Insert synthetic tasks with one set-based statement and refresh
+        planner statistics.
+        """
+        self.stdout.write(f'Seeding {rows} tasks...')
+        if not Status.objects.exists():
+            Status.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        status_ids = list(Status.objects.values_list('id', flat=True))
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO task (name, content, status_id, created_at, updated_at)
+                SELECT
+                    'Task ' || n,
+                    repeat('content ', 20),
+                    (%s::bigint[])[1 + n %% array_length(%s::bigint[], 1)],
+                    ts,
+                    ts + random() * interval '30 days'
+                FROM (
+                    SELECT n, timestamptz '2024-01-01' + random() * interval '730 days' AS ts
+                    FROM generate_series(1, %s) AS n
+                ) AS seed
+                """,
+                [status_ids, status_ids, rows]
+            )
+            cursor.execute('ANALYZE task')
+
+    def explain_all(self):
+        """
+        Explain the list query for every filter combination and ordering.
+        """
+        factory = APIRequestFactory()
+        status_id = Status.objects.values_list('id', flat=True).first()
+        orderings = [
+            prefix + field
+            for field in TaskViewSet.ordering_fields
+            for prefix in ('', '-')
+        ]
+
+        # Search also matches substrings, which only the pg_trgm indexes
+        # serve: without them every search scans the table
+        trigram_indexed = self.has_trigram_indexes()
+        if not trigram_indexed:
+            self.stdout.write(self.style.WARNING('pg_trgm indexes missing: skipping search shapes'))
+
+        failures = []
+        for size in range(len(self.FILTERS) + 1):
+            for filter_names in itertools.combinations(self.FILTERS, size):
+                if 'search' in filter_names and not trigram_indexed:
+                    continue
+                params = {}
+                for name in filter_names:
+                    params.update(self.FILTERS[name](status_id))
+
+                for ordering in orderings:
+                    label = '&'.join([*filter_names, f'ordering={ordering}'])
+                    scans = self.explain(factory, {**params, 'ordering': ordering})
+                    if 'Seq Scan' in scans:
+                        failures.append(label)
+                        self.stdout.write(self.style.ERROR(f'✗ {label}: {", ".join(scans)}'))
+                    else:
+                        self.stdout.write(self.style.SUCCESS(f'✓ {label}: {", ".join(scans)}'))
+        return failures
+
+    def has_trigram_indexes(self):
+        """
+        Return whether the trigram indexes of migration 0006 exist.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_indexes WHERE tablename = %s AND indexname IN %s",
+                [Task._meta.db_table, ('task_name_trgm_idx', 'task_content_trgm_idx')],
+            )
+            return cursor.fetchone()[0] == 2
+
+    def explain(self, factory, params):
+        """
+        Build the first-page list query exactly as TaskViewSet does and
+        return the scan node types used on the task table.
+        """
+        view = TaskViewSet(action_map={'get': 'list'}, format_kwarg=None, args=(), kwargs={})
+        request = view.initialize_request(factory.get('/api/tasks/', params))
+        view.request = request
+
+        queryset = view.filter_queryset(view.get_queryset())
+        paginator = view.paginator
+        ordering = paginator.get_ordering(request, queryset, view)
+        queryset = queryset.order_by(*ordering)[:paginator.get_page_size(request) + 1]
+
+        plan = json.loads(queryset.explain(format='json'))
+        return sorted(set(self._task_scans(plan[0]['Plan'])))
+
+    def _task_scans(self, node):
+        if node.get('Relation Name') == Task._meta.db_table:
+            index = node.get('Index Name')
+            yield f"{node['Node Type']} ({index})" if index else node['Node Type']
+        for child in node.get('Plans', []):
+            yield from self._task_scans(child)
@@ -0,0 +1,85 @@
+import sys
+import time
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from api.imports import READERS, TaskImporter, TaskImportError
+
+
+class Command(BaseCommand):
+    help = (
+        'Import tasks from a CSV or NDJSON file (or stdin) with COPY, upserting on '
+        'external_id. Fields: external_id, name, content, status (name), created_at'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='File to import, or - to read from stdin'
+        )
+        parser.add_argument(
+            '--format',
+            choices=sorted(READERS),
+            help='Input format (default: from the file extension, csv for stdin)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=50000,
+            help='Rows per COPY transaction (default: 50000)'
+        )
+        parser.add_argument(
+            '--skip-invalid',
+            action='store_true',
+            help='Skip invalid rows instead of stopping at the first one'
+        )
+        parser.add_argument(
+            '--encoding',
+            default='utf-8',
+            help='Input encoding (default: utf-8)'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be >= 1')
+        path = options['path']
+        file_format = options['format'] or self.guess_format(path)
+        importer = TaskImporter(batch_size=options['batch_size'], skip_invalid=options['skip_invalid'])
+
+        start = time.perf_counter()
+        if path == '-':
+            stream = open(sys.stdin.fileno(), encoding=options['encoding'], newline='', closefd=False)
+        else:
+            try:
+                stream = open(path, encoding=options['encoding'], newline='')
+            except OSError as exc:
+                raise CommandError(f'Could not open {path}: {exc.strerror}')
+
+        with stream:
+            try:
+                result = importer.run(READERS[file_format](stream), progress=self.write_progress)
+            except TaskImportError as exc:
+                raise CommandError(f'{exc} ({self.summary(importer.result)} before the error)')
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {path} in {elapsed:.1f}s ({result["rows"] / elapsed if elapsed else 0:.0f} rows/s): '
+            f'{self.summary(result)}'
+        ))
+
+    def guess_format(self, path):
+        suffix = Path(path).suffix.lower().lstrip('.')
+        if path == '-' or suffix == 'csv':
+            return 'csv'
+        if suffix in ('ndjson', 'jsonl'):
+            return 'ndjson'
+        raise CommandError(f'Cannot tell the format of {path}; use --format')
+
+    def write_progress(self, result):
+        self.stdout.write(f'  {result["rows"]} rows read')
+
+    @staticmethod
+    def summary(result):
+        return (
+            f'{result["inserted"]} inserted, {result["updated"]} updated, '
+            f'{result["unchanged"]} unchanged, {result["archived"]} archived, {result["skipped"]} skipped'
+        )
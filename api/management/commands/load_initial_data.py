@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
-from api.models import Status, Task
+from api.cache import list_response_cache, status_cache
+from api.models import Status, Task, TaskArchive
 
 
 class Command(BaseCommand):
@@ -16,17 +17,16 @@ class Command(BaseCommand):
             {'name': 'Bloqueado', 'hexa_color': '#EF4444'},
         ]
 
-        statuses = {}
-        for status_info in status_data:
-            status, created = Status.objects.get_or_create(
-                name=status_info['name'],
-                defaults={'hexa_color': status_info['hexa_color']}
-            )
-            statuses[status_info['name']] = status
-            if created:
-                self.stdout.write(self.style.SUCCESS(f'✓ Status created: {status.name}'))
-            else:
-                self.stdout.write(self.style.WARNING(f'- Status already exists: {status.name}'))
+        # Insert missing statuses in one statement; the unique name skips the rest
+        Status.objects.bulk_create(
+            [Status(**status_info) for status_info in status_data],
+            ignore_conflicts=True,
+        )
+        statuses = {
+            status.name: status
+            for status in Status.objects.filter(name__in=[status_info['name'] for status_info in status_data])
+        }
+        self.stdout.write(self.style.SUCCESS(f'✓ Statuses ready: {", ".join(sorted(statuses))}'))
 
         # Create Task records
         task_data = [
@@ -42,24 +42,40 @@ class Command(BaseCommand):
             {'name': 'Agregar validación de datos', 'content': 'Implementar validación de entrada de datos en el formulario de registro', 'status': 'Por Hacer'},
         ]
 
-        tasks_created = 0
-        tasks_existing = 0
-
-        for task_info in task_data:
-            status = statuses[task_info['status']]
-            task, created = Task.objects.get_or_create(
+        # Each task gets a stable external_id, so bulk_create skips the ones a
+        # previous run inserted. Tasks loaded by name before external_id
+        # existed are skipped too, as get_or_create used to, and so are
+        # tasks archive_tasks has moved out of the task table.
+        archived_ids = set(
+            TaskArchive.objects.filter(
+                external_id__in=[f'initial-{index}' for index in range(1, len(task_data) + 1)],
+            ).values_list('external_id', flat=True)
+        )
+        existing_names = set(
+            Task.objects.filter(
+                external_id__isnull=True,
+                name__in=[task_info['name'] for task_info in task_data],
+            ).values_list('name', flat=True)
+        )
+        tasks = [
+            Task(
+                external_id=f'initial-{index}',
                 name=task_info['name'],
-                defaults={
-                    'content': task_info['content'],
-                    'status': status
-                }
+                content=task_info['content'],
+                status=statuses[task_info['status']],
             )
-            if created:
-                tasks_created += 1
-                self.stdout.write(self.style.SUCCESS(f'✓ Task created: {task.name}'))
-            else:
-                tasks_existing += 1
-                self.stdout.write(self.style.WARNING(f'- Task already exists: {task.name}'))
+            for index, task_info in enumerate(task_data, 1)
+            if task_info['name'] not in existing_names and f'initial-{index}' not in archived_ids
+        ]
+        external_ids = [task.external_id for task in tasks]
+        tasks_before = Task.objects.filter(external_id__in=external_ids).count()
+        Task.objects.bulk_create(tasks, ignore_conflicts=True)
+        tasks_created = Task.objects.filter(external_id__in=external_ids).count() - tasks_before
+        tasks_existing = len(task_data) - tasks_created
+
+        # bulk_create sends no signals
+        status_cache.invalidate()
+        list_response_cache.invalidate(Status, Task)
 
         self.stdout.write(self.style.SUCCESS(f'\n=== Summary ==='))
         self.stdout.write(self.style.SUCCESS(f'Statuses: {len(statuses)} total'))
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from urllib.parse import urlsplit
+from django.core.management.base import BaseCommand, CommandError
+from api.benchmarks import HTTPError, LoadGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        'Send concurrent keep-alive GET requests to a running server and report '
+        'throughput and latency percentiles, to compare serving modes'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            default='http://127.0.0.1:8000',
+            help='Base URL of the server under test (default: http://127.0.0.1:8000)'
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help='Path to request; repeat to rotate between paths (default: /api/tasks/)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=32,
+            help='Number of concurrent connections (default: 32)'
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=10,
+            help='Seconds to run (default: 10)'
+        )
+        parser.add_argument(
+            '--username',
+            help='Obtain a JWT for this user and send it with every request'
+        )
+        parser.add_argument(
+            '--password',
+            help='Password for --username'
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the results as JSON'
+        )
+
+    def handle(self, *args, **options):
+        url = urlsplit(options['url'])
+        if url.scheme != 'http' or not url.hostname:
+            raise CommandError('--url must be an http:// URL')
+        generator = LoadGenerator(url.hostname, url.port or 80)
+        paths = options['paths'] or ['/api/tasks/']
+
+        headers = {'Host': url.netloc, 'Accept': 'application/json', 'Connection': 'keep-alive'}
+        if options['username']:
+            try:
+                token = asyncio.run(generator.obtain_token(options['username'], options['password']))
+            except HTTPError as exc:
+                raise CommandError(str(exc))
+            headers['Authorization'] = f'Bearer {token}'
+
+        results = asyncio.run(generator.run(
+            lambda n: ('GET', paths[n % len(paths)], b''),
+            headers, options['concurrency'], options['duration'],
+        ))
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+        self.stdout.write(
+            f'{results["requests"]} requests in {results["duration"]:.1f}s '
+            f'({results["throughput"]:.1f} req/s), {results["errors"]} errors'
+        )
+        self.stdout.write('status codes: ' + ', '.join(f'{k}: {v}' for k, v in results['status_codes'].items()))
+        self.stdout.write('latency ms: ' + ', '.join(f'{k} {v:.1f}' for k, v in results['latency_ms'].items()))
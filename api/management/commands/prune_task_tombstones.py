@@ -0,0 +1,19 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from api.models import TaskTombstone
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete tombstones of removed tasks older than TASK_CHANGES_RETENTION_DAYS '
+        'plus one day; change feed cursors that old are already rejected'
+    )
+
+    def handle(self, *args, **options):
+        # The extra day covers transactions that were still open when the
+        # oldest valid cursor was handed out
+        cutoff = timezone.now() - timedelta(days=settings.TASK_CHANGES_RETENTION_DAYS + 1)
+        deleted, _ = TaskTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} tombstone(s) older than {cutoff.isoformat()}'))
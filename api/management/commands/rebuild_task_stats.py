@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from api.models import TaskDailyCount
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the task_daily_count summary table behind /api/tasks/stats/ from the task table'
+
+    def handle(self, *args, **options):
+        TaskDailyCount.objects.rebuild()
+        total = sum(TaskDailyCount.objects.values_list('count', flat=True))
+        buckets = TaskDailyCount.objects.count()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {buckets} counter(s) covering {total} task(s)'))
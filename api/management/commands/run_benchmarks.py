@@ -0,0 +1,122 @@
+import json
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from api.benchmarks import (
+    SCENARIOS, BenchmarkContext, HTTPError, InProcessRunner, LiveRunner, compare, run_scenarios,
+)
+from api.benchmarks.seed import BENCHMARK_PASSWORD, BENCHMARK_USERNAME
+
+
+class Command(BaseCommand):
+    help = (
+        'Run the benchmark scenarios in-process (Django test client) or against a '
+        'live server and write latency percentiles and throughput as JSON'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--mode',
+            choices=['inprocess', 'live'],
+            default='inprocess',
+            help='Run through the test client or against --url (default: inprocess)'
+        )
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            dest='scenarios',
+            choices=sorted(SCENARIOS),
+            help='Scenario to run; repeat for several (default: all)'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Requests per scenario in inprocess mode (default: 200)'
+        )
+        parser.add_argument(
+            '--url',
+            default='http://127.0.0.1:8000',
+            help='Base URL of the server in live mode (default: http://127.0.0.1:8000)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=32,
+            help='Concurrent connections in live mode (default: 32)'
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=10,
+            help='Seconds per scenario in live mode (default: 10)'
+        )
+        parser.add_argument(
+            '--username',
+            default=BENCHMARK_USERNAME,
+            help=f'User the scenarios authenticate as (default: {BENCHMARK_USERNAME})'
+        )
+        parser.add_argument(
+            '--password',
+            default=BENCHMARK_PASSWORD,
+            help='Password for --username'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for sampled task ids (default: 0)'
+        )
+        parser.add_argument(
+            '--output',
+            help='Write the JSON report to this file instead of stdout'
+        )
+        parser.add_argument(
+            '--compare',
+            metavar='BASELINE',
+            help='JSON report of a previous run to compare against'
+        )
+
+    def handle(self, *args, **options):
+        context = BenchmarkContext.load(
+            seed=options['seed'], username=options['username'], password=options['password'],
+        )
+        if not context.task_ids:
+            raise CommandError('No tasks found; run seed_benchmark_data first')
+        scenarios = [SCENARIOS[name] for name in options['scenarios'] or SCENARIOS]
+
+        if options['mode'] == 'live':
+            try:
+                runner = LiveRunner(context, options['url'], options['concurrency'], options['duration'])
+            except ValueError as exc:
+                raise CommandError(f'--url: {exc}')
+        else:
+            try:
+                user = User.objects.get(username=options['username'])
+            except User.DoesNotExist:
+                raise CommandError(f'User "{options["username"]}" does not exist; run seed_benchmark_data first')
+            runner = InProcessRunner(context, user, requests=options['requests'])
+
+        try:
+            report = run_scenarios(runner, scenarios, progress=self.write_result)
+        except HTTPError as exc:
+            raise CommandError(str(exc))
+
+        if options['compare']:
+            with open(options['compare']) as baseline:
+                report['comparison'] = compare(json.load(baseline), report)
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(output + '\n')
+            self.stderr.write(f'Report written to {options["output"]}')
+        else:
+            self.stdout.write(output)
+
+    def write_result(self, scenario, result):
+        latency = result['latency_ms']
+        self.stderr.write(
+            f'{scenario.name:<15}{result["throughput"]:>10.1f} req/s'
+            f'  p50 {latency.get("p50", 0):.1f}  p95 {latency.get("p95", 0):.1f}  p99 {latency.get("p99", 0):.1f} ms'
+            f'  {result["status_codes"]}'
+        )
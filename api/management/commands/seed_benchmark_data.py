@@ -0,0 +1,57 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from api.benchmarks import copy_tasks, seed_statuses, seed_user
+from api.benchmarks.seed import BENCHMARK_USERNAME
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed statuses, generated tasks (loaded with COPY) and the benchmark user '
+        'for run_benchmarks'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tasks',
+            type=int,
+            default=10000,
+            help='Number of tasks to insert (default: 10000)'
+        )
+        parser.add_argument(
+            '--statuses',
+            type=int,
+            default=4,
+            help='Number of statuses; the first four are the default ones (default: 4)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100000,
+            help='Rows per COPY transaction (default: 100000)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed; the same seed generates the same tasks (default: 0)'
+        )
+
+    def handle(self, *args, **options):
+        if options['tasks'] < 0 or options['statuses'] < 1 or options['batch_size'] < 1:
+            raise CommandError('--tasks must be >= 0, --statuses and --batch-size >= 1')
+
+        statuses = seed_statuses(options['statuses'])
+        seed_user()
+        self.stdout.write(f'{len(statuses)} statuses, user "{BENCHMARK_USERNAME}" ready')
+
+        start = time.perf_counter()
+        inserted = copy_tasks(
+            options['tasks'], statuses,
+            batch_size=options['batch_size'],
+            seed=options['seed'],
+            progress=lambda count: self.stdout.write(f'  {count} / {options["tasks"]} tasks'),
+        )
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'Inserted {inserted} tasks in {elapsed:.1f}s ({inserted / elapsed if elapsed else 0:.0f} rows/s)'
+        ))
@@ -0,0 +1,4 @@
+from .registry import Histogram, MetricsRegistry, RequestMetrics, metrics_registry
+from .prometheus import render_metrics
+
+__all__ = ['Histogram', 'MetricsRegistry', 'RequestMetrics', 'metrics_registry', 'render_metrics']
@@ -0,0 +1,71 @@
+from .registry import QUANTILES
+
+HISTOGRAMS = (
+    ('duration', 'api_request_duration_seconds', 'Request duration in seconds'),
+    ('db', 'api_request_db_seconds', 'Time spent running SQL queries per request, in seconds'),
+    ('serializer', 'api_request_serializer_seconds', 'Time spent serializing per request, in seconds'),
+    ('render', 'api_request_render_seconds', 'Time spent rendering the response body per request, in seconds'),
+    ('queries', 'api_request_queries', 'SQL queries per request'),
+)
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_metrics(registry, list_cache_stats=None):
+    """
+    Render the registry in the Prometheus text exposition format (0.0.4).
+    """
+    requests, routes = registry.snapshot()
+    lines = [
+        '# HELP api_requests_total Requests handled, by route, method and status code',
+        '# TYPE api_requests_total counter',
+    ]
+    for (route, method, status_code), count in sorted(requests.items()):
+        lines.append(
+            f'api_requests_total{{route="{escape(route)}",method="{method}",status="{status_code}"}} {count}'
+        )
+
+    for key, name, description in HISTOGRAMS:
+        lines += [f'# HELP {name} {description}', f'# TYPE {name} histogram']
+        for route, histograms in sorted(routes.items()):
+            histogram = histograms[key]
+            label = f'route="{escape(route)}"'
+            for bound, total in histogram.cumulative():
+                lines.append(f'{name}_bucket{{{label},le="{format_value(bound)}"}} {total}')
+            lines.append(f'{name}_sum{{{label}}} {format_value(histogram.sum)}')
+            lines.append(f'{name}_count{{{label}}} {histogram.count}')
+
+    # Quantiles estimated in-process from the duration histogram, for
+    # dashboards that do not run histogram_quantile()
+    lines += [
+        '# HELP api_request_duration_quantile_seconds Estimated request duration quantiles in seconds',
+        '# TYPE api_request_duration_quantile_seconds gauge',
+    ]
+    for route, histograms in sorted(routes.items()):
+        for q in QUANTILES:
+            value = histograms['duration'].quantile(q)
+            if value is not None:
+                lines.append(
+                    f'api_request_duration_quantile_seconds{{route="{escape(route)}",quantile="{q}"}} {value:.6f}'
+                )
+
+    if list_cache_stats:
+        lines += [
+            '# HELP api_list_cache_requests_total List response cache lookups, by list and result',
+            '# TYPE api_list_cache_requests_total counter',
+        ]
+        for cache_name, counters in sorted(list_cache_stats.items()):
+            for counter, result in (('hits', 'hit'), ('misses', 'miss')):
+                lines.append(
+                    f'api_list_cache_requests_total{{list="{escape(cache_name)}",result="{result}"}} {counters[counter]}'
+                )
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,154 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+# Upper bounds (seconds) of the duration histogram buckets
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds of the per-request query count histogram buckets
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram, as exposed by Prometheus.
+    Quantiles are estimated by linear interpolation inside the bucket that
+    holds them, like PromQL's histogram_quantile().
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        Yield (upper bound, cumulative count), ending with +Inf.
+        """
+        total = 0
+        for bound, count in zip((*self.buckets, float('inf')), self.counts):
+            total += count
+            yield bound, total
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        lower, below = 0, 0
+        for bound, total in self.cumulative():
+            if total >= rank:
+                if bound == float('inf'):
+                    return self.buckets[-1]
+                in_bucket = total - below
+                return lower + (bound - lower) * ((rank - below) / in_bucket if in_bucket else 0)
+            lower, below = bound, total
+        return self.buckets[-1]
+
+
+class RequestMetrics:
+    """
+    Timings of one request, filled in by the middleware and the view mixin.
+    """
+    __slots__ = ('start', 'queries', 'db', 'serializer', 'render')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db = 0.0
+        self.serializer = 0.0
+        self.render = 0.0
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """
+        connection.execute_wrapper() hook counting and timing every query.
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - start
+            self.queries += 1
+
+    def timed(self, attribute, func):
+        """
+        Wrap func so its run time is added to the given timing.
+        """
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                setattr(self, attribute, getattr(self, attribute) + time.perf_counter() - start)
+        return wrapper
+
+    def server_timing(self, total):
+        """
+        Return the Server-Timing header value (milliseconds).
+        """
+        return (
+            f'db;dur={self.db * 1000:.2f};desc="{self.queries} queries", '
+            f'serializer;dur={self.serializer * 1000:.2f}, '
+            f'render;dur={self.render * 1000:.2f}, '
+            f'total;dur={total * 1000:.2f}'
+        )
+
+
+class MetricsRegistry:
+    """
+    In-process request metrics per route name.
+    Each worker process keeps its own registry; Prometheus sums them when
+    every worker is scraped, or reports the one that answered otherwise.
+    """
+    timings = ('duration', 'db', 'serializer', 'render')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+        self._requests = defaultdict(int)
+
+    def observe(self, route, method, status_code, metrics, total):
+        with self._lock:
+            histograms = self._routes.get(route)
+            if histograms is None:
+                histograms = self._routes[route] = {
+                    **{name: Histogram(DURATION_BUCKETS) for name in self.timings},
+                    'queries': Histogram(QUERY_BUCKETS),
+                }
+            histograms['duration'].observe(total)
+            histograms['db'].observe(metrics.db)
+            histograms['serializer'].observe(metrics.serializer)
+            histograms['render'].observe(metrics.render)
+            histograms['queries'].observe(metrics.queries)
+            self._requests[(route, method, status_code)] += 1
+
+    def snapshot(self):
+        """
+        Return a copy of the request counters and histograms.
+        """
+        with self._lock:
+            routes = {}
+            for route, histograms in self._routes.items():
+                routes[route] = {}
+                for name, histogram in histograms.items():
+                    copy = Histogram(histogram.buckets)
+                    copy.counts, copy.sum, copy.count = list(histogram.counts), histogram.sum, histogram.count
+                    routes[route][name] = copy
+            return dict(self._requests), routes
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+            self._requests.clear()
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,3 @@
+from .metrics import RequestMetricsMiddleware
+
+__all__ = ['RequestMetricsMiddleware']
@@ -0,0 +1,60 @@
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connection
+from api.metrics import RequestMetrics, metrics_registry
+
+
+class RequestMetricsMiddleware:
+    """
+    Records per-request SQL query count, database time, serializer time
+    and render time, sends them as a Server-Timing header and adds them to
+    the in-process histograms of the request's route name.
+    Serializer time is filled in by views using RequestMetricsMixin.
+    Async requests record only their total duration: their queries run in
+    other threads, outside this thread's connection wrapper.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.REQUEST_METRICS_ENABLED:
+            return self.get_response(request)
+
+        request.metrics = metrics = RequestMetrics()
+        with connection.execute_wrapper(metrics.execute_wrapper):
+            response = self.get_response(request)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        if not settings.REQUEST_METRICS_ENABLED:
+            return await self.get_response(request)
+
+        request.metrics = metrics = RequestMetrics()
+        response = await self.get_response(request)
+        return self.finish(request, response, metrics)
+
+    def process_template_response(self, request, response):
+        """
+        Time the rendering of DRF responses, which happens after the view
+        returns.
+        """
+        metrics = getattr(request, 'metrics', None)
+        if metrics is not None:
+            response.render = metrics.timed('render', response.render)
+        return response
+
+    def finish(self, request, response, metrics):
+        total = time.perf_counter() - metrics.start
+        match = request.resolver_match
+        route = match.url_name if match is not None and match.url_name else 'unmatched'
+        metrics_registry.observe(route, request.method, response.status_code, metrics, total)
+        response['Server-Timing'] = metrics.server_timing(total)
+        return response
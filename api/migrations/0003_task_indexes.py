@@ -0,0 +1,32 @@
+# Generated by Django 4.2.26 on 2026-10-18 17:14
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently so the task table stays writable
+    atomic = False
+
+    dependencies = [
+        ('api', '0002_task'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='task_status_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['-created_at', '-id'], name='task_created_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['updated_at', 'id'], name='task_updated_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['name', 'id'], name='task_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.26 on 2026-10-18 17:17
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE FUNCTION task_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, content, search_vector ON task
+    FOR EACH ROW EXECUTE FUNCTION task_search_vector_update();
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS task_search_vector_trigger ON task;
+DROP FUNCTION IF EXISTS task_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_task_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text index of name and content, maintained by a database trigger', null=True),
+        ),
+        # Existing rows are filled by 0005 and indexed by 0006, outside
+        # this transaction
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+    ]
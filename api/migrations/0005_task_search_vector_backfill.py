@@ -0,0 +1,39 @@
+from django.db import migrations
+
+BATCH_SIZE = 10000
+
+# The trigger of 0004 fills search_vector for rows written since; older
+# rows are filled here
+BACKFILL_SQL = """
+UPDATE task SET search_vector =
+    setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(content, '')), 'B')
+WHERE id >= %s AND id < %s AND search_vector IS NULL
+"""
+
+
+def backfill_search_vector(apps, schema_editor):
+    """
+    Fill search_vector BATCH_SIZE ids at a time. Each statement commits on
+    its own, so rows are only locked for the length of one batch.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('SELECT min(id), max(id) FROM task')
+        low, high = cursor.fetchone()
+        if low is None:
+            return
+        for start in range(low, high + 1, BATCH_SIZE):
+            cursor.execute(BACKFILL_SQL, [start, start + BATCH_SIZE])
+
+
+class Migration(migrations.Migration):
+    # Batches are committed one by one instead of in one long transaction
+    atomic = False
+
+    dependencies = [
+        ('api', '0004_task_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Index name and content for substring (ILIKE) search when pg_trgm is
+    available on the server. Search still works without it, unindexed.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS task_name_trgm_idx ON task USING gin (name gin_trgm_ops)')
+        cursor.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS task_content_trgm_idx ON task USING gin (content gin_trgm_ops)')
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('DROP INDEX CONCURRENTLY IF EXISTS task_name_trgm_idx')
+        cursor.execute('DROP INDEX CONCURRENTLY IF EXISTS task_content_trgm_idx')
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently so the task table stays writable
+    atomic = False
+
+    dependencies = [
+        ('api', '0005_task_search_vector_backfill'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='task_search_vector_idx'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 4.2.26 on 2026-10-18 17:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Statement-level triggers read the changed rows from transition tables and
+# apply one aggregated upsert per statement, so a 100k-row bulk write costs
+# one upsert per (status, day) touched rather than one per row. Deltas are
+# applied in key order to keep concurrent writers from deadlocking.
+TASK_DAILY_COUNT_TRIGGERS = """
+CREATE FUNCTION task_daily_count_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_daily_count (status_id, day, count)
+        SELECT status_id, (created_at AT TIME ZONE 'UTC')::date, count(*)
+        FROM new_rows GROUP BY 1, 2 ORDER BY 1, 2
+        ON CONFLICT (status_id, day) DO UPDATE SET count = task_daily_count.count + EXCLUDED.count;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE task_daily_count SET count = task_daily_count.count - changes.count
+        FROM (
+            SELECT status_id, (created_at AT TIME ZONE 'UTC')::date AS day, count(*) AS count
+            FROM old_rows GROUP BY 1, 2
+        ) changes
+        WHERE task_daily_count.status_id = changes.status_id AND task_daily_count.day = changes.day;
+    ELSE
+        INSERT INTO task_daily_count (status_id, day, count)
+        SELECT status_id, day, sum(delta)
+        FROM (
+            SELECT status_id, (created_at AT TIME ZONE 'UTC')::date AS day, -1 AS delta FROM old_rows
+            UNION ALL
+            SELECT status_id, (created_at AT TIME ZONE 'UTC')::date AS day, 1 AS delta FROM new_rows
+        ) changes
+        GROUP BY 1, 2 HAVING sum(delta) <> 0 ORDER BY 1, 2
+        ON CONFLICT (status_id, day) DO UPDATE SET count = task_daily_count.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_daily_count_insert AFTER INSERT ON task
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION task_daily_count_update();
+
+CREATE TRIGGER task_daily_count_update AFTER UPDATE ON task
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION task_daily_count_update();
+
+CREATE TRIGGER task_daily_count_delete AFTER DELETE ON task
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION task_daily_count_update();
+
+INSERT INTO task_daily_count (status_id, day, count)
+SELECT status_id, (created_at AT TIME ZONE 'UTC')::date, count(*)
+FROM task GROUP BY 1, 2;
+"""
+
+DROP_TASK_DAILY_COUNT_TRIGGERS = """
+DROP TRIGGER IF EXISTS task_daily_count_insert ON task;
+DROP TRIGGER IF EXISTS task_daily_count_update ON task;
+DROP TRIGGER IF EXISTS task_daily_count_delete ON task;
+DROP FUNCTION IF EXISTS task_daily_count_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_task_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(help_text='Creation day of the tasks (UTC)')),
+                ('count', models.IntegerField(default=0, help_text='Number of tasks')),
+                ('status', models.ForeignKey(help_text='Task status', on_delete=django.db.models.deletion.CASCADE, related_name='daily_counts', to='api.status')),
+            ],
+            options={
+                'verbose_name': 'Task daily count',
+                'verbose_name_plural': 'Task daily counts',
+                'db_table': 'task_daily_count',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='taskdailycount',
+            constraint=models.UniqueConstraint(fields=('status', 'day'), name='task_daily_count_status_day_uniq'),
+        ),
+        migrations.RunSQL(TASK_DAILY_COUNT_TRIGGERS, DROP_TASK_DAILY_COUNT_TRIGGERS),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.26 on 2026-10-18 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_task_daily_count'),
+    ]
+
+    # Made unique by 0009, whose index is built without blocking writes
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='external_id',
+            field=models.CharField(blank=True, editable=False, help_text='Identifier in the system the task was imported from; import_tasks upserts on it', max_length=100, null=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations, models
+
+# The unique index is built concurrently and then attached as the
+# constraint Postgres would have created for unique=True, next to the
+# varchar_pattern_ops index Django adds for LIKE lookups
+CREATE_EXTERNAL_ID_INDEXES = [
+    'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS task_external_id_key ON task (external_id)',
+    'ALTER TABLE task ADD CONSTRAINT task_external_id_key UNIQUE USING INDEX task_external_id_key',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS task_external_id_ffcbd296_like ON task (external_id varchar_pattern_ops)',
+]
+
+DROP_EXTERNAL_ID_INDEXES = [
+    'DROP INDEX CONCURRENTLY IF EXISTS task_external_id_ffcbd296_like',
+    'ALTER TABLE task DROP CONSTRAINT IF EXISTS task_external_id_key',
+]
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently so the task table stays writable
+    atomic = False
+
+    dependencies = [
+        ('api', '0008_task_external_id'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(CREATE_EXTERNAL_ID_INDEXES, DROP_EXTERNAL_ID_INDEXES),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='task',
+                    name='external_id',
+                    field=models.CharField(blank=True, editable=False, help_text='Identifier in the system the task was imported from; import_tasks upserts on it', max_length=100, null=True, unique=True),
+                ),
+            ],
+        ),
+    ]
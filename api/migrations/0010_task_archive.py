@@ -0,0 +1,70 @@
+# Generated by Django 4.2.26 on 2026-10-18 18:27
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Active and archived tasks in one relation for ?include_archived=true.
+# UNION ALL lets the planner push filters, orderings and limits into both
+# tables and merge their index scans.
+TASK_WITH_ARCHIVE_VIEW = """
+CREATE VIEW task_with_archive AS
+SELECT id, name, content, status_id, external_id, created_at, updated_at, search_vector,
+    NULL::timestamp with time zone AS archived_at
+FROM task
+UNION ALL
+SELECT id, name, content, status_id, external_id, created_at, updated_at, search_vector, archived_at
+FROM task_archive;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_task_external_id_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskWithArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=200)),
+                ('content', models.TextField()),
+                ('external_id', models.CharField(max_length=100, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('archived_at', models.DateTimeField(null=True)),
+            ],
+            options={
+                'db_table': 'task_with_archive',
+                'ordering': ['-created_at'],
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=200)),
+                ('content', models.TextField()),
+                ('external_id', models.CharField(blank=True, db_index=True, max_length=100, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('archived_at', models.DateTimeField(help_text='When the task was archived')),
+                ('status', models.ForeignKey(help_text='Status of the task when it was archived', on_delete=django.db.models.deletion.PROTECT, related_name='archived_tasks', to='api.status')),
+            ],
+            options={
+                'verbose_name': 'Archived task',
+                'verbose_name_plural': 'Archived tasks',
+                'db_table': 'task_archive',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', '-created_at', '-id'], name='task_archive_status_idx'), models.Index(fields=['-created_at', '-id'], name='task_archive_created_idx'), models.Index(fields=['updated_at', 'id'], name='task_archive_updated_idx'), models.Index(fields=['name', 'id'], name='task_archive_name_idx'), django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='task_archive_search_idx')],
+            },
+        ),
+        migrations.RunSQL(TASK_WITH_ARCHIVE_VIEW, 'DROP VIEW IF EXISTS task_with_archive;'),
+    ]
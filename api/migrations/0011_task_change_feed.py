@@ -0,0 +1,86 @@
+# Generated by Django 4.2.26 on 2026-10-18 18:34
+
+from django.db import migrations, models
+
+
+# Every write stamps the row with the id of its (top-level) transaction and
+# every delete leaves a tombstone with the same stamp, whatever the write
+# path (ORM saves, bulk and raw updates, COPY imports, archive_tasks).
+# The change feed orders rows by (transaction id, task id) and only returns
+# transactions older than the oldest one still running, so changes that
+# commit out of order are never skipped.
+# Existing rows are stamped by 0012 and indexed by 0013.
+TASK_CHANGE_TRIGGERS = """
+CREATE FUNCTION task_change_txid_update() RETURNS trigger AS $$
+BEGIN
+    NEW.change_txid := pg_current_xact_id()::text::bigint;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_change_txid_trigger
+    BEFORE INSERT OR UPDATE ON task
+    FOR EACH ROW EXECUTE FUNCTION task_change_txid_update();
+
+CREATE FUNCTION task_tombstone_insert() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO task_tombstone (task_id, change_txid, reason, deleted_at)
+    SELECT id, pg_current_xact_id()::text::bigint,
+        coalesce(nullif(current_setting('api.task_delete_reason', true), ''), 'deleted'), now()
+    FROM old_rows
+    ON CONFLICT (task_id) DO UPDATE SET
+        change_txid = EXCLUDED.change_txid, reason = EXCLUDED.reason, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_tombstone_trigger
+    AFTER DELETE ON task
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION task_tombstone_insert();
+"""
+
+DROP_TASK_CHANGE_TRIGGERS = """
+DROP TRIGGER IF EXISTS task_change_txid_trigger ON task;
+DROP TRIGGER IF EXISTS task_tombstone_trigger ON task;
+DROP FUNCTION IF EXISTS task_change_txid_update();
+DROP FUNCTION IF EXISTS task_tombstone_insert();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_task_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTombstone',
+            fields=[
+                ('task_id', models.BigIntegerField(help_text='Id of the removed task', primary_key=True, serialize=False)),
+                ('change_txid', models.BigIntegerField(help_text='Id of the transaction that removed the task')),
+                ('reason', models.CharField(choices=[('deleted', 'Deleted'), ('archived', 'Archived')], default='deleted', max_length=20)),
+                ('deleted_at', models.DateTimeField(help_text='Start of the transaction that removed the task')),
+            ],
+            options={
+                'verbose_name': 'Task tombstone',
+                'verbose_name_plural': 'Task tombstones',
+                'db_table': 'task_tombstone',
+            },
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='change_txid',
+            field=models.BigIntegerField(editable=False, help_text='Id of the transaction that last wrote the task, maintained by a database trigger', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='tasktombstone',
+            index=models.Index(fields=['change_txid', 'task_id'], name='task_tombstone_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasktombstone',
+            index=models.Index(fields=['deleted_at'], name='task_tombstone_deleted_idx'),
+        ),
+        migrations.RunSQL(TASK_CHANGE_TRIGGERS, DROP_TASK_CHANGE_TRIGGERS),
+    ]
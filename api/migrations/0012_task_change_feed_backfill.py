@@ -0,0 +1,37 @@
+from django.db import migrations
+
+BATCH_SIZE = 10000
+
+# The trigger of 0011 stamps rows written since; older rows are stamped
+# here, each batch with the id of its own transaction
+BACKFILL_SQL = """
+UPDATE task SET change_txid = pg_current_xact_id()::text::bigint
+WHERE id >= %s AND id < %s AND change_txid IS NULL
+"""
+
+
+def backfill_change_txid(apps, schema_editor):
+    """
+    Stamp change_txid BATCH_SIZE ids at a time. Each statement commits on
+    its own, so rows are only locked for the length of one batch.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('SELECT min(id), max(id) FROM task')
+        low, high = cursor.fetchone()
+        if low is None:
+            return
+        for start in range(low, high + 1, BATCH_SIZE):
+            cursor.execute(BACKFILL_SQL, [start, start + BATCH_SIZE])
+
+
+class Migration(migrations.Migration):
+    # Batches are committed one by one instead of in one long transaction
+    atomic = False
+
+    dependencies = [
+        ('api', '0011_task_change_feed'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_change_txid, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The index is built concurrently so the task table stays writable
+    atomic = False
+
+    dependencies = [
+        ('api', '0012_task_change_feed_backfill'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['change_txid', 'id'], name='task_change_idx'),
+        ),
+    ]
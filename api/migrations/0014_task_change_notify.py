@@ -0,0 +1,65 @@
+# Generated by Django 4.2.26 on 2026-10-18 21:02
+
+from django.db import migrations, models
+
+
+# created_txid tells creations from updates in the task stream: a task whose
+# change_txid equals its created_txid was created by that transaction. The
+# trigger owns the column, so ORM saves that write a stale value keep the
+# original one. Tasks created before this migration keep a null.
+# Every statement that writes the task table also notifies the
+# task_changes channel with its transaction id. Postgres delivers the
+# notification on commit and sends a transaction's identical notifications
+# once, so a bulk statement costs a single message.
+TASK_CHANGE_NOTIFY = """
+CREATE OR REPLACE FUNCTION task_change_txid_update() RETURNS trigger AS $$
+BEGIN
+    NEW.change_txid := pg_current_xact_id()::text::bigint;
+    IF TG_OP = 'INSERT' THEN
+        NEW.created_txid := NEW.change_txid;
+    ELSE
+        NEW.created_txid := OLD.created_txid;
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION task_change_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('task_changes', pg_current_xact_id()::text);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_change_notify_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON task
+    FOR EACH STATEMENT EXECUTE FUNCTION task_change_notify();
+"""
+
+DROP_TASK_CHANGE_NOTIFY = """
+DROP TRIGGER IF EXISTS task_change_notify_trigger ON task;
+DROP FUNCTION IF EXISTS task_change_notify();
+
+CREATE OR REPLACE FUNCTION task_change_txid_update() RETURNS trigger AS $$
+BEGIN
+    NEW.change_txid := pg_current_xact_id()::text::bigint;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_task_change_feed_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='created_txid',
+            field=models.BigIntegerField(editable=False, help_text='Id of the transaction that created the task, maintained by a database trigger', null=True),
+        ),
+        migrations.RunSQL(TASK_CHANGE_NOTIFY, DROP_TASK_CHANGE_NOTIFY),
+    ]
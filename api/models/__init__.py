@@ -1,4 +1,7 @@
 from .status import Status
 from .task import Task
+from .stats import TaskDailyCount
+from .archive import TaskArchive, TaskWithArchive
+from .changes import TaskTombstone
 
-__all__ = ['Status', 'Task']
+__all__ = ['Status', 'Task', 'TaskDailyCount', 'TaskArchive', 'TaskWithArchive', 'TaskTombstone']
@@ -0,0 +1,125 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models, transaction
+from .status import Status
+
+# Locks one batch of old tasks (skipping rows other transactions hold),
+# deletes them from task and inserts them into task_archive, all in one
+# statement. Walks the task_status_created_idx index oldest first.
+ARCHIVE_BATCH_SQL = """
+WITH batch AS (
+    SELECT id FROM task
+    WHERE status_id = ANY(%s::bigint[]) AND created_at < %s AND updated_at < %s
+    ORDER BY status_id, created_at, id
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+), moved AS (
+    DELETE FROM task USING batch WHERE task.id = batch.id
+    RETURNING task.id, task.name, task.content, task.status_id, task.external_id,
+        task.created_at, task.updated_at, task.search_vector
+)
+INSERT INTO task_archive
+    (id, name, content, status_id, external_id, created_at, updated_at, search_vector, archived_at)
+SELECT id, name, content, status_id, external_id, created_at, updated_at, search_vector, now()
+FROM moved
+"""
+
+
+class TaskArchiveManager(models.Manager):
+    """
+    Manager for TaskArchive.
+    """
+
+    def archive_batch(self, status_ids, cutoff, batch_size):
+        """
+        Move up to batch_size tasks in one of status_ids, created and last
+        updated before cutoff, from task to task_archive in one short
+        transaction. Returns the number of tasks moved.
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Tombstones written by the delete record the task as archived
+            cursor.execute("SELECT set_config('api.task_delete_reason', 'archived', true)")
+            cursor.execute(ARCHIVE_BATCH_SQL, [list(status_ids), cutoff, cutoff, batch_size])
+            moved = cursor.rowcount
+            cursor.execute("SELECT set_config('api.task_delete_reason', '', true)")
+            return moved
+
+
+class TaskArchive(models.Model):
+    """
+    Task moved out of the task table by archive_tasks.
+    Keeps the original id, so task URLs stay valid, and the search vector,
+    so archived tasks remain searchable with ?include_archived=true.
+    Archived tasks are read-only.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=200)
+    content = models.TextField()
+    status = models.ForeignKey(
+        Status,
+        on_delete=models.PROTECT,
+        related_name='archived_tasks',
+        help_text="Status of the task when it was archived"
+    )
+    external_id = models.CharField(max_length=100, null=True, blank=True, db_index=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    search_vector = SearchVectorField(null=True, editable=False)
+    archived_at = models.DateTimeField(help_text="When the task was archived")
+
+    objects = TaskArchiveManager()
+
+    class Meta:
+        db_table = 'task_archive'
+        verbose_name = 'Archived task'
+        verbose_name_plural = 'Archived tasks'
+        ordering = ['-created_at']
+        # Same shapes as the task indexes, so lists over task_with_archive
+        # merge two index scans instead of sorting the archive
+        indexes = [
+            models.Index(fields=['status', '-created_at', '-id'], name='task_archive_status_idx'),
+            models.Index(fields=['-created_at', '-id'], name='task_archive_created_idx'),
+            models.Index(fields=['updated_at', 'id'], name='task_archive_updated_idx'),
+            models.Index(fields=['name', 'id'], name='task_archive_name_idx'),
+            GinIndex(fields=['search_vector'], name='task_archive_search_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class TaskWithArchiveManager(models.Manager):
+    """
+    Default manager for TaskWithArchive.
+    Defers the search vector, which is only used inside queries.
+    """
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
+
+class TaskWithArchive(models.Model):
+    """
+    Read-only view over active and archived tasks (task UNION ALL
+    task_archive), behind ?include_archived=true. Filters, orderings and
+    limits are pushed down into both tables by the planner.
+    archived_at is null for active tasks.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=200)
+    content = models.TextField()
+    status = models.ForeignKey(Status, on_delete=models.DO_NOTHING, related_name='+', db_constraint=False)
+    external_id = models.CharField(max_length=100, null=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    search_vector = SearchVectorField(null=True, editable=False)
+    archived_at = models.DateTimeField(null=True)
+
+    objects = TaskWithArchiveManager()
+
+    class Meta:
+        managed = False
+        db_table = 'task_with_archive'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,33 @@
+from django.db import models
+
+
+class TaskTombstone(models.Model):
+    """
+    Record of a task removed from the task table, for the change feed.
+    Written by a database trigger on every delete path (destroy, bulk and
+    raw deletes, archive_tasks); pruned after TASK_CHANGES_RETENTION_DAYS
+    by prune_task_tombstones.
+    """
+    REASON_DELETED = 'deleted'
+    REASON_ARCHIVED = 'archived'
+    REASON_CHOICES = [
+        (REASON_DELETED, 'Deleted'),
+        (REASON_ARCHIVED, 'Archived'),
+    ]
+
+    task_id = models.BigIntegerField(primary_key=True, help_text="Id of the removed task")
+    change_txid = models.BigIntegerField(help_text="Id of the transaction that removed the task")
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES, default=REASON_DELETED)
+    deleted_at = models.DateTimeField(help_text="Start of the transaction that removed the task")
+
+    class Meta:
+        db_table = 'task_tombstone'
+        verbose_name = 'Task tombstone'
+        verbose_name_plural = 'Task tombstones'
+        indexes = [
+            models.Index(fields=['change_txid', 'task_id'], name='task_tombstone_change_idx'),
+            models.Index(fields=['deleted_at'], name='task_tombstone_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.task_id} ({self.reason})'
@@ -0,0 +1,55 @@
+from django.db import connection, models, transaction
+from .status import Status
+
+REBUILD_SQL = """
+DELETE FROM task_daily_count;
+INSERT INTO task_daily_count (status_id, day, count)
+SELECT status_id, (created_at AT TIME ZONE 'UTC')::date, count(*)
+FROM task
+GROUP BY 1, 2;
+"""
+
+
+class TaskDailyCountManager(models.Manager):
+    """
+    Manager for TaskDailyCount.
+    """
+
+    def rebuild(self):
+        """
+        Recompute every counter from the task table.
+        Task writes are blocked while the counters are rebuilt.
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('LOCK TABLE task IN SHARE MODE')
+            cursor.execute(REBUILD_SQL)
+
+
+class TaskDailyCount(models.Model):
+    """
+    Number of tasks per status and creation day (UTC).
+    Maintained by statement-level database triggers on the task table, so
+    every write path (ORM saves, bulk and raw set-based updates, deletes)
+    keeps it current.
+    """
+    status = models.ForeignKey(
+        Status,
+        on_delete=models.CASCADE,
+        related_name='daily_counts',
+        help_text="Task status"
+    )
+    day = models.DateField(help_text="Creation day of the tasks (UTC)")
+    count = models.IntegerField(default=0, help_text="Number of tasks")
+
+    objects = TaskDailyCountManager()
+
+    class Meta:
+        db_table = 'task_daily_count'
+        verbose_name = 'Task daily count'
+        verbose_name_plural = 'Task daily counts'
+        constraints = [
+            models.UniqueConstraint(fields=['status', 'day'], name='task_daily_count_status_day_uniq'),
+        ]
+
+    def __str__(self):
+        return f'{self.status_id} {self.day}: {self.count}'
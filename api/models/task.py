@@ -1,7 +1,18 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from .status import Status
 
 
+class TaskManager(models.Manager):
+    """
+    Default manager for Task.
+    Defers the search vector, which is only used inside queries.
+    """
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
+
 class Task(models.Model):
     """
     Model representing a task.
@@ -20,14 +31,50 @@ class Task(models.Model):
         related_name='tasks',
         help_text="Current status of the task"
     )
+    external_id = models.CharField(
+        max_length=100,
+        null=True,
+        blank=True,
+        unique=True,
+        editable=False,
+        help_text="Identifier in the system the task was imported from; import_tasks upserts on it"
+    )
+    change_txid = models.BigIntegerField(
+        null=True,
+        editable=False,
+        help_text="Id of the transaction that last wrote the task, maintained by a database trigger"
+    )
+    created_txid = models.BigIntegerField(
+        null=True,
+        editable=False,
+        help_text="Id of the transaction that created the task, maintained by a database trigger"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text index of name and content, maintained by a database trigger"
+    )
+
+    objects = TaskManager()
 
     class Meta:
         db_table = 'task'
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
         ordering = ['-created_at']
+        # Match the list query shapes: each ordering exposed by TaskViewSet plus
+        # the primary key tiebreaker added by cursor pagination.
+        indexes = [
+            models.Index(fields=['status', '-created_at', '-id'], name='task_status_created_idx'),
+            models.Index(fields=['-created_at', '-id'], name='task_created_id_idx'),
+            models.Index(fields=['updated_at', 'id'], name='task_updated_id_idx'),
+            models.Index(fields=['name', 'id'], name='task_name_id_idx'),
+            GinIndex(fields=['search_vector'], name='task_search_vector_idx'),
+            # Change feed position (see api.views.task.changes)
+            models.Index(fields=['change_txid', 'id'], name='task_change_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -0,0 +1,3 @@
+from .task import TaskCursorPagination
+
+__all__ = ['TaskCursorPagination']
@@ -0,0 +1,45 @@
+import base64
+import time
+from django.conf import settings
+from api.exceptions import CursorExpired
+
+
+class ChangeCursor:
+    """
+    Position in the task change feed: every change up to and including
+    (txid, task_id) has been returned. issued is the Unix time the cursor
+    was handed out, checked against TASK_CHANGES_RETENTION_DAYS.
+    """
+
+    def __init__(self, txid=0, task_id=0, issued=None):
+        self.txid = txid
+        self.task_id = task_id
+        self.issued = int(time.time()) if issued is None else issued
+
+    @property
+    def position(self):
+        return self.txid, self.task_id
+
+    def encode(self):
+        raw = f'{self.txid}:{self.task_id}:{self.issued}'.encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, value):
+        """
+        Parse an encoded cursor. Raises ValueError when it is malformed and
+        CursorExpired when it is older than the retention period.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(value + '=' * (-len(value) % 4)).decode()
+            txid, task_id, issued = (int(part) for part in raw.split(':'))
+        except (ValueError, UnicodeDecodeError):
+            raise ValueError('Invalid cursor.')
+        if min(txid, task_id, issued) < 0:
+            raise ValueError('Invalid cursor.')
+        if issued < time.time() - settings.TASK_CHANGES_RETENTION_DAYS * 86400:
+            raise CursorExpired
+        return cls(txid, task_id, issued)
+
+    def __repr__(self):
+        return f'<ChangeCursor {self.txid}:{self.task_id}>'
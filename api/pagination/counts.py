@@ -0,0 +1,31 @@
+import json
+from django.db.models import Sum
+from api.models import TaskDailyCount
+
+
+def bounded_count(queryset, limit):
+    """
+    Count the rows of queryset, reading at most limit + 1 of them.
+    Returns None when there are more than limit rows.
+    """
+    count = queryset.order_by()[:limit + 1].count()
+    return count if count <= limit else None
+
+
+def planner_estimate(queryset):
+    """
+    Return the planner's row estimate for queryset (EXPLAIN, no execution).
+    """
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def counter_table_count(status_id=None):
+    """
+    Return the number of tasks (optionally in one status) from the
+    task_daily_count summary table.
+    """
+    counters = TaskDailyCount.objects.all()
+    if status_id is not None:
+        counters = counters.filter(status_id=status_id)
+    return counters.aggregate(total=Sum('count'))['total'] or 0
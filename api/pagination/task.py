@@ -0,0 +1,168 @@
+import json
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, _reverse_ordering
+from .counts import bounded_count, counter_table_count, planner_estimate
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination for Task lists.
+    Pages are addressed by an opaque cursor on the active ordering, so every page
+    costs the same as the first one and concurrent inserts never shift rows
+    between pages. The ordering honors the view's OrderingFilter whitelist.
+    Unlike DRF's CursorPagination, which positions on the first ordering
+    field only and skips ties with an offset capped at offset_cutoff, the
+    cursor holds every ordering field plus the id tiebreaker, so any number
+    of equal values pages correctly.
+    With ?count=true the response also carries the total number of rows
+    (see get_count).
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    ordering = ('-created_at', '-id')
+    count_query_param = 'count'
+
+    # Query parameters that do not narrow the rows being counted
+    non_filter_params = {'cursor', 'page_size', 'ordering', 'fields', 'omit', 'compact', 'count', 'format'}
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Append the primary key as a tiebreaker so rows sharing the same
+        ordering value are always returned in a deterministic order.
+        """
+        ordering = super().get_ordering(request, queryset, view)
+        if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+            tiebreaker = '-id' if ordering[0].startswith('-') else 'id'
+            ordering = ordering + (tiebreaker,)
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = self.count_approximate = None
+        if request.query_params.get(self.count_query_param, '').lower() in ('1', 'true', 'yes'):
+            self.count, self.count_approximate = self.get_count(queryset, request)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        position = None
+        if self.cursor is not None and self.cursor.position is not None:
+            position = self.decode_position(self.cursor.position)
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after_position(ordering, position))
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def after_position(self, ordering, position):
+        """
+        Return the condition selecting the rows after position in ordering:
+        (a, b, id) > (x, y, z) expanded per field, since the directions of
+        the fields may differ.
+        """
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        # Bound the leading field too, so its index range is scanned
+        first = ordering[0]
+        bound = 'lte' if first.startswith('-') else 'gte'
+        return Q(**{f'{first.lstrip("-")}__{bound}': position[0]}) & condition
+
+    def decode_position(self, raw):
+        try:
+            position = json.loads(raw)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            values.append(str(value))
+        return json.dumps(values, separators=(',', ':'))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.page:
+            position = self._get_position_from_instance(self.page[-1], self.ordering)
+        else:
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.page:
+            position = self._get_position_from_instance(self.page[0], self.ordering)
+        else:
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def get_count(self, queryset, request):
+        """
+        Return (count, approximate) for the filtered queryset.
+        Unfiltered and status-only lists are counted from the
+        task_daily_count summary table. Other lists are counted exactly up
+        to TASK_COUNT_EXACT_LIMIT rows; above that the planner's estimate is
+        returned and flagged as approximate.
+        """
+        filters = {key for key, value in request.query_params.items() if value and key not in self.non_filter_params}
+        if not filters:
+            return counter_table_count(), False
+        if filters == {'status'}:
+            return counter_table_count(request.query_params['status']), False
+
+        limit = settings.TASK_COUNT_EXACT_LIMIT
+        count = bounded_count(queryset, limit)
+        if count is not None:
+            return count, False
+        return max(planner_estimate(queryset), limit + 1), True
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.count is not None:
+            response.data['count'] = self.count
+            response.data['count_approximate'] = self.count_approximate
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema['properties']['count'] = {
+            'type': 'integer',
+            'description': 'Total number of rows, only with ?count=true',
+        }
+        schema['properties']['count_approximate'] = {
+            'type': 'boolean',
+            'description': 'Whether count is a planner estimate',
+        }
+        return schema
@@ -0,0 +1,3 @@
+from .fast_json import FastJSONParser
+
+__all__ = ['FastJSONParser']
@@ -0,0 +1,3 @@
+from .fast_json import FastJSONRenderer
+
+__all__ = ['FastJSONRenderer']
@@ -0,0 +1,3 @@
+from .token import TokenObtainPairSerializer
+
+__all__ = ['TokenObtainPairSerializer']
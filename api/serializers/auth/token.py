@@ -0,0 +1,30 @@
+from django.conf import settings
+from rest_framework_simplejwt import serializers
+from api.authentication import TOKEN_VERSION_CLAIM, last_login_recorder
+from api.cache import token_cache
+
+
+class TokenObtainPairSerializer(serializers.TokenObtainPairSerializer):
+    """
+    Serializer for obtaining a token pair.
+    Adds the claims simplejwt's TokenUser reads, so permission checks work
+    without a database lookup in token-user mode, and, with
+    AUTH_TOKEN_VERSIONS, the user's token version, which revocation checks
+    against. Hands the last_login write
+    to the batched recorder.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['username'] = user.get_username()
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        if settings.AUTH_TOKEN_VERSIONS:
+            token[TOKEN_VERSION_CLAIM] = token_cache.user_version(user.pk)
+        return token
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        last_login_recorder.record(self.user)
+        return data
@@ -0,0 +1,60 @@
+from rest_framework import serializers
+
+
+class SparseFieldsetMixin:
+    """
+    Lets clients choose which fields a read returns.
+    ?fields=a,b keeps only the listed fields and ?omit=c drops fields.
+    Writes always use every field.
+    """
+    fields_param = 'fields'
+    omit_param = 'omit'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method != 'GET':
+            return
+
+        selected = self.get_selected_fields(request.query_params)
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
+
+    @classmethod
+    def get_selected_fields(cls, query_params):
+        """
+        Return the field names to serialize for the given query params.
+        Raises ValidationError for unknown field names.
+        """
+        available = list(cls.Meta.fields)
+        requested = cls._parse_field_list(query_params.get(cls.fields_param))
+        omitted = cls._parse_field_list(query_params.get(cls.omit_param))
+
+        errors = {}
+        for param, names in ((cls.fields_param, requested), (cls.omit_param, omitted)):
+            unknown = [name for name in names if name not in available]
+            if unknown:
+                errors[param] = [f'Unknown field(s): {", ".join(unknown)}.']
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        selected = requested or available
+        return [name for name in available if name in selected and name not in omitted]
+
+    def get_source_lookups(self):
+        """
+        Map each serialized field to the ORM lookup it reads from,
+        e.g. status_name -> status__name.
+        """
+        return {
+            name: field.source.replace('.', '__')
+            for name, field in self.fields.items()
+            if field.source != '*'
+        }
+
+    @staticmethod
+    def _parse_field_list(value):
+        if not value:
+            return []
+        return [name.strip() for name in value.split(',') if name.strip()]
@@ -1,3 +1,4 @@
 from .status import StatusSerializer
+from .fields import CachedStatusField
 
-__all__ = ['StatusSerializer']
+__all__ = ['StatusSerializer', 'CachedStatusField']
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+from api.cache import status_cache
+
+
+class CachedStatusField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key field for Status references.
+    Resolves ids through the process-wide status cache instead of running
+    one query per validated value.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        status = status_cache.get(pk)
+        if status is None:
+            self.fail('does_not_exist', pk_value=data)
+        return status
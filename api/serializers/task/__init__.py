@@ -1,4 +1,17 @@
 from .task import TaskSerializer
 from .mark_complete import MarkTasksAsCompleteSerializer
+from .export import TaskExportSerializer
+from .bulk import TaskBulkSerializer, TaskBulkCreateSerializer, TaskBulkUpdateSerializer
+from .transition import TaskTransitionSerializer
+from .changes import TaskChangesQuerySerializer
 
-__all__ = ['TaskSerializer', 'MarkTasksAsCompleteSerializer']
+__all__ = [
+    'TaskSerializer',
+    'MarkTasksAsCompleteSerializer',
+    'TaskExportSerializer',
+    'TaskBulkSerializer',
+    'TaskBulkCreateSerializer',
+    'TaskBulkUpdateSerializer',
+    'TaskTransitionSerializer',
+    'TaskChangesQuerySerializer',
+]
@@ -0,0 +1,140 @@
+from django.db import connection
+from django.utils import timezone
+from rest_framework import serializers
+from api.models import Task, Status
+from api.serializers.status import CachedStatusField
+from .task import TaskSerializer
+
+# Maximum number of items accepted per operation list in one request
+BULK_MAX_ITEMS = 10000
+
+# Rows written per INSERT/UPDATE statement
+BULK_BATCH_SIZE = 1000
+
+
+class TaskBulkListSerializer(serializers.ListSerializer):
+    """
+    List serializer for bulk task writes.
+    Persists every item with a single bulk_create/bulk_update call.
+    """
+
+    def create(self, validated_data):
+        """
+        Insert all tasks in batches and return them with their new ids.
+        """
+        tasks = [Task(**attrs) for attrs in validated_data]
+        return Task.objects.bulk_create(tasks, batch_size=BULK_BATCH_SIZE)
+
+    def update(self, instances, validated_data):
+        """
+        Apply each item to its task (instances maps id -> Task) and write
+        only the touched columns. updated_at is set explicitly since
+        auto_now does not apply to set-based updates.
+        """
+        now = timezone.now()
+        fields = {'updated_at'}
+        tasks = []
+        for attrs in validated_data:
+            task = instances[attrs['id']]
+            for field, value in attrs.items():
+                if field != 'id':
+                    setattr(task, field, value)
+                    fields.add(field)
+            task.updated_at = now
+            tasks.append(task)
+
+        for start in range(0, len(tasks), BULK_BATCH_SIZE):
+            self._update_batch(tasks[start:start + BULK_BATCH_SIZE], sorted(fields))
+        return tasks
+
+    def _update_batch(self, tasks, field_names):
+        """
+        Write a batch with one UPDATE ... FROM unnest(...) statement.
+        Unlike QuerySet.bulk_update, which builds a CASE WHEN expression per
+        row and column, this sends one typed array per column.
+        """
+        quote = connection.ops.quote_name
+        fields = [Task._meta.pk] + [Task._meta.get_field(name) for name in field_names]
+        columns = ', '.join(quote(field.column) for field in fields)
+        arrays = ', '.join(f'%s::{field.db_type(connection)}[]' for field in fields)
+        assignments = ', '.join(f'{quote(field.column)} = v.{quote(field.column)}' for field in fields[1:])
+        params = [
+            [field.get_db_prep_save(getattr(task, field.attname), connection) for task in tasks]
+            for field in fields
+        ]
+        sql = (
+            f'UPDATE {quote(Task._meta.db_table)} SET {assignments} '
+            f'FROM unnest({arrays}) AS v({columns}) '
+            f'WHERE {quote(Task._meta.db_table)}.{quote(Task._meta.pk.column)} = v.{quote(Task._meta.pk.column)}'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+
+class TaskBulkCreateSerializer(TaskSerializer):
+    """
+    Serializer for one task in a bulk create.
+    """
+
+    class Meta(TaskSerializer.Meta):
+        list_serializer_class = TaskBulkListSerializer
+
+
+class TaskBulkUpdateSerializer(TaskBulkCreateSerializer):
+    """
+    Serializer for one task in a bulk update.
+    Requires the task id; every other field is optional.
+    """
+    id = serializers.IntegerField()
+    status = CachedStatusField(queryset=Status.objects.all(), required=False)
+
+    class Meta(TaskBulkCreateSerializer.Meta):
+        read_only_fields = ['created_at', 'updated_at']
+        extra_kwargs = {
+            'name': {'required': False},
+            'content': {'required': False},
+        }
+
+
+class TaskBulkSerializer(serializers.Serializer):
+    """
+    Serializer for bulk task operations.
+    Receives lists of tasks to create, tasks to update and task IDs to delete.
+    """
+    create = TaskBulkCreateSerializer(
+        many=True,
+        required=False,
+        max_length=BULK_MAX_ITEMS,
+        help_text="Tasks to create"
+    )
+    update = TaskBulkUpdateSerializer(
+        many=True,
+        required=False,
+        max_length=BULK_MAX_ITEMS,
+        help_text="Tasks to update, identified by id"
+    )
+    delete = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        max_length=BULK_MAX_ITEMS,
+        help_text="IDs of tasks to delete"
+    )
+
+    def validate(self, attrs):
+        """
+        Check the operations are consistent with each other.
+        """
+        creates = attrs.setdefault('create', [])
+        updates = attrs.setdefault('update', [])
+        deletes = attrs.setdefault('delete', [])
+
+        if not (creates or updates or deletes):
+            raise serializers.ValidationError('At least one create, update or delete item is required.')
+
+        update_ids = [item['id'] for item in updates]
+        if len(update_ids) != len(set(update_ids)):
+            raise serializers.ValidationError({'update': ['Each task can only be updated once per request.']})
+        if set(update_ids) & set(deletes):
+            raise serializers.ValidationError({'delete': ['A task cannot be updated and deleted in the same request.']})
+
+        return attrs
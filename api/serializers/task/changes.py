@@ -0,0 +1,25 @@
+from rest_framework import serializers
+from api.pagination.changes import ChangeCursor
+
+
+class TaskChangesQuerySerializer(serializers.Serializer):
+    """
+    Serializer for change feed query parameters.
+    """
+    since = serializers.CharField(
+        required=False,
+        help_text="Cursor returned as next by the previous call; omit to start from the beginning"
+    )
+    page_size = serializers.IntegerField(
+        required=False,
+        default=500,
+        min_value=1,
+        max_value=1000,
+        help_text="Maximum number of changes and deletions returned"
+    )
+
+    def validate_since(self, value):
+        try:
+            return ChangeCursor.decode(value)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc))
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+
+class TaskExportSerializer(serializers.Serializer):
+    """
+    Serializer for task export query parameters.
+    Selects the streaming output format.
+    """
+    export_format = serializers.ChoiceField(
+        choices=['ndjson', 'csv'],
+        default='ndjson',
+        help_text="Output format: ndjson (one JSON object per line) or csv"
+    )
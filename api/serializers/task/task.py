@@ -1,12 +1,19 @@
 from rest_framework import serializers
-from api.models import Task
+from api.models import Task, Status
+from api.serializers.mixins import SparseFieldsetMixin
+from api.serializers.status import CachedStatusField
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Task model.
     Handles serialization/deserialization of Task objects.
+    Reads can be trimmed with ?fields= / ?omit=.
     """
+    status = CachedStatusField(
+        queryset=Status.objects.all(),
+        help_text="Current status of the task"
+    )
     status_name = serializers.CharField(source='status.name', read_only=True)
     status_color = serializers.CharField(source='status.hexa_color', read_only=True)
 
@@ -0,0 +1,31 @@
+from rest_framework import serializers
+from api.models import Status
+from api.serializers.status import CachedStatusField
+
+
+class TaskTransitionSerializer(serializers.Serializer):
+    """
+    Serializer for moving many tasks to a status.
+    The tasks are given either as a list of IDs or as a filter expression
+    using the filter parameters of /api/tasks/.
+    """
+    status = CachedStatusField(
+        queryset=Status.objects.all(),
+        help_text="Target status"
+    )
+    task_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+        required=False,
+        help_text="IDs of the tasks to move"
+    )
+    filter = serializers.DictField(
+        allow_empty=False,
+        required=False,
+        help_text='Filter selecting the tasks to move, e.g. {"status": 1, "created_at__lte": "2024-01-01"}'
+    )
+
+    def validate(self, attrs):
+        if ('task_ids' in attrs) == ('filter' in attrs):
+            raise serializers.ValidationError('Provide either task_ids or filter.')
+        return attrs
@@ -0,0 +1,3 @@
+from . import status  # noqa: F401
+from . import task  # noqa: F401
+from . import user  # noqa: F401
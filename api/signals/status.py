@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from api.cache import list_response_cache, status_cache
+from api.models import Status
+
+
+@receiver(post_save, sender=Status)
+@receiver(post_delete, sender=Status)
+def invalidate_status_cache(sender, **kwargs):
+    """
+    Invalidate the status cache and cached lists when a Status is written.
+    Invalidates again after commit, since another worker may have reloaded
+    the old rows while the transaction was still open.
+    """
+    status_cache.invalidate()
+    transaction.on_commit(status_cache.invalidate)
+    list_response_cache.invalidate(Status)
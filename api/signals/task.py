@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from api.cache import list_response_cache
+from api.models import Task
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_lists(sender, **kwargs):
+    """
+    Invalidate cached task lists when a Task is written.
+    """
+    list_response_cache.invalidate(Task)
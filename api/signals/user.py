@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from api.cache import token_cache
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_tokens(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Flush cached tokens when a user is written, and revoke the user's
+    tokens on a password change or deactivation.
+    last_login updates and rehashes on login are ignored.
+    """
+    # set_password() leaves the raw password in _password until save() completes;
+    # a rehash on login clears it before saving
+    password_changed = getattr(instance, '_password', None) is not None
+    if created or (
+        update_fields is not None
+        and set(update_fields) <= {'last_login', 'password'}
+        and not password_changed
+    ):
+        return
+
+    if password_changed or not instance.is_active:
+        token_cache.revoke_user(instance.pk)
+    else:
+        token_cache.invalidate()
+    transaction.on_commit(token_cache.invalidate)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def revoke_deleted_user_tokens(sender, instance, **kwargs):
+    """
+    Revoke the tokens of a deleted user.
+    """
+    token_cache.revoke_user(instance.pk)
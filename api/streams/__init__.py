@@ -0,0 +1,9 @@
+from .events import TaskEvent, sse_frame
+from .broker import TaskChangeBroker, task_change_broker
+from .revocations import StreamRevocations, stream_revocations
+from .app import TaskStreamApp
+
+__all__ = [
+    'TaskEvent', 'sse_frame', 'TaskChangeBroker', 'task_change_broker',
+    'StreamRevocations', 'stream_revocations', 'TaskStreamApp',
+]
@@ -0,0 +1,223 @@
+import asyncio
+import time
+from urllib.parse import parse_qs
+from django.conf import settings
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated, ValidationError
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from api.authentication import TOKEN_VERSION_CLAIM, CachedJWTAuthentication
+from api.cache import status_cache
+from api.pagination.changes import ChangeCursor
+from .broker import task_change_broker
+from .events import renderer, sse_frame
+from .revocations import stream_revocations
+
+
+class StreamRequest:
+    """
+    The parts of an ASGI request the stream needs: META-style headers (for
+    the authentication classes) and the query parameters.
+    """
+
+    def __init__(self, scope):
+        self.method = scope['method']
+        self.META = {
+            'HTTP_' + name.decode('latin1').upper().replace('-', '_'): value.decode('latin1')
+            for name, value in scope['headers']
+        }
+        self.query_params = parse_qs(scope['query_string'].decode('latin1'))
+
+    def get_param(self, name):
+        values = self.query_params.get(name)
+        return values[-1] if values else None
+
+
+class TaskStreamApp:
+    """
+    ASGI app serving GET /api/tasks/stream/, a Server-Sent Events stream of
+    task changes (task.created, task.updated, task.deleted) fed by the
+    TaskChangeBroker of the process.
+
+    It runs outside Django's request handler, which keeps a thread per
+    request for as long as the response lasts: an idle connection here
+    is a coroutine waiting on the broker's shared future and on the
+    client disconnect.
+
+    Clients authenticate with an Authorization: Bearer header, which
+    browsers' EventSource cannot send: the stream is meant for server-side
+    and native clients. The stream ends when its token expires, and within
+    a heartbeat of the token being revoked (see StreamRevocations), with a
+    stream.closed event carrying the error.
+
+    Query parameters:
+        status: only send changes of tasks in these statuses
+                (?status=1&status=2 or ?status=1,2); deletions are always sent
+        last_event_id: resume after this event, like the Last-Event-ID header
+    """
+    path = '/api/tasks/stream/'
+    # Milliseconds browsers wait before reconnecting
+    retry = 5000
+
+    def __init__(self, broker=None, revocations=None):
+        self.broker = broker or task_change_broker
+        self.revocations = revocations or stream_revocations
+
+    async def __call__(self, scope, receive, send):
+        request = StreamRequest(scope)
+        if request.method != 'GET':
+            body = {'detail': f'Method "{request.method}" not allowed.'}
+            return await self.respond(send, status.HTTP_405_METHOD_NOT_ALLOWED, body, [(b'allow', b'GET')])
+
+        try:
+            await self.broker.start()
+        except Exception:
+            body = {'detail': 'The task stream is unavailable.'}
+            return await self.respond(send, status.HTTP_503_SERVICE_UNAVAILABLE, body)
+
+        try:
+            token = await self.broker.run(self.authenticate, request)
+            statuses = await self.broker.run(self.get_statuses, request)
+            cursor = self.get_cursor(request)
+        except APIException as exc:
+            headers = []
+            if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+                headers.append((b'www-authenticate', CachedJWTAuthentication().authenticate_header(request).encode()))
+            return await self.respond(send, exc.status_code, self.error_body(exc), headers)
+
+        await send({
+            'type': 'http.response.start',
+            'status': status.HTTP_200_OK,
+            'headers': [
+                (b'content-type', b'text/event-stream'),
+                (b'cache-control', b'no-cache'),
+                # Keep nginx from buffering the stream
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+        disconnected = asyncio.ensure_future(self.wait_for_disconnect(receive))
+        revoked = self.revocations.watch(token[api_settings.USER_ID_CLAIM], token.get(TOKEN_VERSION_CLAIM, 0))
+        try:
+            position = cursor.position if cursor else self.broker.head
+            await self.stream(send, disconnected, revoked, token['exp'], position, statuses)
+        except OSError:
+            pass
+        finally:
+            disconnected.cancel()
+            self.revocations.unwatch(revoked)
+
+    def authenticate(self, request):
+        """
+        Authenticate the bearer token like the REST API does, and return
+        the validated token.
+        """
+        result = CachedJWTAuthentication().authenticate(request)
+        if result is None:
+            raise NotAuthenticated
+        return result[1]
+
+    def get_statuses(self, request):
+        """
+        Return the set of status ids of ?status=, or None for every status.
+        """
+        values = [
+            value.strip()
+            for param in request.query_params.get('status', [])
+            for value in param.split(',') if value.strip()
+        ]
+        if not values:
+            return None
+        try:
+            ids = {int(value) for value in values}
+        except ValueError:
+            raise ValidationError({'status': ['A valid integer is required.']})
+        missing = sorted(pk for pk in ids if status_cache.get(pk) is None)
+        if missing:
+            raise ValidationError({'status': [f'Invalid pk "{missing[0]}" - object does not exist.']})
+        return ids
+
+    def get_cursor(self, request):
+        """
+        Return the ChangeCursor to resume after, or None to start from now.
+        """
+        value = request.META.get('HTTP_LAST_EVENT_ID') or request.get_param('last_event_id')
+        if not value:
+            return None
+        try:
+            return ChangeCursor.decode(value)
+        except ValueError:
+            raise ValidationError({'last_event_id': ['Invalid cursor.']})
+
+    async def stream(self, send, disconnected, revoked, expires_at, position, statuses):
+        """
+        Send the events after position until the client disconnects or its
+        token expires or is revoked, with an id-only message every
+        TASK_STREAM_HEARTBEAT seconds of silence to keep proxies from
+        closing the connection.
+        """
+        broker = self.broker
+        await self.send_body(send, sse_frame(id=ChangeCursor(*position).encode(), retry=self.retry))
+        while not disconnected.done():
+            # Taken before reading the buffer, so no wake-up is missed
+            changed = broker.changed
+            events = broker.events_after(position)
+            caught_up = events is not None
+            if caught_up:
+                next_position = max(position, broker.head)
+            else:
+                # Behind the buffer: read the feed until caught up
+                events, next_cursor, _ = await broker.read(ChangeCursor(*position))
+                next_position = next_cursor.position
+
+            frames = [
+                event.frame for event in events
+                if statuses is None or event.status_id is None or event.status_id in statuses
+            ]
+            if frames:
+                await self.send_body(send, b''.join(frames))
+            position = next_position
+
+            done = True
+            if caught_up:
+                # Wake up when the token expires too
+                timeout = min(settings.TASK_STREAM_HEARTBEAT, max(expires_at - time.time(), 0))
+                done, _ = await asyncio.wait(
+                    (changed, disconnected, revoked), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+            if revoked.done():
+                exc = AuthenticationFailed(gettext_lazy('Token has been revoked'), code='token_revoked')
+                return await self.close(send, exc)
+            if time.time() >= expires_at:
+                return await self.close(send, InvalidToken(gettext_lazy('Token is expired')))
+            if not done:
+                await self.send_body(send, sse_frame(id=ChangeCursor(*position).encode()))
+
+    async def close(self, send, exc):
+        """
+        End the stream with a stream.closed event carrying the error.
+        """
+        await self.send_body(send, sse_frame('stream.closed', renderer.render(self.error_body(exc))))
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+    @staticmethod
+    def error_body(exc):
+        return exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+
+    @staticmethod
+    async def wait_for_disconnect(receive):
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+    @staticmethod
+    async def send_body(send, body):
+        await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+
+    @staticmethod
+    async def respond(send, status_code, data, headers=()):
+        await send({
+            'type': 'http.response.start',
+            'status': status_code,
+            'headers': [(b'content-type', b'application/json'), *headers],
+        })
+        await send({'type': 'http.response.body', 'body': renderer.render(data)})
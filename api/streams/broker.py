@@ -0,0 +1,245 @@
+import asyncio
+import bisect
+import itertools
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import psycopg2
+from django.conf import settings
+from django.db import InterfaceError, OperationalError, connection
+from api.pagination.changes import ChangeCursor
+from api.views.task.changes import change_horizon, read_changes
+from .events import TaskEvent
+
+logger = logging.getLogger(__name__)
+
+
+def call_with_reconnect(func, *args):
+    """
+    Run func in the broker thread, reconnecting once if the thread's
+    database connection was dropped since the last call.
+    """
+    try:
+        return func(*args)
+    except (InterfaceError, OperationalError):
+        connection.close()
+        return func(*args)
+
+
+def close_connection():
+    """
+    Close the calling thread's database connection.
+    """
+    connection.close()
+
+
+class TaskChangeBroker:
+    """
+    Fans task changes out to the stream subscribers of one process.
+
+    A single connection LISTENs on the task_changes channel, notified by a
+    trigger on every statement that writes the task table. On each
+    notification the broker reads the new entries of the change feed once,
+    encodes them as TaskEvents and keeps the latest TASK_STREAM_BUFFER_SIZE
+    in memory, then wakes every subscriber through one shared future. Idle
+    subscribers therefore cost no query and no thread; subscribers that
+    fall behind the buffer read the feed themselves (read()).
+
+    Database work runs in one broker thread with its own connection, so a
+    process streams to any number of clients with two connections.
+    """
+    channel = 'task_changes'
+    page_size = 500
+    # Seconds between retries while notified transactions are still behind
+    # an older open one (see _refresh)
+    retry_delays = (0.05, 0.1, 0.25, 0.5, 1.0)
+
+    def __init__(self):
+        self.loop = None
+        self._reset()
+
+    def _reset(self):
+        self.head = None
+        self.floor = None
+        self.events = deque()
+        self.changed = None
+        self._executor = None
+        self._starting = None
+        self._listener = None
+        self._notified = 0
+        self._refreshing = None
+        self._dirty = False
+        self._poller = None
+
+    @property
+    def buffer_size(self):
+        return settings.TASK_STREAM_BUFFER_SIZE
+
+    async def start(self):
+        """
+        Start listening on the running loop, if not done yet. Raises when
+        the database cannot be reached; the next call tries again.
+        """
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # First use, or a new loop (tests): state of another loop is unusable
+            self._reset()
+            self.loop = loop
+        if self._starting is None or (
+            self._starting.done() and (self._starting.cancelled() or self._starting.exception() is not None)
+        ):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='task-stream')
+            self._starting = loop.create_task(self._start())
+        await asyncio.shield(self._starting)
+
+    async def _start(self):
+        # LISTEN before reading the horizon, so no commit falls in between
+        await self._listen()
+        horizon = await self.run(change_horizon)
+        self.head = self.floor = (horizon, 0)
+        self.changed = self.loop.create_future()
+        self._poller = self.loop.create_task(self._poll())
+
+    async def stop(self):
+        """
+        Stop listening and close the broker's connections.
+        """
+        for task in (self._starting, self._refreshing, self._poller):
+            if task is not None:
+                task.cancel()
+        self._close_listener()
+        if self._executor is not None:
+            await self.loop.run_in_executor(self._executor, close_connection)
+            self._executor.shutdown(wait=False)
+        if self.changed is not None and not self.changed.done():
+            self.changed.set_result(None)
+        self._reset()
+        self.loop = None
+
+    async def run(self, func, *args):
+        """
+        Run a blocking (database) call in the broker thread.
+        """
+        return await self.loop.run_in_executor(self._executor, call_with_reconnect, func, *args)
+
+    async def read(self, cursor):
+        """
+        Read one page of events after cursor from the database.
+        Returns (events, next_cursor, has_more).
+        """
+        return await self.run(self._read, cursor, self.page_size)
+
+    @staticmethod
+    def _read(cursor, limit):
+        entries, next_cursor, has_more = read_changes(cursor, limit)
+        return [TaskEvent.from_entry(*entry) for entry in entries], next_cursor, has_more
+
+    def events_after(self, position):
+        """
+        Return the buffered events after position, or None when position
+        is older than the buffer and the caller has to read() instead.
+        """
+        if position < self.floor:
+            return None
+        start = bisect.bisect_right(self.events, position, key=lambda event: event.position)
+        return list(itertools.islice(self.events, start, None))
+
+    def refresh(self):
+        """
+        Read new changes into the buffer, or rerun the read in progress.
+        """
+        if self._refreshing is not None and not self._refreshing.done():
+            self._dirty = True
+        else:
+            self._refreshing = self.loop.create_task(self._refresh())
+
+    async def _refresh(self):
+        delays = iter(self.retry_delays)
+        try:
+            while True:
+                self._dirty = False
+                has_more = True
+                while has_more:
+                    events, next_cursor, has_more = await self.read(ChangeCursor(*self.head))
+                    self._append(events, next_cursor.position)
+                if self._dirty:
+                    continue
+                if self.head[0] <= self._notified:
+                    # A notified transaction committed while an older one is
+                    # still open; its changes are returned once that one ends
+                    await asyncio.sleep(next(delays, self.retry_delays[-1]))
+                    continue
+                return
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception('Reading task changes failed')
+
+    def _append(self, events, head):
+        for event in events:
+            if len(self.events) >= self.buffer_size:
+                self.floor = self.events.popleft().position
+            self.events.append(event)
+        self.head = max(self.head, head)
+        if events:
+            changed, self.changed = self.changed, self.loop.create_future()
+            changed.set_result(None)
+
+    async def _listen(self):
+        self._listener = await self.run(self._connect)
+        self.loop.add_reader(self._listener.fileno(), self._on_notify)
+
+    def _connect(self):
+        params = connection.get_connection_params()
+        # LISTEN needs a session of its own: it does not work through a
+        # pgbouncer in transaction pooling mode
+        if settings.TASK_STREAM_DB_HOST:
+            params['host'] = settings.TASK_STREAM_DB_HOST
+        if settings.TASK_STREAM_DB_PORT:
+            params['port'] = settings.TASK_STREAM_DB_PORT
+        listener = psycopg2.connect(**params)
+        listener.autocommit = True
+        with listener.cursor() as cursor:
+            cursor.execute(f'LISTEN {self.channel}')
+        return listener
+
+    def _close_listener(self):
+        if self._listener is None:
+            return
+        try:
+            self.loop.remove_reader(self._listener.fileno())
+        except (ValueError, psycopg2.Error):
+            pass
+        self._listener.close()
+        self._listener = None
+
+    def _on_notify(self):
+        try:
+            self._listener.poll()
+        except psycopg2.Error:
+            logger.warning('Task change listener disconnected, reconnecting', exc_info=True)
+            self._close_listener()
+            return
+        while self._listener.notifies:
+            payload = self._listener.notifies.pop().payload
+            self._notified = max(self._notified, int(payload or 0))
+        self.refresh()
+
+    async def _poll(self):
+        """
+        Reconnect the listener when it was lost and read changes every
+        TASK_STREAM_HEARTBEAT seconds, in case a notification was missed.
+        """
+        while True:
+            await asyncio.sleep(settings.TASK_STREAM_HEARTBEAT)
+            if self._listener is None:
+                try:
+                    await self._listen()
+                except Exception:
+                    logger.warning('Task change listener reconnection failed', exc_info=True)
+                    continue
+            self.refresh()
+
+
+task_change_broker = TaskChangeBroker()
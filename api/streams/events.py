@@ -0,0 +1,60 @@
+from api.models import Task
+from api.pagination.changes import ChangeCursor
+from api.renderers import FastJSONRenderer
+from api.serializers.task import TaskSerializer
+
+renderer = FastJSONRenderer()
+
+
+def sse_frame(event=None, data=None, id=None, retry=None):
+    """
+    Encode one Server-Sent Events message. data is a JSON bytes payload.
+    A message with only an id (or retry) dispatches nothing but still
+    moves the client's Last-Event-ID.
+    """
+    lines = []
+    if retry is not None:
+        lines.append(b'retry: %d' % retry)
+    if id is not None:
+        lines.append(b'id: ' + id.encode())
+    if event is not None:
+        lines.append(b'event: ' + event.encode())
+    if data is not None:
+        lines.append(b'data: ' + data)
+    return b'\n'.join(lines) + b'\n\n'
+
+
+class TaskEvent:
+    """
+    A task change ready to be sent: its position in the change feed, the
+    status it concerns (None for deletions, which every subscriber gets)
+    and the encoded message. The message is encoded once and shared by
+    every subscriber.
+    """
+    __slots__ = ('position', 'status_id', 'frame')
+
+    def __init__(self, position, status_id, frame):
+        self.position = position
+        self.status_id = status_id
+        self.frame = frame
+
+    @classmethod
+    def from_entry(cls, txid, task_id, obj):
+        """
+        Build the event of a change feed entry (see read_changes).
+        """
+        if isinstance(obj, Task):
+            # created_txid is null for tasks created before it was tracked
+            name = 'task.created' if obj.created_txid == txid else 'task.updated'
+            data = TaskSerializer(obj).data
+            status_id = obj.status_id
+        else:
+            name = 'task.deleted'
+            data = {'id': obj.task_id, 'reason': obj.reason, 'deleted_at': obj.deleted_at}
+            status_id = None
+
+        frame = sse_frame(name, renderer.render(data), ChangeCursor(txid, task_id).encode())
+        return cls((txid, task_id), status_id, frame)
+
+    def __repr__(self):
+        return f'<TaskEvent {self.position[0]}:{self.position[1]}>'
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from api.cache import token_cache
+
+logger = logging.getLogger(__name__)
+
+
+class StreamRevocations:
+    """
+    Watches the tokens of the open streams of one process for revocation.
+
+    Every TASK_STREAM_HEARTBEAT seconds one lookup covers every stream:
+    the users' token versions in one cache read with AUTH_TOKEN_VERSIONS,
+    otherwise one auth_user query for the users still active. It runs in a
+    worker thread, never in the broker's, so feed reads are not held up.
+    Expiry needs no lookup: streams close themselves at their token's exp.
+    """
+
+    def __init__(self):
+        self.loop = None
+        self._watches = {}
+        self._task = None
+
+    def watch(self, user_id, version):
+        """
+        Return a future resolved once the user's token of this version is
+        revoked. Pass it to unwatch() when the stream ends.
+        """
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # First use, or a new loop (tests)
+            self.loop = loop
+            self._watches = {}
+            self._task = None
+        revoked = loop.create_future()
+        # Token claims may hold the id as a string
+        self._watches[revoked] = (str(user_id), version)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return revoked
+
+    def unwatch(self, revoked):
+        self._watches.pop(revoked, None)
+        if not self._watches and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while self._watches:
+            await asyncio.sleep(settings.TASK_STREAM_HEARTBEAT)
+            watches = dict(self._watches)
+            try:
+                revoked = await sync_to_async(self.find_revoked, thread_sensitive=False)(set(watches.values()))
+            except Exception:
+                logger.warning('Checking stream tokens failed', exc_info=True)
+                continue
+            for future, watch in watches.items():
+                if watch in revoked and not future.done():
+                    future.set_result(None)
+
+    @staticmethod
+    def find_revoked(watches):
+        """
+        Return the (user_id, version) pairs whose tokens were revoked.
+        User ids are strings.
+        """
+        user_ids = {user_id for user_id, _ in watches}
+        if settings.AUTH_TOKEN_VERSIONS:
+            versions = token_cache.user_versions(user_ids)
+            return {(user_id, version) for user_id, version in watches if version < versions[user_id]}
+        try:
+            active = {
+                str(pk) for pk in
+                get_user_model().objects.filter(pk__in=user_ids, is_active=True).values_list('pk', flat=True)
+            }
+        finally:
+            connection.close()
+        return {(user_id, version) for user_id, version in watches if user_id not in active}
+
+
+stream_revocations = StreamRevocations()
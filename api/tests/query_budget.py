@@ -0,0 +1,62 @@
+"""
+Query budgets for tests.
+
+query_budget() is a context manager (and decorator) that fails when the
+wrapped code runs more SQL queries than allowed. QueryBudgetMixin runs an
+endpoint at several data sizes and checks that the query count stays
+within the budget and does not grow with the number of rows, which is how
+an N+1 regression shows up.
+"""
+from contextlib import contextmanager
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised when code runs more queries than its budget.
+    """
+
+
+@contextmanager
+def query_budget(max_queries, using=DEFAULT_DB_ALIAS):
+    """
+    Fail if the block (or decorated function) runs more than max_queries
+    queries. Yields the CaptureQueriesContext, so callers can inspect the
+    captured queries.
+    """
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+
+    if len(context) > max_queries:
+        queries = '\n'.join(
+            f'{number}. {query["sql"]}' for number, query in enumerate(context.captured_queries, start=1)
+        )
+        raise QueryBudgetExceeded(f'{len(context)} queries executed, budget is {max_queries}:\n{queries}')
+
+
+class QueryBudgetMixin:
+    """
+    TestCase mixin asserting per-endpoint query budgets at several data sizes.
+    """
+    budget_sizes = (10, 1000)
+
+    def assertQueryBudget(self, max_queries, run, setup=None, sizes=None):
+        """
+        For each size, call setup(size) outside the budget, then run() with
+        its result inside it. Fails if any run exceeds max_queries or if the
+        query count differs between sizes.
+        Returns {size: query count}.
+        """
+        counts = {}
+        for size in sizes or self.budget_sizes:
+            value = setup(size) if setup is not None else size
+            with self.subTest(size=size), query_budget(max_queries) as context:
+                run(value)
+            counts[size] = len(context)
+
+        self.assertEqual(
+            len(set(counts.values())), 1,
+            f'Query count depends on the number of rows: {counts}'
+        )
+        return counts
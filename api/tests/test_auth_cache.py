@@ -0,0 +1,211 @@
+import time
+from unittest import mock
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from api.authentication import TOKEN_VERSION_CLAIM, CachedJWTAuthentication
+from api.cache import status_cache, token_cache
+from api.models import Status as StatusModel
+
+
+@override_settings(AUTH_CACHE_TTL=60, AUTH_TOKEN_VERSIONS=True)
+class AuthCacheTestCase(TestCase):
+    """Test case for the cached JWT authentication"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('status-list')
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+
+        StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        status_cache.all()
+        token_cache.invalidate()
+
+    def _token(self, username='testuser', password='testpass'):
+        response = self.client.post(
+            reverse('token_obtain_pair'),
+            {'username': username, 'password': password},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['access']
+
+    def _get(self, token, url=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url or self.url, HTTP_AUTHORIZATION=f'Bearer {token}')
+        user_queries = [query for query in queries.captured_queries if '"auth_user"' in query['sql']]
+        return response, user_queries
+
+    def test_cached_token_skips_user_query(self):
+        """Test a repeated token is authenticated without loading the user"""
+        token = self._token()
+
+        response, user_queries = self._get(token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(user_queries), 1)
+
+        response, user_queries = self._get(token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(user_queries, [])
+
+    def test_tampered_token_rejected(self):
+        """Test a token with a cached jti but a different signature is rejected"""
+        token = self._token()
+        self._get(token)
+
+        header, payload, signature = token.split('.')
+        forged = f'{header}.{payload}.{signature[:-4]}AAAA'
+        response, _ = self._get(forged)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_malformed_token_rejected(self):
+        """Test a token that is not a JWT is rejected"""
+        response, _ = self._get('not-a-token')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_revokes_token(self):
+        """Test tokens issued before a password change are rejected"""
+        token = self._token()
+        self._get(token)
+
+        self.user.set_password('newpass')
+        self.user.save()
+        response, _ = self._get(token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['code'], 'token_revoked')
+
+    def test_token_issued_after_revocation_accepted(self):
+        """Test a token issued right after a password change, in the same second, is accepted"""
+        self.user.set_password('newpass')
+        self.user.save()
+        token = self._token(password='newpass')
+
+        response, _ = self._get(token)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_refreshed_token_revoked(self):
+        """Test an access token refreshed from a revoked refresh token is rejected"""
+        refresh = self.client.post(
+            reverse('token_obtain_pair'), {'username': 'testuser', 'password': 'testpass'}, format='json'
+        ).data['refresh']
+        self.user.set_password('newpass')
+        self.user.save()
+
+        access = self.client.post(reverse('token_refresh'), {'refresh': refresh}, format='json').data['access']
+        response, _ = self._get(access)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['code'], 'token_revoked')
+
+    def test_deactivation_revokes_token(self):
+        """Test tokens of a deactivated user are rejected"""
+        token = self._token()
+        self._get(token)
+
+        self.user.is_active = False
+        self.user.save()
+        response, _ = self._get(token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_update_refreshes_cached_user(self):
+        """Test other user changes are visible on the next request"""
+        token = self._token()
+        self._get(token)
+
+        self.user.is_staff = True
+        self.user.save()
+        response, user_queries = self._get(token, url=reverse('list-cache-stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(user_queries), 1)
+
+    def test_login_does_not_flush_cache(self):
+        """Test the last_login update on token issuance keeps cached tokens"""
+        token = self._token()
+        self._get(token)
+
+        self._token()
+        _, user_queries = self._get(token)
+
+        self.assertEqual(user_queries, [])
+
+    @override_settings(AUTH_CACHE_TTL=1)
+    def test_entry_expires_after_ttl(self):
+        """Test cached tokens are verified again after the TTL"""
+        token = self._token()
+        self._get(token)
+
+        with mock.patch('api.cache.tokens.time.time', return_value=time.time() + 2):
+            _, user_queries = self._get(token)
+
+        self.assertEqual(len(user_queries), 1)
+
+    @override_settings(AUTH_CACHE_TTL=0)
+    def test_cache_disabled(self):
+        """Test AUTH_CACHE_TTL=0 loads the user on every request"""
+        token = self._token()
+        self._get(token)
+        _, user_queries = self._get(token)
+
+        self.assertEqual(len(user_queries), 1)
+
+    @override_settings(AUTH_CACHE_MAX_SIZE=1)
+    def test_lru_evicts_oldest_token(self):
+        """Test the cache keeps at most AUTH_CACHE_MAX_SIZE tokens"""
+        first = self._token()
+        second = self._token('admin', 'adminpass')
+        self._get(first)
+        self._get(second)
+
+        _, user_queries = self._get(first)
+
+        self.assertEqual(len(user_queries), 1)
+
+    @override_settings(AUTH_TOKEN_USER=True, AUTH_CACHE_TTL=0)
+    def test_token_user_mode_skips_user_query(self):
+        """Test token-user mode authenticates from the token claims"""
+        token = self._token('admin', 'adminpass')
+        response, user_queries = self._get(token, url=reverse('list-cache-stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(user_queries, [])
+
+    @override_settings(AUTH_TOKEN_USER=True, AUTH_CACHE_TTL=0)
+    def test_token_user_mode_checks_claims(self):
+        """Test token-user mode enforces staff-only permissions from claims"""
+        token = self._token()
+        response, _ = self._get(token, url=reverse('list-cache-stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(AUTH_TOKEN_VERSIONS=False, AUTH_CACHE_TTL=0)
+    def test_token_versions_off_without_shared_cache(self):
+        """Test tokens carry no version and deactivation is refused from auth_user"""
+        token = self._token()
+        self.assertNotIn(TOKEN_VERSION_CLAIM, AccessToken(token))
+
+        self.user.set_password('newpass')
+        self.user.save()
+        self.assertEqual(token_cache.user_version(self.user.pk), 0)
+
+        self.user.is_active = False
+        self.user.save()
+        response, _ = self._get(token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_id_of_malformed_token(self):
+        """Test the jti is not read from malformed tokens"""
+        self.assertIsNone(CachedJWTAuthentication.get_token_id(b'abc'))
+        self.assertIsNone(CachedJWTAuthentication.get_token_id(b'a.!!!.c'))
@@ -0,0 +1,135 @@
+import random
+from django.test import LiveServerTestCase, TestCase
+from django.utils import timezone
+from api.benchmarks import (
+    SCENARIOS, BenchmarkContext, InProcessRunner, LiveRunner, compare, copy_tasks,
+    percentiles, run_scenarios, seed_statuses, seed_user,
+)
+from api.benchmarks.seed import TaskRows
+from api.models import Task, Status as StatusModel
+from api.pagination.counts import counter_table_count
+
+
+class BenchmarkSeedTestCase(TestCase):
+    """Test case for the benchmark data generator"""
+
+    def test_seed_statuses_reuses_defaults(self):
+        """Test the default statuses are reused and extra ones generated"""
+        existing = StatusModel.objects.create(name='Por Hacer', hexa_color='#000000')
+
+        statuses = seed_statuses(6)
+
+        self.assertEqual(len(statuses), 6)
+        self.assertEqual(statuses[0], existing)
+        self.assertEqual(statuses[2].name, 'Completado')
+        self.assertEqual(statuses[5].name, 'Estado 6')
+        self.assertEqual(StatusModel.objects.count(), 6)
+
+    def test_task_rows_reads_in_chunks(self):
+        """Test the COPY source yields every row across partial reads"""
+        rows = TaskRows(25, [1, 2], random.Random(0), timezone.now())
+
+        data = ''
+        while chunk := rows.read(100):
+            data += chunk
+
+        self.assertEqual(data.count('\n'), 25)
+        self.assertTrue(all(len(line.split('\t')) == 5 for line in data.splitlines()))
+
+    def test_copy_tasks(self):
+        """Test tasks are loaded with COPY in batches and counted by the triggers"""
+        statuses = seed_statuses(4)
+        batches = []
+
+        inserted = copy_tasks(250, statuses, batch_size=100, progress=batches.append)
+
+        self.assertEqual(inserted, 250)
+        self.assertEqual(batches, [100, 200, 250])
+        self.assertEqual(Task.objects.count(), 250)
+        self.assertEqual(counter_table_count(), 250)
+        self.assertFalse(Task.objects.filter(search_vector__isnull=True).exists())
+        self.assertFalse(Task.objects.exclude(status__in=statuses).exists())
+
+    def test_copy_tasks_is_deterministic(self):
+        """Test the same seed generates the same tasks"""
+        statuses = seed_statuses(4)
+        copy_tasks(20, statuses, seed=7)
+        first = list(Task.objects.order_by('pk').values_list('name', 'content', 'status'))
+        Task.objects.all().delete()
+
+        copy_tasks(20, statuses, seed=7)
+        second = list(Task.objects.order_by('pk').values_list('name', 'content', 'status'))
+
+        self.assertEqual(first, second)
+
+
+class BenchmarkRunnerTestCase(TestCase):
+    """Test case for the benchmark scenarios and runners"""
+
+    def setUp(self):
+        """Set up test data"""
+        seed_statuses(4)
+        copy_tasks(100, StatusModel.objects.all())
+        self.user = seed_user()
+        self.context = BenchmarkContext.load(sample=20)
+
+    def test_context_samples_existing_tasks(self):
+        """Test sampled task ids exist"""
+        self.assertTrue(self.context.task_ids)
+        self.assertEqual(Task.objects.filter(pk__in=self.context.task_ids).count(), len(self.context.task_ids))
+        self.assertEqual(len(self.context.status_ids), 4)
+
+    def test_inprocess_runs_every_scenario(self):
+        """Test every scenario succeeds in-process"""
+        runner = InProcessRunner(self.context, self.user, requests=3, warmup=1)
+
+        report = run_scenarios(runner, SCENARIOS.values())
+
+        self.assertEqual(report['mode'], 'inprocess')
+        self.assertEqual(report['dataset'], {'tasks': 100, 'statuses': 4})
+        self.assertEqual(set(report['scenarios']), set(SCENARIOS))
+        for name, result in report['scenarios'].items():
+            self.assertEqual(result['requests'], 3, name)
+            self.assertEqual(sum(result['status_codes'].values()), 3, name)
+            self.assertTrue(all(code.startswith('2') for code in result['status_codes']), name)
+            self.assertEqual(set(result['latency_ms']), {'p50', 'p90', 'p95', 'p99', 'max', 'mean'})
+
+    def test_compare_reports_change(self):
+        """Test compare gives the relative change per scenario"""
+        baseline = {'scenarios': {'list': {'throughput': 100.0, 'latency_ms': {'p50': 10.0, 'p95': 20.0, 'p99': 40.0}}}}
+        current = {'scenarios': {
+            'list': {'throughput': 150.0, 'latency_ms': {'p50': 5.0, 'p95': 20.0, 'p99': 40.0}},
+            'detail': {'throughput': 10.0, 'latency_ms': {}},
+        }}
+
+        comparison = compare(baseline, current)
+
+        self.assertEqual(list(comparison), ['list'])
+        self.assertAlmostEqual(comparison['list']['throughput']['change'], 0.5)
+        self.assertAlmostEqual(comparison['list']['p50']['change'], -0.5)
+
+    def test_percentiles(self):
+        """Test percentiles are reported in milliseconds"""
+        result = percentiles([i / 1000 for i in range(1, 101)])
+
+        self.assertAlmostEqual(result['p50'], 51.0)
+        self.assertAlmostEqual(result['p95'], 96.0)
+        self.assertAlmostEqual(result['max'], 100.0)
+
+
+class BenchmarkLiveTestCase(LiveServerTestCase):
+    """Test case for running scenarios against a live server"""
+
+    def test_live_runner(self):
+        """Test the load generator drives authenticated scenarios"""
+        seed_statuses(4)
+        copy_tasks(20, StatusModel.objects.all())
+        seed_user()
+        runner = LiveRunner(BenchmarkContext.load(sample=5), self.live_server_url, concurrency=2, duration=0.5)
+
+        report = run_scenarios(runner, [SCENARIOS['detail']])
+
+        result = report['scenarios']['detail']
+        self.assertEqual(result['errors'], 0)
+        self.assertGreater(result['requests'], 0)
+        self.assertEqual(list(result['status_codes']), ['200'])
@@ -0,0 +1,204 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.cache import status_cache
+from api.models import Task, Status as StatusModel
+
+
+class ConditionalGetTestCase(TestCase):
+    """Test case for ETag / Last-Modified handling on tasks and statuses"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+        self.status_completed = StatusModel.objects.create(
+            name='Completado',
+            hexa_color='#10B981'
+        )
+
+        # Create test tasks
+        self.task = Task.objects.create(name='Task 1', content='Content 1', status=self.status_pending)
+        Task.objects.create(name='Task 2', content='Content 2', status=self.status_pending)
+
+        self.list_url = reverse('task-list')
+        self.detail_url = reverse('task-detail', kwargs={'pk': self.task.id})
+
+    def test_list_sends_validators(self):
+        """Test task lists carry ETag and Last-Modified"""
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertIn('Last-Modified', response)
+
+    @override_settings(LIST_CACHE_TIMEOUT=300)
+    def test_list_not_modified(self):
+        """Test a matching If-None-Match returns 304 without serializing"""
+        etag = self.client.get(self.list_url)['ETag']
+        status_cache.all()
+
+        # validators come from the list cache
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    @override_settings(LIST_CACHE_TIMEOUT=0)
+    def test_list_not_modified_uncached(self):
+        """Test an uncached 304 runs the page query only, for full and compact lists"""
+        status_cache.all()
+        for params in ({}, {'compact': 'true'}):
+            etag = self.client.get(self.list_url, params)['ETag']
+
+            with self.assertNumQueries(1):
+                response = self.client.get(self.list_url, params, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_if_modified_since(self):
+        """Test If-Modified-Since returns 304 while nothing changed"""
+        last_modified = self.client.get(self.list_url)['Last-Modified']
+
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_etag_changes_on_write(self):
+        """Test creates, updates, deletes and status renames change the list ETag"""
+        etags = [self.client.get(self.list_url)['ETag']]
+
+        Task.objects.create(name='Task 3', content='Content 3', status=self.status_pending)
+        etags.append(self.client.get(self.list_url)['ETag'])
+
+        self.task.name = 'Renamed'
+        self.task.save()
+        etags.append(self.client.get(self.list_url)['ETag'])
+
+        Task.objects.filter(name='Task 2').delete()
+        etags.append(self.client.get(self.list_url)['ETag'])
+
+        self.status_pending.name = 'Pendiente'
+        self.status_pending.save()
+        etags.append(self.client.get(self.list_url)['ETag'])
+
+        self.assertEqual(len(set(etags)), len(etags))
+
+    def test_list_etag_changes_on_mark_complete(self):
+        """Test marking tasks complete changes the list ETag"""
+        etag = self.client.get(self.list_url)['ETag']
+        self.client.post(reverse('mark-tasks-as-complete'), {'task_ids': [self.task.id]}, format='json')
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_etag_depends_on_filters(self):
+        """Test the ETag is computed for the filtered queryset"""
+        etag = self.client.get(self.list_url, {'status': self.status_completed.id})['ETag']
+        Task.objects.create(name='Task 3', content='Content 3', status=self.status_pending)
+
+        response = self.client.get(
+            self.list_url, {'status': self.status_completed.id}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_detail_not_modified(self):
+        """Test a matching If-None-Match on a task returns 304"""
+        etag = self.client.get(self.detail_url)['ETag']
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_detail_modified(self):
+        """Test a changed task returns 200 and a new ETag"""
+        etag = self.client.get(self.detail_url)['ETag']
+        self.task.content = 'Changed'
+        self.task.save()
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_detail_with_fields_does_not_load_deferred_columns(self):
+        """Test detail validators are read without extra queries under ?fields="""
+        status_cache.all()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, {'fields': 'name'})
+
+        self.assertEqual(response.data, {'name': 'Task 1'})
+        self.assertIn('ETag', response)
+
+    def test_if_match_allows_update(self):
+        """Test a write with the current ETag succeeds and returns the new ETag"""
+        etag = self.client.get(self.detail_url)['ETag']
+        data = {'name': 'Updated', 'content': 'Content 1', 'status': self.status_pending.id}
+
+        response = self.client.put(self.detail_url, data, format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response['ETag'], self.client.get(self.detail_url)['ETag'])
+
+    def test_if_match_stale_returns_412(self):
+        """Test a write with a stale ETag is rejected"""
+        etag = self.client.get(self.detail_url)['ETag']
+        self.task.name = 'Changed elsewhere'
+        self.task.save()
+
+        response = self.client.patch(self.detail_url, {'name': 'Mine'}, format='json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.name, 'Changed elsewhere')
+
+    def test_if_match_stale_blocks_delete(self):
+        """Test a delete with a stale ETag is rejected"""
+        response = self.client.delete(self.detail_url, HTTP_IF_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertTrue(Task.objects.filter(id=self.task.id).exists())
+
+    def test_status_list_not_modified(self):
+        """Test GET /api/status/ answers 304 from the cache"""
+        url = reverse('status-list')
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.status_completed.hexa_color = '#000000'
+        self.status_completed.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    def test_status_detail_if_match(self):
+        """Test status writes honor If-Match"""
+        url = reverse('status-detail', kwargs={'pk': self.status_pending.id})
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        data = {'name': 'Pendiente', 'hexa_color': '#6B7280'}
+        self.assertEqual(self.client.put(url, data, format='json', HTTP_IF_MATCH=etag).status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.client.put(url, data, format='json', HTTP_IF_MATCH=etag).status_code,
+            status.HTTP_412_PRECONDITION_FAILED
+        )
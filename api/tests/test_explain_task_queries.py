@@ -0,0 +1,30 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from api.models import Task, Status as StatusModel
+
+
+class ExplainTaskQueriesTestCase(TestCase):
+    """Test case for the explain_task_queries management command"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+
+    def test_every_query_shape_uses_an_index(self):
+        """Test the list query shapes avoid sequential scans on a seeded table"""
+        out = StringIO()
+        call_command('explain_task_queries', rows=50000, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('Every query shape uses an index', output)
+        self.assertNotIn('Seq Scan', output)
+
+    def test_seeded_rows_are_rolled_back(self):
+        """Test the command leaves no seeded tasks behind"""
+        call_command('explain_task_queries', rows=20000, stdout=StringIO())
+
+        self.assertEqual(Task.objects.count(), 0)
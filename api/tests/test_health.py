@@ -0,0 +1,40 @@
+from unittest import mock
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+
+class HealthCheckTestCase(TestCase):
+    """Test case for the async health check endpoint"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.url = reverse('health-check')
+
+    def test_healthy(self):
+        """Test the health check reports a connected database"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['status'], 'healthy')
+
+    async def test_healthy_async(self):
+        """Test the health check runs under the async client"""
+        response = await self.async_client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['database'], 'connected')
+
+    def test_database_down(self):
+        """Test the health check returns 503 when the database is unreachable"""
+        with mock.patch('api.views.health.check_database', side_effect=Exception('unreachable')):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.json()['message'], 'unreachable')
+
+    def test_method_not_allowed(self):
+        """Test the health check only answers GET"""
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
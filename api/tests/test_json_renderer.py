@@ -0,0 +1,104 @@
+import io
+import json
+import uuid
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.models import Task, Status as StatusModel
+from api.parsers import FastJSONParser, fast_json as fast_json_parser
+from api.renderers import FastJSONRenderer, fast_json as fast_json_renderer
+
+
+class FastJSONTestCase(TestCase):
+    """Test case for the orjson-backed renderer and parser"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test status
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+
+    def test_matches_drf_renderer_output(self):
+        """Test datetimes, Decimals, UUIDs and lazy strings render like DRF"""
+        data = {
+            'created_at': datetime(2025, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc),
+            'naive': datetime(2025, 1, 2, 3, 4, 5),
+            'day': date(2025, 1, 2),
+            'amount': Decimal('1.50'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'label': gettext_lazy('Tarea'),
+            'name': 'Tarea número 1 ✓',
+            'items': [1, 2.5, None, True],
+        }
+
+        fast = FastJSONRenderer().render(data)
+
+        self.assertEqual(json.loads(fast), json.loads(JSONRenderer().render(data)))
+        self.assertIn(b'"2025-01-02T03:04:05.123456Z"', fast)
+
+    def test_renders_none_as_empty_body(self):
+        """Test an empty response renders no bytes"""
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_indent_falls_back_to_drf(self):
+        """Test indented output is delegated to DRF's renderer"""
+        rendered = FastJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+        self.assertEqual(rendered, b'{\n    "a": 1\n}')
+
+    def test_falls_back_without_orjson(self):
+        """Test the renderer and parser work when orjson is not installed"""
+        with mock.patch.object(fast_json_renderer, 'orjson', None), \
+                mock.patch.object(fast_json_parser, 'orjson', None):
+            rendered = FastJSONRenderer().render({'name': 'Tarea'})
+            parsed = FastJSONParser().parse(io.BytesIO(b'{"name": "Tarea"}'))
+
+        self.assertEqual(rendered, JSONRenderer().render({'name': 'Tarea'}))
+        self.assertEqual(parsed, {'name': 'Tarea'})
+
+    def test_parse_invalid_json(self):
+        """Test malformed bodies raise ParseError"""
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"name": '))
+
+    def test_task_list_response(self):
+        """Test the task list is rendered by the fast renderer"""
+        Task.objects.create(name='Task', content='Content', status=self.status_pending)
+
+        response = self.client.get(reverse('task-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+        self.assertEqual(response.json()['results'][0]['name'], 'Task')
+
+    def test_task_create_parses_json_body(self):
+        """Test POST bodies are parsed by the fast parser"""
+        response = self.client.post(
+            reverse('task-list'),
+            json.dumps({'name': 'Task', 'content': 'Content', 'status': self.status_pending.id}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['name'], 'Task')
+
+    def test_malformed_body_returns_400(self):
+        """Test malformed JSON bodies return 400"""
+        response = self.client.post(reverse('task-list'), '{"name": ', content_type='application/json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,169 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.cache import list_response_cache, status_cache
+from api.models import Task, Status as StatusModel
+
+
+@override_settings(LIST_CACHE_TIMEOUT=300)
+class ListCacheTestCase(TestCase):
+    """Test case for the list response cache on tasks and statuses"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+        self.status_completed = StatusModel.objects.create(
+            name='Completado',
+            hexa_color='#10B981'
+        )
+
+        # Create test tasks
+        self.task = Task.objects.create(name='Task 1', content='Content 1', status=self.status_pending)
+        Task.objects.create(name='Task 2', content='Content 2', status=self.status_pending)
+
+        self.url = reverse('task-list')
+        status_cache.all()
+
+    def _names(self, response):
+        return [task['name'] for task in response.data['results']]
+
+    def test_second_request_is_served_from_cache(self):
+        """Test an identical list request runs no queries"""
+        first = self.client.get(self.url, {'status': self.status_pending.id})
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {'status': self.status_pending.id})
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_query_string_is_normalized(self):
+        """Test parameter order and empty parameters share one entry"""
+        self.client.get(f'{self.url}?status={self.status_pending.id}&ordering=name')
+
+        response = self.client.get(f'{self.url}?ordering=name&search=&status={self.status_pending.id}')
+
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_entries_are_per_user(self):
+        """Test users do not share cache entries"""
+        self.client.get(self.url)
+        other = User.objects.create_user(username='other', password='testpass')
+        self.client.force_authenticate(user=other)
+
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+
+    def test_task_save_invalidates(self):
+        """Test saving a task is visible on the next list"""
+        self.client.get(self.url)
+        self.task.name = 'Renamed'
+        self.task.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn('Renamed', self._names(response))
+
+    def test_task_delete_invalidates(self):
+        """Test deleting a task is visible on the next list"""
+        self.client.get(self.url)
+        self.client.delete(reverse('task-detail', kwargs={'pk': self.task.id}))
+
+        self.assertNotIn('Task 1', self._names(self.client.get(self.url)))
+
+    def test_status_save_invalidates_task_lists(self):
+        """Test renaming a status refreshes the embedded status name"""
+        self.client.get(self.url)
+        self.status_pending.name = 'Pendiente'
+        self.status_pending.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['results'][0]['status_name'], 'Pendiente')
+
+    def test_mark_complete_invalidates(self):
+        """Test the queryset update in mark-as-complete invalidates task lists"""
+        self.client.get(self.url)
+        self.client.post(reverse('mark-tasks-as-complete'), {'task_ids': [self.task.id]}, format='json')
+
+        response = self.client.get(self.url)
+        statuses = {task['name']: task['status_name'] for task in response.data['results']}
+
+        self.assertEqual(statuses['Task 1'], 'Completado')
+
+    def test_bulk_invalidates_once(self):
+        """Test bulk writes invalidate task lists"""
+        self.client.get(self.url)
+        data = {
+            'create': [{'name': 'Task 3', 'content': 'Content 3', 'status': self.status_pending.id}],
+            'delete': [self.task.id],
+        }
+        self.client.post(reverse('task-bulk'), data, format='json')
+
+        self.assertEqual(sorted(self._names(self.client.get(self.url))), ['Task 2', 'Task 3'])
+
+    def test_status_list_cached_and_invalidated(self):
+        """Test GET /api/status/ is cached until a status is written"""
+        url = reverse('status-list')
+        self.client.get(url)
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+        StatusModel.objects.create(name='En Progreso', hexa_color='#F59E0B')
+        response = self.client.get(url)
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.data), 3)
+
+    def test_cached_response_honors_if_none_match(self):
+        """Test a cache hit still answers 304 for a current ETag"""
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_errors_are_not_cached(self):
+        """Test invalid requests are never cached"""
+        self.client.get(self.url, {'fields': 'secret'})
+        response = self.client.get(self.url, {'fields': 'secret'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(LIST_CACHE_TIMEOUT=0)
+    def test_disabled_with_zero_timeout(self):
+        """Test LIST_CACHE_TIMEOUT=0 turns the cache off"""
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+
+        self.assertNotIn('X-Cache', response)
+
+    def test_stats_endpoint(self):
+        """Test hit/miss counters are exposed to admins"""
+        before = list_response_cache.stats('task-list')['task-list']
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        self.assertEqual(self.client.get(reverse('list-cache-stats')).status_code, status.HTTP_403_FORBIDDEN)
+
+        admin = User.objects.create_superuser(username='admin', password='adminpass')
+        self.client.force_authenticate(user=admin)
+        response = self.client.get(reverse('list-cache-stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['task-list']['hits'], before['hits'] + 1)
+        self.assertEqual(response.data['task-list']['misses'], before['misses'] + 1)
+        self.assertIn('status-list', response.data)
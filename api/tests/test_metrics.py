@@ -0,0 +1,108 @@
+import re
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.metrics import Histogram, metrics_registry
+from api.models import Task, Status as StatusModel
+
+
+class RequestMetricsTestCase(TestCase):
+    """Test case for the request metrics middleware and /api/metrics/"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        for i in range(3):
+            Task.objects.create(name=f'Task {i}', content='Content', status=self.status_pending)
+
+        metrics_registry.reset()
+
+    def _timing(self, response, name):
+        match = re.search(rf'{name};dur=([\d.]+)', response['Server-Timing'])
+        return float(match.group(1))
+
+    def test_server_timing_header(self):
+        """Test responses carry query count and timings"""
+        response = self.client.get(reverse('task-list'))
+
+        self.assertIn('Server-Timing', response)
+        queries = int(re.search(r'desc="(\d+) queries"', response['Server-Timing']).group(1))
+        self.assertGreater(queries, 0)
+        self.assertGreater(self._timing(response, 'serializer'), 0)
+        self.assertGreater(self._timing(response, 'render'), 0)
+        self.assertGreaterEqual(self._timing(response, 'total'), self._timing(response, 'db'))
+
+    def test_routes_recorded(self):
+        """Test requests are recorded under their route name"""
+        self.client.get(reverse('task-list'))
+        self.client.get(reverse('task-list'))
+        self.client.post(reverse('mark-tasks-as-complete'), {'task_ids': [1]}, format='json')
+
+        requests, routes = metrics_registry.snapshot()
+
+        self.assertEqual(routes['task-list']['duration'].count, 2)
+        self.assertEqual(routes['mark-tasks-as-complete']['duration'].count, 1)
+        self.assertEqual(requests[('task-list', 'GET', 200)], 2)
+
+    def test_async_view_recorded(self):
+        """Test the async health check is recorded"""
+        response = self.client.get(reverse('health-check'))
+
+        self.assertIn('Server-Timing', response)
+        self.assertEqual(metrics_registry.snapshot()[1]['health-check']['duration'].count, 1)
+
+    def test_metrics_endpoint(self):
+        """Test /api/metrics/ exposes the histograms in Prometheus format"""
+        self.client.get(reverse('task-list'))
+        self.client.force_authenticate(user=User.objects.create_superuser(username='admin', password='adminpass'))
+        response = self.client.get(reverse('metrics'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = response.content.decode()
+        self.assertIn('# TYPE api_request_duration_seconds histogram', body)
+        self.assertIn('api_request_duration_seconds_count{route="task-list"} 1', body)
+        self.assertIn('api_request_duration_seconds_bucket{route="task-list",le="+Inf"} 1', body)
+        self.assertIn('api_request_duration_quantile_seconds{route="task-list",quantile="0.99"}', body)
+        self.assertIn('api_requests_total{route="task-list",method="GET",status="200"} 1', body)
+        self.assertIn('api_list_cache_requests_total{list="task-list",result="miss"}', body)
+
+    def test_metrics_staff_only_without_token(self):
+        """Test /api/metrics/ is refused to anonymous and non-staff users without METRICS_TOKEN"""
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_metrics_token(self):
+        """Test /api/metrics/ requires METRICS_TOKEN when set"""
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(REQUEST_METRICS_ENABLED=False)
+    def test_disabled(self):
+        """Test nothing is recorded when metrics are disabled"""
+        response = self.client.get(reverse('task-list'))
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(metrics_registry.snapshot(), ({}, {}))
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_histogram_quantiles(self):
+        """Test quantiles are interpolated inside their bucket"""
+        histogram = Histogram((0.1, 0.2, 0.4))
+        for value in (0.05, 0.15, 0.15, 0.3):
+            histogram.observe(value)
+
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.15)
+        self.assertAlmostEqual(histogram.quantile(1.0), 0.4)
+        self.assertIsNone(Histogram((1,)).quantile(0.5))
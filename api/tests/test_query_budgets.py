@@ -0,0 +1,170 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.cache import status_cache
+from api.models import Task, Status as StatusModel
+from .query_budget import QueryBudgetExceeded, QueryBudgetMixin, query_budget
+
+
+@override_settings(LIST_CACHE_TIMEOUT=0)
+class QueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    """Test case for the query budgets of the task and status endpoints at 10 and 1,000 rows"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        self.status_progress = StatusModel.objects.create(name='En Progreso', hexa_color='#3B82F6')
+        self.status_completed = StatusModel.objects.create(name='Completado', hexa_color='#10B981')
+        status_cache.all()
+
+    def seed_tasks(self, size):
+        """Top the task table up to size rows and return their ids"""
+        missing = size - Task.objects.count()
+        Task.objects.bulk_create([
+            Task(name=f'Task {i}', content=f'Content {i}', status=self.status_pending)
+            for i in range(missing)
+        ])
+        return list(Task.objects.values_list('id', flat=True))
+
+    def _get(self, url, params=None):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def _post(self, url, data):
+        response = self.client.post(url, data, format='json')
+        self.assertIn(response.status_code, (status.HTTP_200_OK, status.HTTP_201_CREATED))
+        return response
+
+    def test_task_list(self):
+        """Test the task list is the page query alone"""
+        self.assertQueryBudget(
+            1,
+            lambda size: self.assertEqual(
+                len(self._get(reverse('task-list'), {'page_size': 500}).data['results']), min(size, 500)
+            ),
+            setup=lambda size: self.seed_tasks(size) and size,
+        )
+
+    def test_task_list_compact(self):
+        """Test compact task lists stay within the list budget"""
+        self.assertQueryBudget(
+            1,
+            lambda _: self._get(reverse('task-list'), {'page_size': 500, 'compact': 'true'}),
+            setup=self.seed_tasks,
+        )
+
+    def test_task_list_search_with_count(self):
+        """Test searches with ?count=true add only the count query"""
+        self.assertQueryBudget(
+            2,
+            lambda _: self._get(reverse('task-list'), {'page_size': 500, 'search': 'task', 'count': 'true'}),
+            setup=self.seed_tasks,
+        )
+
+    def test_task_detail(self):
+        """Test a task detail is one query"""
+        self.assertQueryBudget(
+            1,
+            lambda task_id: self._get(reverse('task-detail', kwargs={'pk': task_id})),
+            setup=lambda size: self.seed_tasks(size)[-1],
+        )
+
+    def test_task_create(self):
+        """Test creating a task is one insert"""
+        self.assertQueryBudget(
+            1,
+            lambda _: self._post(
+                reverse('task-list'),
+                {'name': 'New', 'content': 'Content', 'status': self.status_pending.id}
+            ),
+            setup=self.seed_tasks,
+        )
+
+    def test_bulk(self):
+        """Test bulk writes of 10 and 1,000 items run a fixed number of statements"""
+        def setup(size):
+            task_ids = self.seed_tasks(size * 2)
+            return {
+                'create': [
+                    {'name': f'New {i}', 'content': 'Content', 'status': self.status_pending.id}
+                    for i in range(size)
+                ],
+                'update': [{'id': task_id, 'status': self.status_progress.id} for task_id in task_ids[:size]],
+                'delete': task_ids[size:size * 2],
+            }
+
+        # savepoint, lock updated rows, insert, update, delete, release
+        self.assertQueryBudget(6, lambda data: self._post(reverse('task-bulk'), data), setup=setup)
+
+    def test_mark_as_complete(self):
+        """Test mark-as-complete is one statement for any number of ids"""
+        self.assertQueryBudget(
+            1,
+            lambda task_ids: self._post(reverse('mark-tasks-as-complete'), {'task_ids': task_ids}),
+            setup=self.seed_tasks,
+        )
+
+    def test_transition_by_filter(self):
+        """Test a filtered transition is the status lookup plus one statement"""
+        def setup(size):
+            self.seed_tasks(size)
+            Task.objects.update(status=self.status_pending)
+
+        self.assertQueryBudget(
+            2,
+            lambda _: self._post(
+                reverse('task-transition'),
+                {'status': self.status_progress.id, 'filter': {'status': self.status_pending.id}}
+            ),
+            setup=setup,
+        )
+
+    def test_task_stats(self):
+        """Test statistics are one query on the summary table"""
+        self.assertQueryBudget(1, lambda _: self._get(reverse('task-stats')), setup=self.seed_tasks)
+
+    def test_task_changes(self):
+        """Test the change feed runs the horizon, tasks and tombstones queries"""
+        self.assertQueryBudget(
+            3,
+            lambda _: self._get(reverse('task-changes'), {'page_size': 500}),
+            setup=self.seed_tasks,
+        )
+
+    def test_status_list(self):
+        """Test the status list is served from the status cache"""
+        self.assertQueryBudget(0, lambda _: self._get(reverse('status-list')), setup=self.seed_tasks)
+
+    def test_budget_exceeded(self):
+        """Test exceeding a budget fails with the executed queries"""
+        with self.assertRaisesMessage(QueryBudgetExceeded, '2 queries executed, budget is 1'):
+            with query_budget(1):
+                list(Task.objects.all())
+                list(StatusModel.objects.all())
+
+    def test_growing_query_count_detected(self):
+        """Test a query count that grows with the rows is reported as N+1"""
+        def load_statuses(_):
+            for task in Task.objects.all():
+                task.status.name
+
+        with self.assertRaisesMessage(AssertionError, 'Query count depends on the number of rows'):
+            self.assertQueryBudget(100, load_statuses, setup=self.seed_tasks, sizes=(1, 3))
+
+    def test_decorator(self):
+        """Test query_budget can decorate a function"""
+        @query_budget(1)
+        def count_tasks():
+            return Task.objects.count()
+
+        self.assertEqual(count_tasks(), 0)
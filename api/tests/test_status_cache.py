@@ -0,0 +1,148 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.cache import StatusCache, status_cache
+from api.models import Task, Status as StatusModel
+
+
+class StatusCacheTestCase(TestCase):
+    """Test case for the process-wide Status cache"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+        self.status_completed = StatusModel.objects.create(
+            name='Completado',
+            hexa_color='#10B981'
+        )
+
+    def test_lookup_by_id_and_name(self):
+        """Test statuses can be found by id and case-insensitive name"""
+        self.assertEqual(status_cache.get(self.status_pending.id), self.status_pending)
+        self.assertEqual(status_cache.get_by_name('COMPLETADO'), self.status_completed)
+        self.assertIsNone(status_cache.get(9999))
+        self.assertIsNone(status_cache.get_by_name('missing'))
+
+    def test_warm_cache_runs_no_queries(self):
+        """Test repeated lookups are served from memory"""
+        status_cache.all()
+
+        with self.assertNumQueries(0):
+            status_cache.get(self.status_pending.id)
+            status_cache.get_by_name('completado')
+            status_cache.all()
+
+    def test_invalidated_on_save(self):
+        """Test saving a status refreshes the cache"""
+        status_cache.all()
+        self.status_pending.name = 'Pendiente'
+        self.status_pending.save()
+
+        self.assertEqual(status_cache.get(self.status_pending.id).name, 'Pendiente')
+        self.assertIsNone(status_cache.get_by_name('Por Hacer'))
+
+    def test_invalidated_on_delete(self):
+        """Test deleting a status removes it from the cache"""
+        status_cache.all()
+        status_id = self.status_pending.id
+        self.status_pending.delete()
+
+        self.assertIsNone(status_cache.get(status_id))
+
+    def test_version_change_from_other_worker_reloads(self):
+        """Test a version bumped elsewhere forces a reload"""
+        status_cache.all()
+        # Simulate another worker writing without signals reaching this process
+        StatusModel.objects.filter(id=self.status_pending.id).update(hexa_color='#000000')
+        cache.set(StatusCache.version_key, 'other-worker', None)
+
+        self.assertEqual(status_cache.get(self.status_pending.id).hexa_color, '#000000')
+
+    def test_status_created_by_other_worker_found(self):
+        """Test a lookup miss reloads statuses created without a version change"""
+        status_cache.all()
+        # Simulate another worker whose version token this process cannot see
+        version = cache.get(StatusCache.version_key)
+        created = StatusModel.objects.create(name='En Revisión', hexa_color='#F59E0B')
+        cache.set(StatusCache.version_key, version, None)
+
+        self.assertEqual(status_cache.get(created.id), created)
+        self.assertEqual(status_cache.get_by_name('en revisión'), created)
+
+    @override_settings(STATUS_CACHE_TTL=0)
+    def test_reloaded_after_ttl(self):
+        """Test a copy older than STATUS_CACHE_TTL is reloaded"""
+        status_cache.all()
+        StatusModel.objects.filter(id=self.status_pending.id).update(name='Pendiente')
+
+        self.assertEqual(status_cache.get(self.status_pending.id).name, 'Pendiente')
+
+    def test_status_list_uses_cache(self):
+        """Test GET /api/status/ does not query the status table when warm"""
+        status_cache.all()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('status-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([s['name'] for s in response.data], ['Completado', 'Por Hacer'])
+
+    def test_status_detail_uses_cache(self):
+        """Test GET /api/status/{id}/ does not query when warm"""
+        status_cache.all()
+        url = reverse('status-detail', kwargs={'pk': self.status_completed.id})
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.data['name'], 'Completado')
+
+    def test_status_update_is_visible_immediately(self):
+        """Test updating through the API is reflected on the next read"""
+        url = reverse('status-detail', kwargs={'pk': self.status_pending.id})
+        self.client.get(url)
+
+        response = self.client.put(url, {'name': 'Pendiente', 'hexa_color': '#6B7280'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(url)
+        self.assertEqual(response.data['name'], 'Pendiente')
+
+    def test_task_create_validates_status_from_cache(self):
+        """Test task creation does not query the status table when warm"""
+        status_cache.all()
+        data = {'name': 'Task', 'content': 'Content', 'status': self.status_pending.id}
+
+        # insert only
+        with self.assertNumQueries(1):
+            response = self.client.post(reverse('task-list'), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['status_name'], 'Por Hacer')
+
+    def test_mark_complete_reads_status_from_cache(self):
+        """Test mark-as-complete finds the Completado status without a lookup query"""
+        task = Task.objects.create(name='Task', content='Content', status=self.status_pending)
+        status_cache.all()
+
+        # single UPDATE ... RETURNING
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                reverse('mark-tasks-as-complete'), {'task_ids': [task.id]}, format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 1)
@@ -0,0 +1,146 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.models import Task, TaskArchive, Status as StatusModel
+from api.pagination.counts import counter_table_count
+
+
+class TaskArchiveTestCase(TestCase):
+    """Test case for archive_tasks and ?include_archived="""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-list')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        self.status_completed = StatusModel.objects.create(name='Completado', hexa_color='#10B981')
+
+        # Old completed tasks (archivable), an old pending task and a recent completed task
+        now = timezone.now()
+        self.old_completed = [
+            self._create(f'Old done {i}', self.status_completed, now - timedelta(days=200 + i))
+            for i in range(5)
+        ]
+        self.old_pending = self._create('Old pending', self.status_pending, now - timedelta(days=300))
+        self.recent_completed = self._create('Recent done', self.status_completed, now - timedelta(days=1))
+
+    def _create(self, name, task_status, created_at):
+        task = Task.objects.create(name=name, content=f'Content of {name}', status=task_status)
+        Task.objects.filter(pk=task.pk).update(created_at=created_at, updated_at=created_at)
+        return task
+
+    def _archive(self, *args):
+        output = StringIO()
+        call_command('archive_tasks', *args, stdout=output)
+        return output.getvalue()
+
+    def test_archive_moves_old_completed_tasks(self):
+        """Test only old tasks in the archived status are moved, keeping their ids"""
+        output = self._archive('--days', '90', '--pause', '0')
+
+        self.assertIn('Archived 5 task(s)', output)
+        self.assertEqual(
+            set(TaskArchive.objects.values_list('id', flat=True)),
+            {task.id for task in self.old_completed},
+        )
+        self.assertEqual(set(Task.objects.values_list('id', flat=True)), {self.old_pending.id, self.recent_completed.id})
+        archived = TaskArchive.objects.get(pk=self.old_completed[0].pk)
+        self.assertEqual(archived.name, 'Old done 0')
+        self.assertIsNotNone(archived.search_vector)
+
+    def test_archive_in_batches(self):
+        """Test tasks are moved batch_size at a time"""
+        output = self._archive('--batch-size', '2', '--pause', '0')
+
+        self.assertIn('  2 task(s) archived', output)
+        self.assertIn('  4 task(s) archived', output)
+        self.assertIn('  5 task(s) archived', output)
+        self.assertEqual(TaskArchive.objects.count(), 5)
+
+    def test_archive_limit(self):
+        """Test --limit stops after that many tasks, oldest first"""
+        self._archive('--limit', '2', '--batch-size', '10')
+
+        self.assertEqual(
+            set(TaskArchive.objects.values_list('name', flat=True)),
+            {'Old done 4', 'Old done 3'},
+        )
+
+    def test_dry_run(self):
+        """Test --dry-run only counts"""
+        output = self._archive('--dry-run')
+
+        self.assertIn('5 task(s) would be archived', output)
+        self.assertEqual(TaskArchive.objects.count(), 0)
+
+    def test_unknown_status(self):
+        """Test an unknown status name is rejected"""
+        with self.assertRaisesMessage(CommandError, 'Status "Archivado" not found'):
+            self._archive('--status', 'Archivado')
+
+    def test_stats_cover_active_tasks(self):
+        """Test archived tasks leave the summary counters"""
+        self._archive()
+
+        self.assertEqual(counter_table_count(), 2)
+
+    def test_list_excludes_archived(self):
+        """Test lists cover active tasks unless include_archived is set"""
+        self.assertEqual(len(self.client.get(self.url).data['results']), 7)
+        self._archive()
+
+        response = self.client.get(self.url)
+        self.assertEqual([task['name'] for task in response.data['results']], ['Recent done', 'Old pending'])
+
+        response = self.client.get(self.url, {'include_archived': 'true'})
+        self.assertEqual(
+            [task['name'] for task in response.data['results']],
+            ['Recent done'] + [f'Old done {i}' for i in range(5)] + ['Old pending'],
+        )
+
+    def test_include_archived_with_filters_and_pagination(self):
+        """Test filters, search, cursors and counts work across both tables"""
+        self._archive()
+
+        response = self.client.get(self.url, {
+            'include_archived': 'true', 'status': self.status_completed.id, 'page_size': 4, 'count': 'true',
+        })
+        self.assertEqual(response.data['count'], 6)
+        names = [task['name'] for task in response.data['results']]
+        names += [task['name'] for task in self.client.get(response.data['next']).data['results']]
+        self.assertEqual(names, ['Recent done'] + [f'Old done {i}' for i in range(5)])
+
+        response = self.client.get(self.url, {'include_archived': 'true', 'search': 'done 3'})
+        self.assertEqual([task['name'] for task in response.data['results']], ['Old done 3'])
+
+    def test_retrieve_archived(self):
+        """Test archived tasks are readable only with include_archived"""
+        self._archive()
+        url = reverse('task-detail', kwargs={'pk': self.old_completed[0].pk})
+
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(url, {'include_archived': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status_name'], 'Completado')
+
+    def test_archived_tasks_are_read_only(self):
+        """Test writes ignore include_archived"""
+        self._archive()
+        url = reverse('task-detail', kwargs={'pk': self.old_completed[0].pk})
+
+        response = self.client.patch(f'{url}?include_archived=true', {'name': 'Changed'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(TaskArchive.objects.get(pk=self.old_completed[0].pk).name, 'Old done 0')
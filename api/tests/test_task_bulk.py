@@ -0,0 +1,179 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.models import Task, Status as StatusModel
+from api.cache import status_cache
+
+
+class TaskBulkTestCase(TestCase):
+    """Test case for POST /api/tasks/bulk/ endpoint"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-bulk')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+        self.status_completed = StatusModel.objects.create(
+            name='Completado',
+            hexa_color='#10B981'
+        )
+
+        # Create test tasks
+        self.task1 = Task.objects.create(
+            name='Task 1',
+            content='Content for task 1',
+            status=self.status_pending
+        )
+        self.task2 = Task.objects.create(
+            name='Task 2',
+            content='Content for task 2',
+            status=self.status_pending
+        )
+
+    def test_bulk_create(self):
+        """Test creating many tasks in one request"""
+        data = {
+            'create': [
+                {'name': f'Bulk {i}', 'content': f'Content {i}', 'status': self.status_pending.id}
+                for i in range(25)
+            ]
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created_count'], 25)
+        self.assertEqual(len(response.data['created']), 25)
+        self.assertEqual(
+            [item['id'] for item in response.data['created']],
+            list(Task.objects.filter(name__startswith='Bulk').order_by('id').values_list('id', flat=True))
+        )
+
+    def test_bulk_update(self):
+        """Test partially updating many tasks in one request"""
+        data = {
+            'update': [
+                {'id': self.task1.id, 'status': self.status_completed.id},
+                {'id': self.task2.id, 'name': 'Renamed'},
+            ]
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 2)
+        self.assertEqual(response.data['updated'], [{'id': self.task1.id}, {'id': self.task2.id}])
+
+        self.task1.refresh_from_db()
+        self.task2.refresh_from_db()
+        self.assertEqual(self.task1.status, self.status_completed)
+        self.assertEqual(self.task1.name, 'Task 1')
+        self.assertEqual(self.task2.name, 'Renamed')
+        self.assertGreater(self.task2.updated_at, self.task2.created_at)
+
+    def test_bulk_delete(self):
+        """Test deleting many tasks reports per-item results"""
+        data = {'delete': [self.task1.id, 9999]}
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['deleted_count'], 1)
+        self.assertEqual(response.data['deleted'], [
+            {'id': self.task1.id, 'deleted': True},
+            {'id': 9999, 'deleted': False},
+        ])
+        self.assertFalse(Task.objects.filter(id=self.task1.id).exists())
+
+    def test_bulk_mixed_operations(self):
+        """Test create, update and delete in the same request"""
+        data = {
+            'create': [{'name': 'New', 'content': 'New content', 'status': self.status_pending.id}],
+            'update': [{'id': self.task1.id, 'content': 'Updated content'}],
+            'delete': [self.task2.id],
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Task.objects.count(), 2)
+        self.assertTrue(Task.objects.filter(name='New').exists())
+        self.assertEqual(Task.objects.get(id=self.task1.id).content, 'Updated content')
+
+    def test_bulk_invalid_status_rejects_whole_batch(self):
+        """Test an invalid status on one item reports it and writes nothing"""
+        data = {
+            'create': [
+                {'name': 'Valid', 'content': 'Valid', 'status': self.status_pending.id},
+                {'name': 'Invalid', 'content': 'Invalid', 'status': 9999},
+            ]
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['create'][0], {})
+        self.assertIn('status', response.data['create'][1])
+        self.assertFalse(Task.objects.filter(name='Valid').exists())
+
+    def test_bulk_missing_fields(self):
+        """Test create items are validated like single creates"""
+        data = {'create': [{'name': 'No content', 'status': self.status_pending.id}]}
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('content', response.data['create'][0])
+
+    def test_bulk_update_not_found_rolls_back(self):
+        """Test updating a missing task fails the whole request"""
+        data = {
+            'create': [{'name': 'New', 'content': 'New content', 'status': self.status_pending.id}],
+            'update': [{'id': 9999, 'name': 'Ghost'}],
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('id', response.data['update'][0])
+        self.assertFalse(Task.objects.filter(name='New').exists())
+
+    def test_bulk_update_and_delete_same_task(self):
+        """Test a task cannot be updated and deleted in the same request"""
+        data = {
+            'update': [{'id': self.task1.id, 'name': 'Renamed'}],
+            'delete': [self.task1.id],
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_empty_request(self):
+        """Test request without operations returns 400"""
+        response = self.client.post(self.url, {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_query_count_is_constant(self):
+        """Test query count does not grow with the number of items"""
+        data = {
+            'create': [
+                {'name': f'Bulk {i}', 'content': 'Content', 'status': self.status_pending.id}
+                for i in range(50)
+            ],
+            'update': [
+                {'id': self.task1.id, 'status': self.status_completed.id},
+                {'id': self.task2.id, 'status': self.status_completed.id},
+            ],
+        }
+        # Statuses are resolved from the warmed status cache
+        status_cache.all()
+        # savepoint, lock updates, insert, update, release
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,168 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.models import Task, TaskTombstone, Status as StatusModel
+from api.pagination.changes import ChangeCursor
+
+
+class TaskChangesTestCase(TransactionTestCase):
+    """Test case for GET /api/tasks/changes/"""
+    # Each write must commit in its own transaction: the feed only returns
+    # changes of finished transactions
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-changes')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        self.status_completed = StatusModel.objects.create(name='Completado', hexa_color='#10B981')
+
+        self.tasks = [
+            Task.objects.create(name=f'Task {i}', content='Content', status=self.status_pending)
+            for i in range(3)
+        ]
+        self.ids = [task.id for task in self.tasks]
+
+    def _changes(self, since=None, **params):
+        if since:
+            params['since'] = since
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_initial_sync_returns_every_task(self):
+        """Test a call without since returns the current tasks"""
+        data = self._changes()
+
+        self.assertEqual([task['id'] for task in data['changes']], [task.id for task in self.tasks])
+        self.assertEqual(data['deleted'], [])
+        self.assertFalse(data['has_more'])
+        self.assertIn('status_name', data['changes'][0])
+
+    def test_no_changes_since_cursor(self):
+        """Test the next cursor returns nothing when nothing changed"""
+        cursor = self._changes()['next']
+
+        data = self._changes(cursor)
+
+        self.assertEqual(data['changes'], [])
+        self.assertEqual(data['deleted'], [])
+
+    def test_pagination(self):
+        """Test has_more and next page through the changes"""
+        first = self._changes(page_size=2)
+        second = self._changes(first['next'], page_size=2)
+
+        self.assertTrue(first['has_more'])
+        self.assertFalse(second['has_more'])
+        ids = [task['id'] for task in first['changes'] + second['changes']]
+        self.assertEqual(ids, [task.id for task in self.tasks])
+
+    def test_update_and_create_are_returned(self):
+        """Test created and updated tasks after the cursor are returned"""
+        cursor = self._changes()['next']
+        self.client.patch(reverse('task-detail', kwargs={'pk': self.tasks[1].id}), {'name': 'Renamed'}, format='json')
+        created = Task.objects.create(name='New', content='Content', status=self.status_pending)
+
+        data = self._changes(cursor)
+
+        self.assertEqual({task['id'] for task in data['changes']}, {self.tasks[1].id, created.id})
+        self.assertIn('Renamed', [task['name'] for task in data['changes']])
+
+    def test_raw_bulk_update_is_captured(self):
+        """Test mark-as-complete and queryset .update() are captured"""
+        cursor = self._changes()['next']
+        self.client.post(reverse('mark-tasks-as-complete'), {'task_ids': [self.tasks[0].id]}, format='json')
+        Task.objects.filter(pk=self.tasks[2].pk).update(content='Changed')
+
+        data = self._changes(cursor)
+
+        self.assertEqual([task['id'] for task in data['changes']], [self.tasks[0].id, self.tasks[2].id])
+        self.assertEqual(data['changes'][0]['status_name'], 'Completado')
+
+    def test_open_transaction_holds_back_later_changes(self):
+        """Test changes committed after a still-open transaction wait for it"""
+        cursor = self._changes()['next']
+        other = connections.create_connection('default')
+        try:
+            other.set_autocommit(False)
+            with other.cursor() as other_cursor:
+                other_cursor.execute("UPDATE task SET name = 'Slow' WHERE id = %s", [self.ids[0]])
+            Task.objects.filter(pk=self.ids[2]).update(name='Fast')
+
+            self.assertEqual(self._changes(cursor)['changes'], [])
+
+            other.commit()
+            data = self._changes(cursor)
+            self.assertEqual([task['name'] for task in data['changes']], ['Slow', 'Fast'])
+        finally:
+            other.rollback()
+            other.close()
+
+    def test_deletions_leave_tombstones(self):
+        """Test destroy and bulk deletes are returned as deletions"""
+        cursor = self._changes()['next']
+        self.client.delete(reverse('task-detail', kwargs={'pk': self.tasks[0].id}))
+        Task.objects.filter(pk=self.tasks[1].pk).delete()
+
+        data = self._changes(cursor)
+
+        self.assertEqual(data['changes'], [])
+        self.assertEqual([item['id'] for item in data['deleted']], [self.tasks[0].id, self.tasks[1].id])
+        self.assertEqual({item['reason'] for item in data['deleted']}, {'deleted'})
+
+    def test_archived_tasks_marked_as_archived(self):
+        """Test archive_tasks tombstones carry the archived reason"""
+        Task.objects.filter(pk=self.tasks[0].pk).update(
+            status=self.status_completed, created_at=timezone.now() - timedelta(days=200),
+            updated_at=timezone.now() - timedelta(days=200),
+        )
+        cursor = self._changes()['next']
+        call_command('archive_tasks', stdout=StringIO())
+        self.tasks[1].delete()
+
+        data = self._changes(cursor)
+
+        self.assertEqual(
+            [(item['id'], item['reason']) for item in data['deleted']],
+            [(self.ids[0], 'archived'), (self.ids[1], 'deleted')],
+        )
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor is rejected"""
+        response = self.client.get(self.url, {'since': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('since', response.data)
+
+    @override_settings(TASK_CHANGES_RETENTION_DAYS=1)
+    def test_expired_cursor(self):
+        """Test cursors older than the retention answer 410"""
+        cursor = ChangeCursor(1, 1, int(time.time()) - 2 * 86400).encode()
+
+        response = self.client.get(self.url, {'since': cursor})
+
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertEqual(response.data['detail'].code, 'cursor_expired')
+
+    def test_prune_tombstones(self):
+        """Test prune_task_tombstones drops tombstones past the retention"""
+        Task.objects.filter(pk__in=self.ids[:2]).delete()
+        TaskTombstone.objects.filter(task_id=self.ids[0]).update(deleted_at=timezone.now() - timedelta(days=60))
+
+        call_command('prune_task_tombstones', stdout=StringIO())
+
+        self.assertEqual(list(TaskTombstone.objects.values_list('task_id', flat=True)), [self.ids[1]])
@@ -0,0 +1,88 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.models import Task, Status as StatusModel
+
+
+class TaskCountTestCase(TestCase):
+    """Test case for ?count=true on GET /api/tasks/"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-list')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        self.status_completed = StatusModel.objects.create(name='Completado', hexa_color='#10B981')
+
+        # Create test tasks
+        for i in range(5):
+            Task.objects.create(name=f'Report {i}', content='Content', status=self.status_pending)
+        for i in range(3):
+            Task.objects.create(name=f'Meeting {i}', content='Content', status=self.status_completed)
+
+    def _get(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, ' '.join(query['sql'] for query in queries.captured_queries)
+
+    def test_count_not_returned_by_default(self):
+        """Test lists carry no count unless requested"""
+        response, _ = self._get({})
+
+        self.assertNotIn('count', response.data)
+
+    def test_unfiltered_count_from_counter_table(self):
+        """Test unfiltered lists are counted from the summary table"""
+        response, sql = self._get({'count': 'true', 'page_size': 2})
+
+        self.assertEqual(response.data['count'], 8)
+        self.assertFalse(response.data['count_approximate'])
+        self.assertIn('"task_daily_count"', sql)
+        self.assertNotIn('COUNT(*)', sql)
+
+    def test_status_count_from_counter_table(self):
+        """Test status-only filters are counted from the summary table"""
+        response, sql = self._get({'count': 'true', 'status': self.status_completed.id})
+
+        self.assertEqual(response.data['count'], 3)
+        self.assertIn('"task_daily_count"', sql)
+
+    def test_empty_filter_ignored(self):
+        """Test empty filter values count every task"""
+        response, _ = self._get({'count': 'true', 'status': ''})
+
+        self.assertEqual(response.data['count'], 8)
+
+    def test_filtered_count_exact_below_limit(self):
+        """Test other filters are counted exactly below the limit"""
+        response, sql = self._get({'count': 'true', 'search': 'report'})
+
+        self.assertEqual(response.data['count'], 5)
+        self.assertFalse(response.data['count_approximate'])
+        self.assertNotIn('"task_daily_count"', sql)
+
+    @override_settings(TASK_COUNT_EXACT_LIMIT=2)
+    def test_filtered_count_estimated_above_limit(self):
+        """Test filtered counts above the limit are planner estimates"""
+        response, sql = self._get({'count': 'true', 'search': 'report'})
+
+        self.assertTrue(response.data['count_approximate'])
+        self.assertGreater(response.data['count'], 2)
+        self.assertIn('EXPLAIN', sql)
+
+    def test_compact_count(self):
+        """Test compact lists can be counted"""
+        response, _ = self._get({'count': 'true', 'compact': 'true', 'search': 'meeting'})
+
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 3)
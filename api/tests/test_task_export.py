@@ -0,0 +1,135 @@
+import csv
+import io
+import json
+from unittest import mock
+from django.test import AsyncClient, TestCase
+from django.contrib.auth.models import User
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from api.models import Task, Status as StatusModel
+
+
+class TaskExportTestCase(TestCase):
+    """Test case for GET /api/tasks/export/ endpoint"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-export')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+        self.status_completed = StatusModel.objects.create(
+            name='Completado',
+            hexa_color='#10B981'
+        )
+
+        # Create test tasks
+        self.task1 = Task.objects.create(
+            name='Task 1',
+            content='Content for task 1',
+            status=self.status_pending
+        )
+        self.task2 = Task.objects.create(
+            name='Task 2',
+            content='Content, with "quotes"\nand a newline',
+            status=self.status_completed
+        )
+
+    def _body(self, response):
+        """Consume a streaming response body"""
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_export_ndjson_by_default(self):
+        """Test export streams one JSON object per task"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        rows = [json.loads(line) for line in self._body(response).splitlines()]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['name'], 'Task 2')
+        self.assertEqual(rows[0]['status'], self.status_completed.id)
+        self.assertEqual(rows[0]['status_name'], 'Completado')
+        self.assertEqual(rows[0]['status_color'], '#10B981')
+
+    def test_export_csv(self):
+        """Test CSV export includes header and properly quoted rows"""
+        response = self.client.get(self.url, {'export_format': 'csv'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('tasks.csv', response['Content-Disposition'])
+
+        rows = list(csv.DictReader(io.StringIO(self._body(response))))
+        self.assertEqual(len(rows), 2)
+        contents = {row['name']: row['content'] for row in rows}
+        self.assertEqual(contents['Task 2'], 'Content, with "quotes"\nand a newline')
+
+    def test_export_applies_filters(self):
+        """Test export honors list filters"""
+        response = self.client.get(self.url, {'status': self.status_pending.id})
+
+        rows = [json.loads(line) for line in self._body(response).splitlines()]
+        self.assertEqual([row['name'] for row in rows], ['Task 1'])
+
+    def test_export_applies_search_and_ordering(self):
+        """Test export honors search and ordering"""
+        response = self.client.get(self.url, {'search': 'task', 'ordering': 'name'})
+
+        rows = [json.loads(line) for line in self._body(response).splitlines()]
+        self.assertEqual([row['name'] for row in rows], ['Task 1', 'Task 2'])
+
+    def test_export_is_not_paginated(self):
+        """Test export returns every matching task regardless of page size"""
+        for i in range(60):
+            Task.objects.create(name=f'Bulk {i}', content='Bulk', status=self.status_pending)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(self._body(response).splitlines()), 62)
+
+    def test_export_without_server_side_cursors(self):
+        """Test export works when server-side cursors are disabled (pgbouncer mode)"""
+        with mock.patch.dict(connection.settings_dict, {'DISABLE_SERVER_SIDE_CURSORS': True}):
+            response = self.client.get(self.url)
+            body = self._body(response)
+
+        self.assertEqual(len(body.splitlines()), 2)
+
+    async def test_export_streams_asynchronously_under_asgi(self):
+        """Test ASGI exports stream from an async iterator instead of being read into a list"""
+        token = AccessToken.for_user(self.user)
+        response = await AsyncClient().get(
+            self.url, {'export_format': 'csv'}, headers={'Authorization': f'Bearer {token}'}
+        )
+
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode('utf-8')
+        self.assertEqual(len(list(csv.reader(io.StringIO(body)))), 3)
+
+    def test_export_invalid_format(self):
+        """Test unknown export format returns 400"""
+        response = self.client.get(self.url, {'export_format': 'xml'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_requires_authentication(self):
+        """Test export without authentication returns 401"""
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,128 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.cache import status_cache
+from api.models import Task, Status as StatusModel
+
+
+class TaskFieldsTestCase(TestCase):
+    """Test case for sparse fieldsets and compact lists on /api/tasks/"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-list')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+
+        # Create test tasks
+        for i in range(5):
+            Task.objects.create(
+                name=f'Task {i}',
+                content=f'Content for task {i}',
+                status=self.status_pending
+            )
+
+    def _get_with_queries(self, params, url=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url or self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, ' '.join(query['sql'] for query in queries.captured_queries)
+
+    def test_fields_limits_response(self):
+        """Test ?fields= returns only the listed fields"""
+        response, _ = self._get_with_queries({'fields': 'id,name,status'})
+
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name', 'status'})
+
+    def test_omit_drops_fields(self):
+        """Test ?omit= removes the listed fields"""
+        response, _ = self._get_with_queries({'omit': 'content,status_color'})
+
+        first = response.data['results'][0]
+        self.assertNotIn('content', first)
+        self.assertNotIn('status_color', first)
+        self.assertIn('status_name', first)
+
+    def test_unknown_field_returns_400(self):
+        """Test unknown field names are rejected"""
+        response = self.client.get(self.url, {'fields': 'id,secret'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('fields', response.data)
+
+    def test_content_column_not_fetched(self):
+        """Test content is not selected unless requested"""
+        _, sql = self._get_with_queries({'fields': 'id,name,status'})
+
+        self.assertNotIn('"task"."content"', sql)
+        self.assertNotIn('JOIN "status"', sql)
+
+    def test_status_join_only_when_needed(self):
+        """Test status details are joined when requested"""
+        response, sql = self._get_with_queries({'fields': 'id,status_name'})
+
+        self.assertIn('JOIN "status"', sql)
+        self.assertNotIn('"task"."content"', sql)
+        self.assertEqual(response.data['results'][0]['status_name'], 'Por Hacer')
+
+    def test_sparse_pagination_skips_deferred_columns(self):
+        """Test cursor positions do not load deferred ordering columns"""
+        status_cache.all()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'fields': 'name', 'page_size': 2, 'ordering': 'updated_at'})
+
+        self.assertIsNotNone(response.data['next'])
+        names = [task['name'] for task in self.client.get(response.data['next']).data['results']]
+        self.assertEqual(names, ['Task 2', 'Task 3'])
+
+    def test_retrieve_with_fields(self):
+        """Test detail responses honor ?fields="""
+        task = Task.objects.first()
+        url = reverse('task-detail', kwargs={'pk': task.id})
+        response, sql = self._get_with_queries({'fields': 'id,name'}, url=url)
+
+        self.assertEqual(response.data, {'id': task.id, 'name': task.name})
+        self.assertNotIn('"task"."content"', sql)
+
+    def test_writes_ignore_fields(self):
+        """Test ?fields= does not restrict write responses"""
+        data = {'name': 'New', 'content': 'New content', 'status': self.status_pending.id}
+        response = self.client.post(f'{self.url}?fields=id', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn('content', response.data)
+
+    def test_compact_matches_regular_list(self):
+        """Test compact mode returns the same rows as the regular list"""
+        regular = self.client.get(self.url).json()
+        compact = self.client.get(self.url, {'compact': 'true'}).json()
+
+        self.assertEqual(compact['results'], regular['results'])
+
+    def test_compact_with_fields(self):
+        """Test compact mode honors ?fields="""
+        response, sql = self._get_with_queries({'compact': 'true', 'fields': 'id,name'})
+
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name'})
+        self.assertNotIn('"task"."content"', sql)
+
+    def test_compact_pagination(self):
+        """Test compact pages can be followed with the cursor"""
+        response, _ = self._get_with_queries({'compact': 'true', 'fields': 'name', 'page_size': 3})
+        first = [task['name'] for task in response.data['results']]
+        second = [task['name'] for task in self.client.get(response.data['next']).data['results']]
+
+        self.assertEqual(first + second, [f'Task {i}' for i in reversed(range(5))])
@@ -55,7 +55,7 @@ class TaskGetTestCase(TestCase):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(response.data['results']), 3)
 
     def test_get_task_list_contains_correct_data(self):
         """Test GET request returns correct task data"""
@@ -64,7 +64,7 @@ class TaskGetTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Verify task names
-        task_names = [task['name'] for task in response.data]
+        task_names = [task['name'] for task in response.data['results']]
         self.assertIn('Task 1', task_names)
         self.assertIn('Task 2', task_names)
         self.assertIn('Task 3', task_names)
@@ -93,8 +93,8 @@ class TaskGetTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], 'Task 1')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['name'], 'Task 1')
 
     def test_search_tasks_by_name(self):
         """Test searching tasks by name"""
@@ -102,8 +102,8 @@ class TaskGetTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(len(response.data), 1)
-        task_names = [task['name'] for task in response.data]
+        self.assertGreaterEqual(len(response.data['results']), 1)
+        task_names = [task['name'] for task in response.data['results']]
         self.assertIn('Task 1', task_names)
 
     def test_search_tasks_by_content(self):
@@ -112,7 +112,7 @@ class TaskGetTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(len(response.data), 1)
+        self.assertGreaterEqual(len(response.data['results']), 1)
 
     def test_order_tasks_by_name(self):
         """Test ordering tasks by name"""
@@ -120,9 +120,9 @@ class TaskGetTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data[0]['name'], 'Task 1')
-        self.assertEqual(response.data[1]['name'], 'Task 2')
-        self.assertEqual(response.data[2]['name'], 'Task 3')
+        self.assertEqual(response.data['results'][0]['name'], 'Task 1')
+        self.assertEqual(response.data['results'][1]['name'], 'Task 2')
+        self.assertEqual(response.data['results'][2]['name'], 'Task 3')
 
     def test_order_tasks_by_name_descending(self):
         """Test ordering tasks by name descending"""
@@ -130,9 +130,9 @@ class TaskGetTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data[0]['name'], 'Task 3')
-        self.assertEqual(response.data[1]['name'], 'Task 2')
-        self.assertEqual(response.data[2]['name'], 'Task 1')
+        self.assertEqual(response.data['results'][0]['name'], 'Task 3')
+        self.assertEqual(response.data['results'][1]['name'], 'Task 2')
+        self.assertEqual(response.data['results'][2]['name'], 'Task 1')
 
     def test_task_response_includes_status_details(self):
         """Test that task response includes status name and color"""
@@ -140,7 +140,7 @@ class TaskGetTestCase(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        first_task = response.data[0]
+        first_task = response.data['results'][0]
         self.assertIn('status_name', first_task)
         self.assertIn('status_color', first_task)
         self.assertIsNotNone(first_task['status_name'])
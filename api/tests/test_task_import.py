@@ -0,0 +1,166 @@
+import io
+import json
+import tempfile
+from datetime import timedelta
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+from api.imports import TaskImporter, TaskImportError, read_csv, read_ndjson
+from api.models import Task, TaskArchive, Status as StatusModel
+from api.pagination.counts import counter_table_count
+
+
+class TaskImportTestCase(TestCase):
+    """Test case for the import_tasks command"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        self.status_completed = StatusModel.objects.create(name='Completado', hexa_color='#10B981')
+
+    def _import(self, content, suffix='.csv', *args):
+        with tempfile.NamedTemporaryFile('w', suffix=suffix, encoding='utf-8') as file:
+            file.write(content)
+            file.flush()
+            stdout = io.StringIO()
+            call_command('import_tasks', file.name, *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_import_csv(self):
+        """Test CSV rows are inserted with their status resolved by name"""
+        output = self._import(
+            'external_id,name,content,status,created_at\n'
+            'a-1,Task 1,Content 1,por hacer,2026-01-02T10:00:00Z\n'
+            'a-2,Task 2,Content 2,Completado,\n'
+        )
+
+        self.assertIn('2 inserted', output)
+        task = Task.objects.get(external_id='a-1')
+        self.assertEqual(task.status, self.status_pending)
+        self.assertEqual(task.created_at.isoformat(), '2026-01-02T10:00:00+00:00')
+        self.assertEqual(Task.objects.get(external_id='a-2').status, self.status_completed)
+        self.assertEqual(counter_table_count(), 2)
+
+    def test_import_ndjson(self):
+        """Test NDJSON records are inserted"""
+        lines = [
+            {'external_id': 'n-1', 'name': 'Task 1', 'content': 'Content 1', 'status': 'Por Hacer'},
+            {'name': 'Task 2', 'content': 'Content 2', 'status': 'Completado'},
+        ]
+        self._import('\n'.join(json.dumps(line) for line in lines) + '\n\n', '.ndjson')
+
+        self.assertEqual(Task.objects.count(), 2)
+        self.assertIsNone(Task.objects.get(name='Task 2').external_id)
+
+    def test_reimport_upserts_on_external_id(self):
+        """Test a second import updates changed rows and leaves the rest"""
+        header = 'external_id,name,content,status\n'
+        self._import(header + 'a-1,Task 1,Content 1,Por Hacer\na-2,Task 2,Content 2,Por Hacer\n')
+        unchanged = Task.objects.get(external_id='a-2')
+
+        output = self._import(header + 'a-1,Task 1,Content 1,Completado\na-2,Task 2,Content 2,Por Hacer\n,Loose,Content,Por Hacer\n')
+
+        self.assertIn('1 inserted, 1 updated, 1 unchanged', output)
+        self.assertEqual(Task.objects.count(), 3)
+        self.assertEqual(Task.objects.get(external_id='a-1').status, self.status_completed)
+        self.assertEqual(Task.objects.get(external_id='a-2').updated_at, unchanged.updated_at)
+        self.assertEqual(counter_table_count(status_id=self.status_completed.id), 1)
+
+    def test_archived_external_id_not_reimported(self):
+        """Test rows of archived tasks are counted and not inserted again"""
+        header = 'external_id,name,content,status\n'
+        self._import(header + 'a-1,Task 1,Content 1,Completado\n')
+        TaskArchive.objects.archive_batch([self.status_completed.id], timezone.now() + timedelta(days=1), 10)
+
+        output = self._import(header + 'a-1,Task 1,Changed,Completado\na-2,Task 2,Content 2,Por Hacer\n')
+
+        self.assertIn('1 inserted, 0 updated, 0 unchanged, 1 archived', output)
+        self.assertEqual(list(Task.objects.values_list('external_id', flat=True)), ['a-2'])
+        self.assertEqual(TaskArchive.objects.get(external_id='a-1').content, 'Content 1')
+
+    def test_duplicate_external_id_last_wins(self):
+        """Test the last occurrence of an external_id in one chunk wins"""
+        self._import('external_id,name,content,status\nd-1,First,C,Por Hacer\nd-1,Second,C,Por Hacer\n')
+
+        self.assertEqual(list(Task.objects.values_list('name', flat=True)), ['Second'])
+
+    def test_special_characters_round_trip(self):
+        """Test quotes, tabs, newlines and backslashes survive COPY"""
+        content = 'Line 1\nLine "2"\twith \\N and , commas'
+        self._import(json.dumps({'name': 'Special', 'content': content, 'status': 'Por Hacer'}) + '\n', '.ndjson')
+
+        self.assertEqual(Task.objects.get(name='Special').content, content)
+
+    def test_empty_content_is_not_null(self):
+        """Test an empty content is stored as an empty string"""
+        self._import('name,content,status\nEmpty,,Por Hacer\n')
+
+        self.assertEqual(Task.objects.get(name='Empty').content, '')
+
+    def test_invalid_row_stops_import(self):
+        """Test an unknown status aborts with the line number"""
+        with self.assertRaisesMessage(CommandError, 'line 3: unknown status "Archivado"'):
+            self._import('name,content,status\nOk,C,Por Hacer\nBad,C,Archivado\n')
+
+    def test_skip_invalid(self):
+        """Test --skip-invalid skips bad rows and imports the rest"""
+        output = self._import('name,content,status\nOk,C,Por Hacer\nBad,C,Archivado\n,C,Por Hacer\n', '.csv', '--skip-invalid')
+
+        self.assertIn('1 inserted', output)
+        self.assertIn('2 skipped', output)
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_batches(self):
+        """Test rows are loaded in batch_size chunks"""
+        records = read_ndjson(io.StringIO(''.join(
+            json.dumps({'external_id': f'b-{i}', 'name': f'Task {i}', 'content': 'C', 'status': 'Por Hacer'}) + '\n'
+            for i in range(5)
+        )))
+        progress = []
+
+        result = TaskImporter(batch_size=2).run(records, progress=lambda result: progress.append(result['rows']))
+
+        self.assertEqual(progress, [2, 4, 5])
+        self.assertEqual(result['inserted'], 5)
+        self.assertEqual(Task.objects.count(), 5)
+
+    def test_unknown_fields_rejected(self):
+        """Test unknown columns are reported"""
+        with self.assertRaisesMessage(TaskImportError, 'unknown fields: priority'):
+            TaskImporter().run(read_csv(io.StringIO('name,content,status,priority\nA,C,Por Hacer,1\n')))
+
+
+class LoadInitialDataTestCase(TestCase):
+    """Test case for the load_initial_data command"""
+
+    def test_load_is_idempotent(self):
+        """Test loading twice creates the data once"""
+        call_command('load_initial_data', stdout=io.StringIO())
+        output = io.StringIO()
+        call_command('load_initial_data', stdout=output)
+
+        self.assertEqual(StatusModel.objects.count(), 4)
+        self.assertEqual(Task.objects.count(), 10)
+        self.assertIn('Tasks: 0 created, 10 already existed', output.getvalue())
+
+    def test_load_skips_archived_tasks(self):
+        """Test tasks archived since the first load are not created again"""
+        call_command('load_initial_data', stdout=io.StringIO())
+        completed = StatusModel.objects.get(name='Completado')
+        archived = TaskArchive.objects.archive_batch([completed.id], timezone.now() + timedelta(days=1), 100)
+
+        call_command('load_initial_data', stdout=io.StringIO())
+
+        self.assertGreater(archived, 0)
+        self.assertEqual(Task.objects.count() + TaskArchive.objects.count(), 10)
+
+    def test_skips_tasks_loaded_by_name(self):
+        """Test tasks loaded before external_id existed are not duplicated"""
+        status = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        Task.objects.create(name='Crear función de suma', content='Old', status=status)
+
+        call_command('load_initial_data', stdout=io.StringIO())
+
+        self.assertEqual(Task.objects.filter(name='Crear función de suma').count(), 1)
+        self.assertEqual(Task.objects.count(), 10)
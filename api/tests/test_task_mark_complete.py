@@ -0,0 +1,116 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.cache import status_cache
+from api.models import Task, Status as StatusModel
+
+
+class TaskMarkCompleteTestCase(TestCase):
+    """Test case for POST /api/tasks/mark-as-complete/ endpoint"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('mark-tasks-as-complete')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+        self.status_completed = StatusModel.objects.create(
+            name='Completado',
+            hexa_color='#10B981'
+        )
+
+        # Create test tasks
+        self.pending = Task.objects.create(name='Pending', content='Content', status=self.status_pending)
+        self.done = Task.objects.create(name='Done', content='Content', status=self.status_completed)
+        status_cache.all()
+
+    def test_mark_pending_tasks(self):
+        """Test pending tasks are moved to Completado"""
+        response = self.client.post(self.url, {'task_ids': [self.pending.id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 1)
+        self.assertEqual(response.data['tasks'], [{
+            'id': self.pending.id,
+            'name': 'Pending',
+            'status': 'Completado',
+            'previous_status': 'Por Hacer',
+        }])
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.status, self.status_completed)
+
+    def test_already_completed_reported(self):
+        """Test completed tasks are left alone and reported"""
+        done_updated_at = self.done.updated_at
+        response = self.client.post(self.url, {'task_ids': [self.pending.id, self.done.id]}, format='json')
+
+        self.assertEqual(response.data['updated_count'], 1)
+        self.assertEqual(response.data['warning'], '1 task(s) were already completed')
+        self.assertEqual(
+            response.data['already_completed_tasks'],
+            [{'id': self.done.id, 'name': 'Done', 'status': 'Completado'}]
+        )
+        self.done.refresh_from_db()
+        self.assertEqual(self.done.updated_at, done_updated_at)
+
+    def test_updated_at_bumped(self):
+        """Test completed tasks get a new updated_at"""
+        previous = self.pending.updated_at
+        self.client.post(self.url, {'task_ids': [self.pending.id]}, format='json')
+
+        self.pending.refresh_from_db()
+        self.assertGreater(self.pending.updated_at, previous)
+
+    def test_unknown_ids_ignored(self):
+        """Test ids without a task are skipped"""
+        response = self.client.post(self.url, {'task_ids': [self.pending.id, 999999]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task['id'] for task in response.data['tasks']], [self.pending.id])
+        self.assertNotIn('already_completed_tasks', response.data)
+
+    def test_single_statement_without_content(self):
+        """Test the endpoint runs one statement that never reads content"""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, {'task_ids': [self.pending.id, self.done.id]}, format='json')
+
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertIn('RETURNING', queries.captured_queries[0]['sql'])
+        self.assertNotIn('"content"', queries.captured_queries[0]['sql'])
+
+    def test_large_id_list(self):
+        """Test 100k ids are sent as one array parameter"""
+        task_ids = list(range(1000000, 1100000)) + [self.pending.id]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {'task_ids': task_ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 1)
+        self.assertEqual(len(queries.captured_queries), 1)
+
+    def test_missing_completed_status(self):
+        """Test a 404 is returned when there is no Completado status"""
+        Task.objects.filter(status=self.status_completed).delete()
+        self.status_completed.delete()
+
+        response = self.client.post(self.url, {'task_ids': [self.pending.id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_empty_list_rejected(self):
+        """Test an empty task_ids list is rejected"""
+        response = self.client.post(self.url, {'task_ids': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
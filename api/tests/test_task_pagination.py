@@ -0,0 +1,124 @@
+from unittest.mock import patch
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.models import Task, Status as StatusModel
+from api.pagination import TaskCursorPagination
+
+
+class TaskPaginationTestCase(TestCase):
+    """Test case for cursor pagination on GET /api/tasks/"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-list')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+
+        # Create test tasks
+        for i in range(7):
+            Task.objects.create(
+                name=f'Task {i}',
+                content=f'Content for task {i}',
+                status=self.status_pending
+            )
+
+    def _collect_pages(self, url):
+        """Follow `next` links and return every page of results"""
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([task['name'] for task in response.data['results']])
+            url = response.data['next']
+        return pages
+
+    def test_list_response_is_paginated(self):
+        """Test list response contains cursor links and results"""
+        response = self.client.get(self.url, {'page_size': 3})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('next', response.data)
+        self.assertIn('previous', response.data)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+    def test_pages_cover_every_task_once(self):
+        """Test walking the cursor returns every task exactly once"""
+        pages = self._collect_pages(f'{self.url}?page_size=3')
+
+        names = [name for page in pages for name in page]
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(len(names), 7)
+        self.assertEqual(len(set(names)), 7)
+
+    def test_default_ordering_is_newest_first(self):
+        """Test default ordering is by creation date descending"""
+        pages = self._collect_pages(f'{self.url}?page_size=3')
+
+        names = [name for page in pages for name in page]
+        self.assertEqual(names, [f'Task {i}' for i in reversed(range(7))])
+
+    def test_pagination_honors_ordering_param(self):
+        """Test pages follow the requested ordering"""
+        pages = self._collect_pages(f'{self.url}?page_size=2&ordering=name')
+
+        names = [name for page in pages for name in page]
+        self.assertEqual(names, sorted(names))
+
+    def test_ties_are_broken_by_id(self):
+        """Test rows sharing the ordering value are not skipped or duplicated"""
+        Task.objects.update(name='Same name')
+        pages = self._collect_pages(f'{self.url}?page_size=2&ordering=name')
+
+        self.assertEqual(sum(len(page) for page in pages), 7)
+
+    def test_ties_beyond_offset_cutoff(self):
+        """Test ties page correctly past DRF's offset cutoff"""
+        Task.objects.update(name='Same name')
+        with patch.object(TaskCursorPagination, 'offset_cutoff', 2):
+            pages = self._collect_pages(f'{self.url}?page_size=2&ordering=name')
+
+        self.assertEqual(sum(len(page) for page in pages), 7)
+
+    def test_previous_link_returns_previous_page(self):
+        """Test following previous from the second page returns the first page"""
+        first = self.client.get(self.url, {'page_size': 3, 'ordering': 'name'})
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+
+        self.assertEqual(back.data['results'], first.data['results'])
+        self.assertIsNone(back.data['previous'])
+
+    def test_insert_does_not_shift_next_page(self):
+        """Test a task created between requests does not shift the next page"""
+        first = self.client.get(self.url, {'page_size': 3})
+        Task.objects.create(name='Late task', content='Inserted later', status=self.status_pending)
+
+        second = self.client.get(first.data['next'])
+        names = [task['name'] for task in second.data['results']]
+        self.assertEqual(names, ['Task 3', 'Task 2', 'Task 1'])
+
+    def test_invalid_cursor_returns_404(self):
+        """Test an invalid cursor value returns 404"""
+        response = self.client.get(self.url, {'cursor': 'invalid'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_size_is_capped(self):
+        """Test page_size above the maximum is clamped"""
+        response = self.client.get(self.url, {'page_size': 100000})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 7)
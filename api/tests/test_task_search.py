@@ -0,0 +1,152 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.models import Task, Status as StatusModel
+
+
+class TaskSearchTestCase(TestCase):
+    """Test case for full-text search on GET /api/tasks/?search="""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-list')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        self.status_pending = StatusModel.objects.create(
+            name='Por Hacer',
+            hexa_color='#6B7280'
+        )
+
+        # Create test tasks
+        self.task_sum = Task.objects.create(
+            name='Crear función de suma',
+            content='Implementar una función que sume dos números',
+            status=self.status_pending
+        )
+        self.task_loop = Task.objects.create(
+            name='Implementar bucle for',
+            content='Crear un bucle for que itere sobre una lista de elementos',
+            status=self.status_pending
+        )
+        self.task_review = Task.objects.create(
+            name='Revisar pull request',
+            content='Revisar y aprobar el PR del compañero, incluye una función nueva',
+            status=self.status_pending
+        )
+
+    def _search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task['name'] for task in response.data['results']]
+
+    def test_search_matches_name_and_content(self):
+        """Test a word matches tasks by name or content"""
+        names = self._search(search='función')
+
+        self.assertCountEqual(names, [self.task_sum.name, self.task_review.name])
+
+    def test_search_is_case_insensitive(self):
+        """Test search ignores case"""
+        names = self._search(search='BUCLE')
+
+        self.assertEqual(names, [self.task_loop.name])
+
+    def test_search_matches_word_prefixes(self):
+        """Test a partial word matches as a prefix"""
+        names = self._search(search='implem')
+
+        self.assertCountEqual(names, [self.task_sum.name, self.task_loop.name])
+
+    def test_search_requires_every_term(self):
+        """Test every search term must match"""
+        names = self._search(search='crear suma')
+
+        self.assertEqual(names, [self.task_sum.name])
+
+    def test_search_falls_back_to_substring(self):
+        """Test text inside a word is still found"""
+        names = self._search(search='ucle')
+
+        self.assertEqual(names, [self.task_loop.name])
+
+    def test_search_keeps_substring_matches(self):
+        """Test substring matches are listed after full-text matches"""
+        Task.objects.create(name='Consumir API', content='Llamar al servicio', status=self.status_pending)
+
+        names = self._search(search='sum', ordering='-search_rank')
+
+        self.assertEqual(names, [self.task_sum.name, 'Consumir API'])
+
+    def test_search_combines_with_filters(self):
+        """Test search respects other filters"""
+        other_status = StatusModel.objects.create(name='Completado', hexa_color='#10B981')
+        Task.objects.create(name='Otra función', content='Contenido', status=other_status)
+
+        names = self._search(search='función', status=other_status.id)
+
+        self.assertEqual(names, ['Otra función'])
+
+    def test_order_by_relevance(self):
+        """Test ordering by search_rank puts name matches first"""
+        names = self._search(search='función', ordering='-search_rank')
+
+        self.assertEqual(names, [self.task_sum.name, self.task_review.name])
+
+    def test_relevance_ordering_pages(self):
+        """Test paging by search_rank returns every match once"""
+        for i in range(12):
+            Task.objects.create(
+                name=f'Tarea {i}', content=' '.join(['tarea'] * (i % 4) + ['otra'] * i), status=self.status_pending
+            )
+
+        ids = []
+        response = self.client.get(self.url, {'search': 'tarea', 'ordering': '-search_rank', 'page_size': 5})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [task['id'] for task in response.data['results']]
+            if not response.data['next'] or len(ids) > 12:
+                break
+            response = self.client.get(response.data['next'])
+
+        self.assertEqual(len(ids), 12)
+        self.assertEqual(len(set(ids)), 12)
+
+    def test_relevance_ordering_ignored_without_search(self):
+        """Test search_rank ordering is ignored when not searching"""
+        names = self._search(ordering='-search_rank')
+
+        self.assertEqual(len(names), 3)
+
+    def test_search_vector_follows_updates(self):
+        """Test renamed tasks are found by their new name"""
+        url = reverse('task-detail', kwargs={'pk': self.task_loop.id})
+        response = self.client.patch(url, {'name': 'Implementar bucle while'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self._search(search='while'), ['Implementar bucle while'])
+
+    def test_search_vector_follows_bulk_updates(self):
+        """Test tasks updated in bulk are found by their new content"""
+        data = {'update': [{'id': self.task_sum.id, 'content': 'Sumar con recursividad'}]}
+        response = self.client.post(reverse('task-bulk'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self._search(search='recursividad'), [self.task_sum.name])
+
+    def test_search_without_words(self):
+        """Test punctuation-only search does not fail"""
+        names = self._search(search='%%')
+
+        self.assertEqual(names, [])
+
+    def test_search_vector_not_in_response(self):
+        """Test the search vector is not exposed"""
+        response = self.client.get(self.url, {'search': 'función'})
+
+        self.assertNotIn('search_vector', response.data['results'][0])
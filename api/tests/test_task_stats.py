@@ -0,0 +1,132 @@
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.cache import status_cache
+from api.models import Task, TaskDailyCount, Status as StatusModel
+
+
+class TaskStatsTestCase(TestCase):
+    """Test case for GET /api/tasks/stats/ and the task_daily_count summary table"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-stats')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        self.status_completed = StatusModel.objects.create(name='Completado', hexa_color='#10B981')
+        self.status_blocked = StatusModel.objects.create(name='Bloqueado', hexa_color='#10B981')
+
+        # Create test tasks on two days of the same week and one of the next
+        self.tasks = [
+            Task.objects.create(name=f'Task {i}', content='Content', status=self.status_pending)
+            for i in range(4)
+        ]
+        self._set_created(self.tasks[0], datetime(2024, 1, 1, 10, tzinfo=dt_timezone.utc))
+        self._set_created(self.tasks[1], datetime(2024, 1, 3, 23, 30, tzinfo=dt_timezone.utc))
+        self._set_created(self.tasks[2], datetime(2024, 1, 3, 8, tzinfo=dt_timezone.utc))
+        self._set_created(self.tasks[3], datetime(2024, 1, 9, 8, tzinfo=dt_timezone.utc))
+        status_cache.all()
+
+    def _set_created(self, task, created_at):
+        Task.objects.filter(pk=task.pk).update(created_at=created_at)
+
+    def _by_status(self, response):
+        return {item['status_name']: item['count'] for item in response.data['by_status']}
+
+    def test_counts(self):
+        """Test counts by status, color, day and week"""
+        Task.objects.filter(pk=self.tasks[0].pk).update(status=self.status_completed)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total'], 4)
+        self.assertEqual(self._by_status(response), {'Por Hacer': 3, 'Completado': 1, 'Bloqueado': 0})
+        self.assertEqual(
+            response.data['by_color'],
+            [{'color': '#10B981', 'count': 1}, {'color': '#6B7280', 'count': 3}]
+        )
+        self.assertEqual(
+            [(str(item['day']), item['count']) for item in response.data['by_day']],
+            [('2024-01-01', 1), ('2024-01-03', 2), ('2024-01-09', 1)]
+        )
+        self.assertEqual(
+            [(str(item['week']), item['count']) for item in response.data['by_week']],
+            [('2024-01-01', 3), ('2024-01-08', 1)]
+        )
+
+    def test_single_query(self):
+        """Test statistics are read with one query on the summary table"""
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+    def test_transition_updates_counts(self):
+        """Test set-based status updates keep the counters current"""
+        self.client.post(
+            reverse('task-transition'),
+            {'status': self.status_blocked.id, 'filter': {'status': self.status_pending.id}},
+            format='json'
+        )
+        response = self.client.get(self.url)
+
+        self.assertEqual(self._by_status(response), {'Por Hacer': 0, 'Completado': 0, 'Bloqueado': 4})
+
+    def test_bulk_create_and_delete_update_counts(self):
+        """Test bulk inserts and deletes keep the counters current"""
+        Task.objects.bulk_create([
+            Task(name=f'Bulk {i}', content='Content', status=self.status_completed) for i in range(10)
+        ])
+        self.tasks[0].delete()
+        Task.objects.filter(name__startswith='Bulk 1').delete()
+        response = self.client.get(self.url)
+
+        self.assertEqual(self._by_status(response), {'Por Hacer': 3, 'Completado': 9, 'Bloqueado': 0})
+        self.assertEqual(response.data['total'], 12)
+
+    def test_created_at_change_moves_day(self):
+        """Test editing created_at moves the task to its new day"""
+        self._set_created(self.tasks[3], datetime(2024, 1, 1, 12, tzinfo=dt_timezone.utc))
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            [(str(item['day']), item['count']) for item in response.data['by_day']],
+            [('2024-01-01', 2), ('2024-01-03', 2)]
+        )
+
+    def test_counts_match_task_table(self):
+        """Test the counters match a GROUP BY over the task table"""
+        task = Task.objects.create(name='New', content='Content', status=self.status_blocked)
+        task.status = self.status_completed
+        task.save()
+        self.client.post(reverse('mark-tasks-as-complete'), {'task_ids': [self.tasks[1].id]}, format='json')
+
+        counters = {
+            (row.status_id, row.day): row.count for row in TaskDailyCount.objects.filter(count__gt=0)
+        }
+        expected = {}
+        for task in Task.objects.all():
+            key = (task.status_id, task.created_at.astimezone(dt_timezone.utc).date())
+            expected[key] = expected.get(key, 0) + 1
+
+        self.assertEqual(counters, expected)
+
+    def test_rebuild_command(self):
+        """Test rebuild_task_stats recomputes the counters from scratch"""
+        TaskDailyCount.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_task_stats', stdout=out)
+        response = self.client.get(self.url)
+
+        self.assertIn('covering 4 task(s)', out.getvalue())
+        self.assertEqual(response.data['total'], 4)
+        self.assertEqual(len(response.data['by_day']), 3)
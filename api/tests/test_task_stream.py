@@ -0,0 +1,329 @@
+import asyncio
+import json
+from unittest import mock
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from api.models import Task, Status as StatusModel
+from api.pagination.changes import ChangeCursor
+from api.streams import StreamRevocations, TaskChangeBroker, TaskStreamApp
+
+
+class StreamConnection:
+    """
+    Drives TaskStreamApp like an ASGI server, collecting what it sends.
+    """
+
+    def __init__(self, app, query='', headers=()):
+        self.messages = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self.buffer = b''
+        scope = {
+            'type': 'http',
+            'method': 'GET',
+            'path': TaskStreamApp.path,
+            'query_string': query.encode(),
+            'headers': [(name.encode(), value.encode()) for name, value in headers],
+        }
+        self.task = asyncio.ensure_future(app(scope, self.receive, self.send))
+
+    async def receive(self):
+        await self.disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message):
+        await self.messages.put(message)
+
+    async def response(self):
+        """
+        Return the status and headers of the response.
+        """
+        start = await asyncio.wait_for(self.messages.get(), 5)
+        return start['status'], dict(start['headers'])
+
+    async def body(self):
+        return (await asyncio.wait_for(self.messages.get(), 5))['body']
+
+    async def messages_until(self, predicate):
+        """
+        Read SSE messages (as field dicts) until predicate(message) holds.
+        """
+        messages = []
+        while not messages or not predicate(messages[-1]):
+            while b'\n\n' not in self.buffer:
+                self.buffer += await self.body()
+            raw, self.buffer = self.buffer.split(b'\n\n', 1)
+            message = dict(line.decode().split(': ', 1) for line in raw.split(b'\n'))
+            if 'data' in message:
+                message['data'] = json.loads(message['data'])
+            messages.append(message)
+        return messages
+
+    async def events(self, count):
+        """
+        Return the next count events, skipping id-only messages.
+        """
+        events = []
+        while len(events) < count:
+            events += [
+                message for message in await self.messages_until(lambda message: 'event' in message)
+                if 'event' in message
+            ]
+        return events
+
+    async def close(self):
+        self.disconnected.set()
+        await asyncio.wait_for(self.task, 5)
+
+
+class TaskStreamTestCase(TransactionTestCase):
+    """Test case for the task stream served by TaskStreamApp"""
+    # Changes reach the stream once their transaction commits
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+
+        # Create user and bearer token
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+        self.auth = ('authorization', f'Bearer {AccessToken.for_user(self.user)}')
+
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        self.status_completed = StatusModel.objects.create(name='Completado', hexa_color='#10B981')
+
+    @asynccontextmanager
+    async def stream(self, query='', headers=None):
+        """Open a stream on a broker of this test's loop, and close both"""
+        broker = TaskChangeBroker()
+        connection = StreamConnection(
+            TaskStreamApp(broker), query, [self.auth] if headers is None else headers
+        )
+        try:
+            yield connection
+        finally:
+            await connection.close()
+            await broker.stop()
+
+    @asynccontextmanager
+    async def open_stream(self, query='', headers=()):
+        """Open an accepted stream and read its first message"""
+        async with self.stream(query, [self.auth, *headers]) as connection:
+            response_status, response_headers = await connection.response()
+            self.assertEqual(response_status, status.HTTP_200_OK)
+            self.assertEqual(response_headers[b'content-type'], b'text/event-stream')
+            connection.first = (await connection.messages_until(lambda message: True))[0]
+            yield connection
+
+    async def error(self, query='', headers=None):
+        async with self.stream(query, headers) as connection:
+            response_status, response_headers = await connection.response()
+            return response_status, response_headers, json.loads(await connection.body())
+
+    def create_task(self, name='Task', task_status=None):
+        return sync_to_async(Task.objects.create)(
+            name=name, content='Content', status=task_status or self.status_pending
+        )
+
+    async def test_requires_authentication(self):
+        """Test a stream without a bearer token is refused"""
+        response_status, headers, _ = await self.error(headers=[])
+
+        self.assertEqual(response_status, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn(b'Bearer', headers[b'www-authenticate'])
+
+    async def test_invalid_parameters(self):
+        """Test unknown statuses and malformed or expired event ids are rejected"""
+        for query, field in (('status=abc', 'status'), ('status=999999', 'status'), ('last_event_id=zz', 'last_event_id')):
+            response_status, _, body = await self.error(query)
+            self.assertEqual(response_status, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(field, body)
+
+        expired = ChangeCursor(1, 1, issued=0).encode()
+        response_status, _, body = await self.error(headers=[self.auth, ('last-event-id', expired)])
+        self.assertEqual(response_status, status.HTTP_410_GONE)
+        self.assertIn('expired', body['detail'])
+
+    async def test_created_updated_deleted(self):
+        """Test creating, updating and deleting a task send one event each"""
+        async with self.open_stream() as stream:
+            self.assertIn('id', stream.first)
+            self.assertEqual(stream.first['retry'], '5000')
+
+            # One write at a time: changes read together are sent once,
+            # with the task's current state
+            task = await self.create_task('Pushed')
+            created, = await stream.events(1)
+            task.name = 'Renamed'
+            await sync_to_async(task.save)()
+            updated, = await stream.events(1)
+            task_id = task.id
+            await sync_to_async(task.delete)()
+            deleted, = await stream.events(1)
+
+        self.assertEqual(created['event'], 'task.created')
+        self.assertEqual(created['data']['id'], task_id)
+        self.assertEqual(created['data']['status_name'], 'Por Hacer')
+        self.assertEqual(updated['event'], 'task.updated')
+        self.assertEqual(updated['data']['name'], 'Renamed')
+        self.assertEqual(deleted['event'], 'task.deleted')
+        self.assertEqual(deleted['data']['id'], task_id)
+        self.assertEqual(deleted['data']['reason'], 'deleted')
+
+    async def test_bulk_complete(self):
+        """Test mark-as-complete sends an update for every task"""
+        tasks = [await self.create_task(f'Task {i}') for i in range(3)]
+        async with self.open_stream() as stream:
+            response = await sync_to_async(self.client.post)(
+                reverse('mark-tasks-as-complete'), {'task_ids': [task.id for task in tasks]}, format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            events = await stream.events(3)
+
+        self.assertEqual({event['event'] for event in events}, {'task.updated'})
+        self.assertEqual([event['data']['id'] for event in events], [task.id for task in tasks])
+        self.assertEqual({event['data']['status'] for event in events}, {self.status_completed.id})
+
+    async def test_status_filter(self):
+        """Test ?status= only sends tasks in those statuses, and every deletion"""
+        async with self.open_stream(f'status={self.status_completed.id}') as stream:
+            task = await self.create_task('Pending')
+            task_id = task.id
+            await sync_to_async(Task.objects.filter(id=task_id).update)(status=self.status_completed)
+            completed, = await stream.events(1)
+            await sync_to_async(task.delete)()
+            deleted, = await stream.events(1)
+
+        self.assertEqual(completed['event'], 'task.updated')
+        self.assertEqual(completed['data']['status'], self.status_completed.id)
+        self.assertEqual(deleted['event'], 'task.deleted')
+        self.assertEqual(deleted['data']['id'], task_id)
+
+    async def test_resume_from_last_event_id(self):
+        """Test reconnecting with Last-Event-ID replays the changes missed"""
+        async with self.open_stream() as stream:
+            first = await self.create_task('First')
+            last_event_id = (await stream.events(1))[0]['id']
+
+        second = await self.create_task('Second')
+        await sync_to_async(Task.objects.filter(id=first.id).update)(name='First renamed')
+
+        async with self.open_stream(headers=[('last-event-id', last_event_id)]) as stream:
+            created, updated = await stream.events(2)
+
+        self.assertEqual((created['event'], created['data']['id']), ('task.created', second.id))
+        self.assertEqual((updated['event'], updated['data']['name']), ('task.updated', 'First renamed'))
+
+    @override_settings(TASK_STREAM_BUFFER_SIZE=2)
+    async def test_resume_behind_buffer(self):
+        """Test a client further behind than the buffer reads the change feed"""
+        async with self.open_stream() as stream:
+            cursor = stream.first['id']
+            tasks = [await self.create_task(f'Task {i}') for i in range(5)]
+            await stream.events(5)
+
+            async with self.open_stream(f'last_event_id={cursor}') as behind:
+                events = await behind.events(5)
+
+        self.assertEqual([event['data']['id'] for event in events], [task.id for task in tasks])
+
+    async def test_waits_for_older_transactions(self):
+        """Test a change committed while an older transaction is open is sent once that one ends"""
+        other = await sync_to_async(connections.create_connection)('default')
+        try:
+            async with self.open_stream() as stream:
+                cursor = await sync_to_async(other.cursor)()
+                await sync_to_async(cursor.execute)('BEGIN; SELECT pg_current_xact_id()')
+
+                task = await self.create_task('Late')
+                await asyncio.sleep(0.5)
+                self.assertTrue(stream.messages.empty())
+
+                await sync_to_async(cursor.execute)('COMMIT')
+                event = (await stream.events(1))[0]
+        finally:
+            await sync_to_async(other.close)()
+
+        self.assertEqual(event['data']['id'], task.id)
+
+    @override_settings(TASK_STREAM_HEARTBEAT=0.1)
+    async def test_heartbeat(self):
+        """Test an idle stream sends id-only messages, and stays open past revocation checks"""
+        async with self.open_stream() as stream:
+            heartbeats = [(await stream.messages_until(lambda message: True))[0] for _ in range(3)]
+
+        self.assertEqual([set(heartbeat) for heartbeat in heartbeats], [{'id'}] * 3)
+
+    async def closed_event(self, stream):
+        """Read the stream.closed event and check the response ends after it"""
+        closed, = await stream.events(1)
+        self.assertEqual(closed['event'], 'stream.closed')
+        end = await asyncio.wait_for(stream.messages.get(), 5)
+        self.assertFalse(end.get('more_body', False))
+        return closed
+
+    @override_settings(TASK_STREAM_HEARTBEAT=0.1, AUTH_TOKEN_VERSIONS=True)
+    async def test_revoked_token_closes_stream(self):
+        """Test a token revoked while streaming is refused at the next heartbeat"""
+        async with self.open_stream() as stream:
+            self.user.set_password('newpass')
+            await sync_to_async(self.user.save)()
+            closed = await self.closed_event(stream)
+
+        self.assertEqual(closed['data']['code'], 'token_revoked')
+
+    @override_settings(TASK_STREAM_HEARTBEAT=0.1, AUTH_TOKEN_VERSIONS=False)
+    async def test_deactivated_user_closes_stream(self):
+        """Test without token versions a deactivated user is refused at the next heartbeat"""
+        async with self.open_stream() as stream:
+            self.user.is_active = False
+            await sync_to_async(self.user.save)()
+            closed = await self.closed_event(stream)
+
+        self.assertEqual(closed['data']['code'], 'token_revoked')
+
+    @override_settings(TASK_STREAM_HEARTBEAT=0.1)
+    async def test_one_revocation_lookup_per_heartbeat(self):
+        """Test a single lookup checks the tokens of every open stream"""
+        other = await sync_to_async(User.objects.create_user)(username='other', password='testpass')
+        other_auth = ('authorization', f'Bearer {AccessToken.for_user(other)}')
+        with mock.patch.object(StreamRevocations, 'find_revoked', return_value=set()) as find_revoked:
+            async with self.open_stream(), self.stream(headers=[other_auth]) as second:
+                await second.response()
+                find_revoked.reset_mock()
+                await asyncio.sleep(0.35)
+
+        self.assertIn(find_revoked.call_count, (3, 4))
+        for call in find_revoked.call_args_list:
+            self.assertEqual({user_id for user_id, _ in call.args[0]}, {str(self.user.id), str(other.id)})
+
+    async def test_expired_token_closes_stream(self):
+        """Test the stream ends when its token expires, before the next heartbeat"""
+        token = AccessToken.for_user(self.user)
+        token.set_exp(lifetime=timedelta(seconds=1))
+        async with self.stream(headers=[('authorization', f'Bearer {token}')]) as stream:
+            response_status, _ = await stream.response()
+            self.assertEqual(response_status, status.HTTP_200_OK)
+            closed = await self.closed_event(stream)
+
+        self.assertEqual(closed['data']['code'], 'token_not_valid')
+
+    async def test_disconnect_ends_stream(self):
+        """Test the app returns once the client disconnects"""
+        async with self.open_stream() as stream:
+            await stream.close()
+            self.assertTrue(stream.task.done())
+
+    def test_placeholder_outside_asgi(self):
+        """Test the Django route answers 501 outside the ASGI app"""
+        response = self.client.get(reverse('task-stream'))
+
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
@@ -0,0 +1,160 @@
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.cache import status_cache
+from api.models import Task, Status as StatusModel
+
+
+class TaskTransitionTestCase(TestCase):
+    """Test case for POST /api/tasks/transition/ endpoint"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('task-transition')
+
+        # Create and authenticate user
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+        # Create test statuses
+        self.status_pending = StatusModel.objects.create(name='Por Hacer', hexa_color='#6B7280')
+        self.status_progress = StatusModel.objects.create(name='En Progreso', hexa_color='#3B82F6')
+        self.status_blocked = StatusModel.objects.create(name='Bloqueado', hexa_color='#EF4444')
+
+        # Create test tasks
+        self.pending = [
+            Task.objects.create(name=f'Pending {i}', content='Content', status=self.status_pending)
+            for i in range(3)
+        ]
+        self.progress = Task.objects.create(name='Progress', content='Content', status=self.status_progress)
+        self.blocked = Task.objects.create(name='Blocked', content='Content', status=self.status_blocked)
+        status_cache.all()
+
+    def _counts(self, response):
+        return {item['status_name']: item['count'] for item in response.data['previous_statuses']}
+
+    def test_transition_by_ids(self):
+        """Test tasks given by id are moved to the target status"""
+        task_ids = [self.pending[0].id, self.progress.id, self.blocked.id]
+        response = self.client.post(self.url, {'status': self.status_blocked.id, 'task_ids': task_ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 2)
+        self.assertEqual(response.data['unchanged_count'], 1)
+        self.assertEqual(self._counts(response), {'Por Hacer': 1, 'En Progreso': 1, 'Bloqueado': 1})
+        self.assertEqual(Task.objects.filter(status=self.status_blocked).count(), 3)
+
+    def test_transition_by_filter(self):
+        """Test every task matching the filter is moved"""
+        response = self.client.post(
+            self.url,
+            {'status': self.status_progress.id, 'filter': {'status': self.status_pending.id}},
+            format='json'
+        )
+
+        self.assertEqual(response.data['updated_count'], 3)
+        self.assertEqual(self._counts(response), {'Por Hacer': 3})
+        self.assertFalse(Task.objects.filter(status=self.status_pending).exists())
+        self.blocked.refresh_from_db()
+        self.assertEqual(self.blocked.status, self.status_blocked)
+
+    def test_transition_by_date_filter(self):
+        """Test date lookups from the list filters are accepted"""
+        Task.objects.filter(pk=self.pending[0].pk).update(created_at=timezone.now() - timedelta(days=30))
+        cutoff = (timezone.now() - timedelta(days=1)).isoformat()
+
+        response = self.client.post(
+            self.url,
+            {'status': self.status_blocked.id, 'filter': {'created_at__lte': cutoff}},
+            format='json'
+        )
+
+        self.assertEqual(response.data['updated_count'], 1)
+        self.pending[0].refresh_from_db()
+        self.assertEqual(self.pending[0].status, self.status_blocked)
+
+    def test_single_statement(self):
+        """Test a filtered transition runs as one statement"""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(
+                self.url,
+                {'status': self.status_progress.id, 'filter': {'status': self.status_pending.id}},
+                format='json'
+            )
+
+        # the status filter validates its choice, then one statement moves the tasks
+        task_queries = [query['sql'] for query in queries.captured_queries if '"task"' in query['sql']]
+        self.assertEqual(len(task_queries), 1)
+        self.assertIn('RETURNING', task_queries[0])
+        self.assertNotIn('"content"', task_queries[0])
+
+    def test_updated_at_bumped(self):
+        """Test moved tasks get a new updated_at"""
+        previous = self.progress.updated_at
+        self.client.post(self.url, {'status': self.status_blocked.id, 'task_ids': [self.progress.id]}, format='json')
+
+        self.progress.refresh_from_db()
+        self.assertGreater(self.progress.updated_at, previous)
+
+    def test_ids_and_filter_rejected(self):
+        """Test task_ids and filter cannot be combined"""
+        response = self.client.post(
+            self.url,
+            {'status': self.status_blocked.id, 'task_ids': [self.progress.id], 'filter': {'status': self.status_pending.id}},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_missing_selection_rejected(self):
+        """Test a transition without task_ids or filter is rejected"""
+        response = self.client.post(self.url, {'status': self.status_blocked.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown_filter_rejected(self):
+        """Test unknown filter names are rejected instead of matching every task"""
+        response = self.client.post(
+            self.url,
+            {'status': self.status_blocked.id, 'filter': {'state': self.status_pending.id}},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('filter', response.data)
+        self.assertEqual(Task.objects.filter(status=self.status_blocked).count(), 1)
+
+    def test_invalid_filter_value_rejected(self):
+        """Test invalid filter values are rejected"""
+        response = self.client.post(
+            self.url,
+            {'status': self.status_blocked.id, 'filter': {'created_at__gte': 'yesterday'}},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown_target_status(self):
+        """Test a nonexistent target status is rejected"""
+        response = self.client.post(self.url, {'status': 9999, 'task_ids': [self.progress.id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('status', response.data)
+
+    def test_transition_invalidates_list_cache(self):
+        """Test cached task lists reflect the transition"""
+        list_url = reverse('task-list')
+        self.client.get(list_url)
+        self.client.post(self.url, {'status': self.status_blocked.id, 'task_ids': [self.progress.id]}, format='json')
+
+        response = self.client.get(list_url)
+        statuses = {task['name']: task['status_name'] for task in response.data['results']}
+
+        self.assertEqual(statuses['Progress'], 'Bloqueado')
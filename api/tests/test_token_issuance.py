@@ -0,0 +1,98 @@
+from unittest import mock
+from django.contrib.auth.models import User
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from api.authentication import last_login_recorder
+from api.cache import token_cache
+
+ARGON2_FIRST = [
+    'api.hashers.Argon2PasswordHasher',
+    'api.hashers.PBKDF2PasswordHasher',
+]
+
+
+@override_settings(PBKDF2_ITERATIONS=1000)
+class TokenIssuanceTestCase(TestCase):
+    """Test case for last_login batching and password rehashing on token issuance"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.url = reverse('token_obtain_pair')
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+
+    def _obtain(self):
+        response = self.client.post(self.url, {'username': 'testuser', 'password': 'testpass'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        return response
+
+    @override_settings(LAST_LOGIN_FLUSH_INTERVAL=0)
+    def test_last_login_written_synchronously(self):
+        """Test an interval of 0 writes last_login on every token request"""
+        self._obtain()
+
+        self.assertIsNotNone(self.user.last_login)
+
+    @override_settings(LAST_LOGIN_FLUSH_INTERVAL=3600)
+    def test_last_login_batched(self):
+        """Test last_login is written by the flush, once per user"""
+        self._obtain()
+        self._obtain()
+        self.assertIsNone(self.user.last_login)
+
+        self.assertEqual(last_login_recorder.flush(), 1)
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+        self.assertEqual(last_login_recorder.flush(), 0)
+
+    @override_settings(LAST_LOGIN_FLUSH_INTERVAL=3600)
+    def test_failed_flush_keeps_logins(self):
+        """Test logins stay pending when the write fails"""
+        self._obtain()
+
+        with mock.patch.object(User.objects, 'bulk_update', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                last_login_recorder.flush()
+
+        self.assertEqual(last_login_recorder.flush(), 1)
+
+    def test_rehash_on_new_iterations(self):
+        """Test a hash with another iteration count is rehashed on login"""
+        with override_settings(PBKDF2_ITERATIONS=2000):
+            self._obtain()
+
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$2000$'))
+        self.assertEqual(token_cache.user_version(self.user.pk), 0)
+
+    @override_settings(PASSWORD_HASHERS=ARGON2_FIRST)
+    def test_rehash_to_argon2(self):
+        """Test PBKDF2 hashes are rehashed with argon2 when it is preferred"""
+        self._obtain()
+
+        self.assertTrue(self.user.password.startswith('argon2$argon2id$'))
+        self.assertIn('m=19456,t=2,p=1', self.user.password)
+        self.assertTrue(self.user.check_password('testpass'))
+
+    @override_settings(PASSWORD_HASHERS=ARGON2_FIRST)
+    def test_rehash_on_new_argon2_costs(self):
+        """Test argon2 hashes with other costs are rehashed on login"""
+        self._obtain()
+
+        with override_settings(ARGON2_MEMORY_COST=8192):
+            self._obtain()
+
+        self.assertIn('m=8192,t=2,p=1', self.user.password)
+
+    def test_rehash_keeps_cached_tokens(self):
+        """Test a rehash on login does not revoke or flush issued tokens"""
+        access = self._obtain().data['access']
+        self.client.get(reverse('status-list'), HTTP_AUTHORIZATION=f'Bearer {access}')
+
+        with override_settings(PBKDF2_ITERATIONS=2000), mock.patch.object(token_cache, 'invalidate') as invalidate:
+            self._obtain()
+
+        invalidate.assert_not_called()
@@ -4,9 +4,11 @@ from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 
+from api.views.cache import list_cache_stats
 from api.views.health import health_check
+from api.views.metrics import metrics
 from api.views.status import StatusViewSet
-from api.views.task import TaskViewSet, mark_tasks_as_complete
+from api.views.task import TaskViewSet, mark_tasks_as_complete, task_stream
 
 # Initialize router for ViewSets
 router = DefaultRouter()
@@ -25,6 +27,14 @@ urlpatterns = [
 
     # Task custom endpoints
     path('tasks/mark-as-complete/', mark_tasks_as_complete, name='mark-tasks-as-complete'),
+    # Served by api.streams.TaskStreamApp under ASGI (see todo_challenge/asgi.py)
+    path('tasks/stream/', task_stream, name='task-stream'),
+
+    # Cache statistics (admin only)
+    path('cache/stats/', list_cache_stats, name='list-cache-stats'),
+
+    # Request metrics (Prometheus text format)
+    path('metrics/', metrics, name='metrics'),
 
     # API Documentation
     path('schema/', SpectacularAPIView.as_view(), name='schema'),
@@ -0,0 +1,3 @@
+from .stats import list_cache_stats
+
+__all__ = ['list_cache_stats']
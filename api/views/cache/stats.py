@@ -0,0 +1,25 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+from api.cache import list_response_cache
+from api.views.status import StatusViewSet
+from api.views.task import TaskViewSet
+
+
+@extend_schema(
+    responses={200: {'description': 'Hit and miss counters per cached list'}},
+    description='Hit and miss counters of the list response cache, shared by every worker process.',
+    summary='List cache statistics'
+)
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def list_cache_stats(request):
+    """
+    Return the hit and miss counters of every cached list endpoint.
+
+    Returns:
+        200: {"task-list": {"hits": 10, "misses": 2}, ...}
+    """
+    names = [viewset.list_cache_name for viewset in (TaskViewSet, StatusViewSet)]
+    return Response(list_response_cache.stats(*names))
@@ -1,33 +1,48 @@
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
-from rest_framework import status
+from asgiref.sync import sync_to_async
 from django.db import connection
+from django.http import JsonResponse
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
-def health_check(request):
+def check_database():
+    """
+    Open (or reuse) this thread's database connection.
+    """
+    connection.ensure_connection()
+
+
+async def health_check(request):
     """
     Health check endpoint that verifies the application and database status.
+    Runs as a native coroutine so liveness probes do not occupy a worker
+    thread under ASGI.
 
     Returns:
         200: Application is healthy and database is connected
         503: Service unavailable (database connection failed)
+        405: Method other than GET/HEAD
     """
+    if request.method not in ('GET', 'HEAD'):
+        return JsonResponse({'detail': f'Method "{request.method}" not allowed.'}, status=405)
+
     try:
-        # Check database connection
-        connection.ensure_connection()
+        # Check database connection. The connection must be looked up inside
+        # the sync call: it is per thread, and this coroutine may run in
+        # another one.
+        await sync_to_async(check_database)()
 
-        return Response({
+        return JsonResponse({
             'status': 'healthy',
             'database': 'connected',
             'message': 'Application is running correctly'
-        }, status=status.HTTP_200_OK)
+        }, status=200)
 
     except Exception as e:
-        return Response({
+        return JsonResponse({
             'status': 'unhealthy',
             'database': 'disconnected',
             'message': str(e)
-        }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        }, status=503)
+
+
+# csrf_exempt() does not keep coroutine functions async on Django 4.2
+health_check.csrf_exempt = True
@@ -0,0 +1,3 @@
+from .prometheus import metrics
+
+__all__ = ['metrics']
@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotAllowed
+from django.utils.crypto import constant_time_compare
+from rest_framework.exceptions import APIException
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from api.cache import list_response_cache
+from api.metrics import metrics_registry, render_metrics
+from api.views.status import StatusViewSet
+from api.views.task import TaskViewSet
+
+
+def metrics(request):
+    """
+    Expose the request metrics of this process in the Prometheus text format.
+    When METRICS_TOKEN is set, scrapers must send it as a bearer token;
+    otherwise only staff users can read the metrics, like the cache stats.
+
+    Returns:
+        200: Metrics in text format
+        401: Missing or wrong METRICS_TOKEN, or no user without it
+        403: Not a staff user
+        404: Request metrics are disabled
+        405: Method other than GET
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    if not settings.REQUEST_METRICS_ENABLED:
+        return HttpResponse(status=404)
+    if settings.METRICS_TOKEN:
+        header = request.headers.get('Authorization', '')
+        if not constant_time_compare(header, f'Bearer {settings.METRICS_TOKEN}'):
+            return HttpResponse(status=401)
+    else:
+        denied = check_staff(request)
+        if denied is not None:
+            return HttpResponse(status=denied)
+
+    names = [viewset.list_cache_name for viewset in (TaskViewSet, StatusViewSet)]
+    return HttpResponse(
+        render_metrics(metrics_registry, list_response_cache.stats(*names)),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
+
+
+def check_staff(request):
+    """
+    Authenticate the request like the REST API does and return None for a
+    staff user, or the status code to refuse it with.
+    """
+    drf_request = Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+    try:
+        user = drf_request.user
+    except APIException:
+        return 401
+    if not (user and user.is_authenticated):
+        return 401
+    if not IsAdminUser().has_permission(drf_request, None):
+        return 403
+    return None
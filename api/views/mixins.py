@@ -0,0 +1,205 @@
+import hashlib
+from datetime import datetime, timezone as dt_timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date, quote_etag
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from api.cache import list_response_cache
+from api.exceptions import PreconditionFailed
+
+
+def make_etag(*parts):
+    """
+    Build a strong ETag from the given validator parts.
+    """
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode(), usedforsecurity=False)
+    return quote_etag(digest.hexdigest())
+
+
+class ConditionalGetMixin:
+    """
+    Adds ETag / Last-Modified validators to list and detail views.
+    Reads matching If-None-Match / If-Modified-Since return 304 before
+    anything is serialized, and detail writes honor If-Match /
+    If-Unmodified-Since for optimistic concurrency. List validators come
+    from the rows of the page, so lists still run their page query.
+    """
+    last_modified_field = 'updated_at'
+
+    def get_list_validators(self, rows):
+        """
+        Return (etag, last_modified) for a list, from the pk and updated_at
+        of the rows it returns and the pagination links and count.
+        Rows are model instances or .values() dicts.
+        """
+        pk_name = self.queryset.model._meta.pk.attname
+        versions = [
+            (row[pk_name], row[self.last_modified_field]) if isinstance(row, dict)
+            else (row.pk, getattr(row, self.last_modified_field))
+            for row in rows
+        ]
+        last_modified = max((modified for _, modified in versions if modified), default=None)
+        pagination = ()
+        if self.paginator is not None:
+            pagination = (
+                self.paginator.get_next_link(),
+                self.paginator.get_previous_link(),
+                getattr(self.paginator, 'count', None),
+            )
+        return make_etag(versions, *pagination), last_modified
+
+    def get_object_validators(self, obj):
+        """
+        Return (etag, last_modified) for a single object.
+        """
+        last_modified = getattr(obj, self.last_modified_field)
+        return make_etag(obj.pk, last_modified), last_modified
+
+    def evaluate_preconditions(self, request, etag, last_modified):
+        """
+        Return a 304 response if the client copy is current, None if the
+        request should proceed, or raise PreconditionFailed.
+        """
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if response is not None and response.status_code == PreconditionFailed.status_code:
+            raise PreconditionFailed
+        return response
+
+    def conditional_response(self, request, validators, build_response):
+        """
+        Answer 304 when the validators match, otherwise call build_response;
+        either way attach the validators to the response.
+        """
+        etag, last_modified = validators
+        response = self.evaluate_preconditions(request, etag, last_modified)
+        if response is None:
+            response = build_response()
+        return self.set_validators(response, etag, last_modified)
+
+    def set_validators(self, response, etag, last_modified):
+        """
+        Attach the ETag and Last-Modified headers to the response.
+        """
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+
+    def get_object(self):
+        """
+        Check If-Match / If-Unmodified-Since against the current row
+        before any write.
+        """
+        obj = super().get_object()
+        if self.request.method not in SAFE_METHODS:
+            self.evaluate_preconditions(self.request, *self.get_object_validators(obj))
+        return obj
+
+    def list(self, request, *args, **kwargs):
+        """
+        Fetch the page, then answer 304 or serialize it: the validators
+        are computed from the fetched rows, without a query of their own.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = self.get_list_rows(queryset)
+        page = self.paginate_queryset(rows)
+        paginated = page is not None
+        if not paginated:
+            page = list(rows)
+        return self.conditional_response(
+            request,
+            self.get_list_validators(page),
+            lambda: self.get_list_response(page, paginated),
+        )
+
+    def get_list_rows(self, queryset):
+        """
+        Return the rows a list reads; the validators need the pk and
+        last_modified_field of each.
+        """
+        return queryset
+
+    def get_list_response(self, page, paginated):
+        data = self.get_list_data(page)
+        if paginated:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def get_list_data(self, page):
+        """
+        Serialize the rows of a list page.
+        """
+        return self.get_serializer(page, many=True).data
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        return self.conditional_response(
+            request,
+            self.get_object_validators(instance),
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+    def update(self, request, *args, **kwargs):
+        response = super().update(request, *args, **kwargs)
+        return self.set_validators(response, *self.get_object_validators(self.updated_instance))
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.updated_instance = serializer.instance
+
+
+class CachedListMixin:
+    """
+    Serves list responses from the list response cache.
+    Entries are keyed on the user and the normalized query string and are
+    invalidated whenever one of list_cache_models is written. The ETag and
+    Last-Modified are cached with the body, so a hit answers (or 304s)
+    without touching the database. Use together with ConditionalGetMixin.
+    """
+    list_cache_name = None
+    list_cache_models = ()
+
+    def cached_list(self, request, build_response):
+        """
+        Return the cached list response, or build and cache it.
+        """
+        if not list_response_cache.timeout:
+            return build_response()
+
+        key = list_response_cache.make_key(self.list_cache_name, self.list_cache_models, request)
+        entry = list_response_cache.get(self.list_cache_name, key)
+        if entry is not None:
+            data, etag, last_modified = entry
+            response = self.conditional_response(request, (etag, last_modified), lambda: Response(data))
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = build_response()
+        if response.status_code == 200 and 'ETag' in response:
+            last_modified = None
+            if 'Last-Modified' in response:
+                last_modified = datetime.fromtimestamp(parse_http_date(response['Last-Modified']), dt_timezone.utc)
+            list_response_cache.set(key, (response.data, response['ETag'], last_modified))
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_list(request, lambda: super(CachedListMixin, self).list(request, *args, **kwargs))
+
+
+class RequestMetricsMixin:
+    """
+    Adds serializer time to the request metrics recorded by
+    RequestMetricsMiddleware.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        metrics = getattr(self.request, 'metrics', None)
+        if metrics is not None:
+            serializer.to_representation = metrics.timed('serializer', serializer.to_representation)
+        return serializer
@@ -1,18 +1,63 @@
+from django.http import Http404
 from rest_framework import viewsets
+from rest_framework.response import Response
+from api.cache import status_cache
 from api.models import Status
 from api.serializers.status import StatusSerializer
+from api.views.mixins import CachedListMixin, ConditionalGetMixin, RequestMetricsMixin, make_etag
 
 
-class StatusViewSet(viewsets.ModelViewSet):
+class StatusViewSet(RequestMetricsMixin, CachedListMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Status model.
     Provides CRUD operations: list, create, retrieve, update, partial_update, destroy.
+    Reads are served from the process-wide status cache.
+    Reads send ETag / Last-Modified and answer 304 when nothing changed;
+    writes honor If-Match.
+    List responses are cached until a status is written.
+    Serializer time is reported in the request metrics.
     """
     queryset = Status.objects.all()
     serializer_class = StatusSerializer
+    list_cache_name = 'status-list'
+    list_cache_models = (Status,)
 
     def get_queryset(self):
         """
         Optionally restricts the returned statuses.
         """
         return Status.objects.all().order_by('name')
+
+    def get_object(self):
+        """
+        Return the cached status on reads; writes load a fresh row.
+        """
+        if self.action != 'retrieve':
+            return super().get_object()
+
+        try:
+            obj = status_cache.get(int(self.kwargs[self.lookup_field]))
+        except ValueError:
+            obj = None
+        if obj is None:
+            raise Http404
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    def get_list_validators(self, queryset):
+        """
+        Compute the list validators from the cache instead of the table.
+        """
+        statuses = status_cache.all()
+        last_modified = max((status.updated_at for status in statuses), default=None)
+        return make_etag(last_modified, len(statuses)), last_modified
+
+    def list(self, request, *args, **kwargs):
+        """
+        List every status from the cache.
+        """
+        return self.cached_list(request, lambda: self.conditional_response(
+            request,
+            self.get_list_validators(None),
+            lambda: Response(self.get_serializer(status_cache.all(), many=True).data),
+        ))
@@ -1,4 +1,5 @@
 from .task import TaskViewSet
 from .mark_complete import mark_tasks_as_complete
+from .stream import task_stream
 
-__all__ = ['TaskViewSet', 'mark_tasks_as_complete']
+__all__ = ['TaskViewSet', 'mark_tasks_as_complete', 'task_stream']
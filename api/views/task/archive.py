@@ -0,0 +1,26 @@
+from rest_framework.permissions import SAFE_METHODS
+from api.models import Task, TaskWithArchive
+
+
+class TaskArchiveMixin:
+    """
+    Adds ?include_archived= to the Task ViewSet.
+    Reads (list, retrieve, export) normally cover the task table only;
+    with ?include_archived=true they read the task_with_archive view, which
+    also returns the tasks moved to task_archive by archive_tasks.
+    Archived tasks are read-only: writes always target the task table.
+    """
+    include_archived_param = 'include_archived'
+
+    def include_archived(self):
+        return (
+            self.request.method in SAFE_METHODS
+            and self.request.query_params.get(self.include_archived_param, '').lower() in ('1', 'true', 'yes')
+        )
+
+    def get_task_queryset(self):
+        """
+        Return the task queryset the current request reads.
+        """
+        model = TaskWithArchive if self.include_archived() else Task
+        return model.objects.select_related('status').all()
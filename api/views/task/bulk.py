@@ -0,0 +1,96 @@
+from django.db import connection, transaction
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiExample
+from api.cache import list_response_cache
+from api.models import Task
+from api.serializers.task import TaskBulkSerializer, TaskBulkCreateSerializer, TaskBulkUpdateSerializer
+from .transition import ids_condition
+
+
+def delete_tasks(task_ids):
+    """
+    Delete the given tasks with one DELETE ... RETURNING and return the ids
+    that existed. Sends no signals.
+    """
+    where, params = ids_condition(task_ids)
+    quote = connection.ops.quote_name
+    pk = quote(Task._meta.pk.column)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {quote(Task._meta.db_table)} WHERE {where} RETURNING {pk}', params)
+        return {row[0] for row in cursor.fetchall()}
+
+
+class TaskBulkMixin:
+    """
+    Adds a bulk create/update/delete action to the Task ViewSet.
+    All operations in one request run inside a single transaction.
+    """
+
+    @extend_schema(
+        request=TaskBulkSerializer,
+        responses={
+            200: {'description': 'Per-item results (task ids) for every operation, in request order'},
+            400: {'description': 'Invalid request data (nothing is written)'}
+        },
+        examples=[
+            OpenApiExample(
+                'Bulk operations',
+                value={
+                    'create': [{'name': 'New task', 'content': 'Description', 'status': 1}],
+                    'update': [{'id': 2, 'status': 3}],
+                    'delete': [4, 5]
+                },
+                request_only=True,
+                description='Example: create one task, move task 2 to status 3 and delete tasks 4 and 5'
+            ),
+        ],
+        description='Create, update and delete many tasks in one request. Either every operation is applied or none is.',
+        summary='Bulk task operations'
+    )
+    @action(detail=False, methods=['post'], url_path='bulk', pagination_class=None)
+    def bulk(self, request):
+        """
+        Create, update and delete tasks in one transaction.
+
+        Request body: {"create": [...], "update": [{"id": 1, ...}], "delete": [2, 3]}
+
+        Returns:
+            200: Operations applied, with per-item results in request order
+            400: Invalid request data
+        """
+        serializer = TaskBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        creates = serializer.validated_data['create']
+        updates = serializer.validated_data['update']
+        deletes = serializer.validated_data['delete']
+
+        # None of the statements below send signals: invalidate the cached
+        # lists once for the batch
+        with list_response_cache.deferred_invalidation(), transaction.atomic():
+            # Lock every task to update before touching anything
+            instances = Task.objects.select_for_update().in_bulk([item['id'] for item in updates])
+            missing = [{} if item['id'] in instances else {'id': ['Task not found.']} for item in updates]
+            if any(missing):
+                raise serializers.ValidationError({'update': missing})
+
+            created = TaskBulkCreateSerializer(many=True).create(creates) if creates else []
+            updated = TaskBulkUpdateSerializer(many=True).update(instances, updates) if updates else []
+
+            deleted_ids = delete_tasks(deletes) if deletes else set()
+
+            list_response_cache.invalidate(Task)
+
+        response_data = {
+            'message': f'{len(created)} task(s) created, {len(updated)} updated, {len(deleted_ids)} deleted',
+            'created_count': len(created),
+            'updated_count': len(updated),
+            'deleted_count': len(deleted_ids),
+            'created': [{'id': task.id} for task in created],
+            'updated': [{'id': task.id} for task in updated],
+            'deleted': [{'id': task_id, 'deleted': task_id in deleted_ids} for task_id in deletes],
+        }
+
+        return Response(response_data, status=status.HTTP_200_OK)
@@ -0,0 +1,105 @@
+import heapq
+from django.db import connection
+from django.db.models import Q
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+from api.models import Task, TaskTombstone
+from api.pagination.changes import ChangeCursor
+from api.serializers.task import TaskChangesQuerySerializer
+
+# Oldest transaction id that may still commit. Every transaction below it
+# has finished, so changes below it can be returned in order without ever
+# skipping one that commits later.
+HORIZON_SQL = 'SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint'
+
+
+def change_horizon():
+    with connection.cursor() as cursor:
+        cursor.execute(HORIZON_SQL)
+        return cursor.fetchone()[0]
+
+
+def after(queryset, id_field, cursor, horizon):
+    """
+    Restrict queryset to rows after cursor and below horizon, in feed order.
+    """
+    return queryset.filter(
+        Q(change_txid__gt=cursor.txid) | Q(change_txid=cursor.txid, **{f'{id_field}__gt': cursor.task_id}),
+        change_txid__gte=cursor.txid,
+        change_txid__lt=horizon,
+    ).order_by('change_txid', id_field)
+
+
+def read_changes(cursor, limit):
+    """
+    Read up to limit feed entries after cursor.
+
+    Returns (entries, next_cursor, has_more), entries being
+    (change_txid, task_id, Task or TaskTombstone) tuples in feed order.
+    """
+    horizon = change_horizon()
+    tasks = after(Task.objects.select_related('status'), 'id', cursor, horizon)[:limit + 1]
+    tombstones = after(TaskTombstone.objects.all(), 'task_id', cursor, horizon)[:limit + 1]
+    entries = list(heapq.merge(
+        ((task.change_txid, task.id, task) for task in tasks),
+        ((tombstone.change_txid, tombstone.task_id, tombstone) for tombstone in tombstones),
+        key=lambda entry: entry[:2],
+    ))
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    if has_more:
+        next_cursor = ChangeCursor(*entries[-1][:2])
+    else:
+        # Everything below the horizon has been returned
+        next_cursor = ChangeCursor(*max(cursor.position, (horizon, 0)))
+    return entries, next_cursor, has_more
+
+
+class TaskChangesMixin:
+    """
+    Adds a change feed action to the Task ViewSet.
+    Returns the tasks written and removed since a cursor, ordered by the
+    transaction that wrote them (Task.change_txid and TaskTombstone, both
+    maintained by database triggers), so the cost follows the number of
+    changes rather than the size of the table.
+    """
+
+    @extend_schema(
+        parameters=[TaskChangesQuerySerializer],
+        request=None,
+        responses={
+            200: {'description': 'Tasks created or updated (current state) and tasks removed since the cursor, with the next cursor'},
+            400: {'description': 'Invalid cursor or page size'},
+            410: {'description': 'Cursor older than the tombstone retention; sync again from scratch'},
+        },
+        description='Incremental sync: tasks created, updated or deleted since the ?since= cursor.',
+        summary='Task change feed'
+    )
+    @action(detail=False, methods=['get'], url_path='changes', pagination_class=None, filter_backends=[])
+    def changes(self, request):
+        """
+        Return changes after ?since= (or from the beginning).
+
+        Returns:
+            200: changes, deleted, next and has_more
+            400: Invalid parameters
+            410: Cursor expired
+        """
+        query = TaskChangesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        cursor = query.validated_data.get('since') or ChangeCursor()
+        limit = query.validated_data['page_size']
+        entries, next_cursor, has_more = read_changes(cursor, limit)
+
+        changed = [entry[2] for entry in entries if isinstance(entry[2], Task)]
+        return Response({
+            'changes': self.get_serializer(changed, many=True).data,
+            'deleted': [
+                {'id': tombstone.task_id, 'reason': tombstone.reason, 'deleted_at': tombstone.deleted_at}
+                for _, _, tombstone in entries if isinstance(tombstone, TaskTombstone)
+            ],
+            'next': next_cursor.encode(),
+            'has_more': has_more,
+        })
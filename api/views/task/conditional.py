@@ -0,0 +1,29 @@
+from api.cache import status_cache
+from api.views.mixins import ConditionalGetMixin, make_etag
+
+
+class TaskConditionalGetMixin(ConditionalGetMixin):
+    """
+    Conditional GET for tasks.
+    Task payloads embed the status name and color, so the validators also
+    cover the statuses (read from the status cache, without a query).
+    """
+    validator_columns = ('updated_at', 'status')
+
+    def get_list_validators(self, rows):
+        etag, last_modified = super().get_list_validators(rows)
+        statuses = status_cache.all()
+        status_modified = max((status.updated_at for status in statuses), default=None)
+        return (
+            make_etag(etag, status_modified, len(statuses)),
+            max(filter(None, [last_modified, status_modified]), default=None),
+        )
+
+    def get_object_validators(self, obj):
+        etag, last_modified = super().get_object_validators(obj)
+        status = status_cache.get(obj.status_id)
+        status_modified = status.updated_at if status else None
+        return (
+            make_etag(etag, status_modified),
+            max(filter(None, [last_modified, status_modified])),
+        )
@@ -0,0 +1,125 @@
+import csv
+from itertools import islice
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from api.serializers.task import TaskExportSerializer
+
+# Exported columns, in output order. Mirrors the TaskSerializer fields.
+EXPORT_FIELDS = [
+    ('id', 'id'),
+    ('name', 'name'),
+    ('content', 'content'),
+    ('status', 'status_id'),
+    ('status_name', 'status__name'),
+    ('status_color', 'status__hexa_color'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+]
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+
+class Echo:
+    """
+    File-like object that returns what is written instead of buffering it,
+    so csv.writer can be used to format a single row at a time.
+    """
+    def write(self, value):
+        return value
+
+
+def iter_ndjson(rows, columns):
+    """
+    Yield one JSON document per row, newline terminated.
+    """
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + '\n'
+
+
+def iter_csv(rows, columns):
+    """
+    Yield a CSV header followed by one CSV line per row.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+async def aiter_lines(lines, batch_size=EXPORT_CHUNK_SIZE):
+    """
+    Serve a line iterator asynchronously, batch_size lines at a time.
+    Django's ASGI handler reads synchronous streaming content into a list
+    before sending it; each batch is read in the request's thread instead,
+    where the view opened its server-side cursor.
+    """
+    read_batch = sync_to_async(lambda: ''.join(islice(lines, batch_size)), thread_sensitive=True)
+    try:
+        while batch := await read_batch():
+            yield batch
+    finally:
+        await sync_to_async(lines.close, thread_sensitive=True)()
+
+
+EXPORT_FORMATS = {
+    'ndjson': (iter_ndjson, 'application/x-ndjson'),
+    'csv': (iter_csv, 'text/csv'),
+}
+
+
+class TaskExportMixin:
+    """
+    Adds a streaming export action to the Task ViewSet.
+    Rows are read through a server-side cursor and written to the client as
+    they arrive, so memory use does not grow with the number of matching tasks.
+    Under ASGI the rows are served through an async iterator (aiter_lines).
+    """
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='export_format',
+                type=str,
+                enum=['ndjson', 'csv'],
+                description='Output format (default: ndjson)'
+            ),
+        ],
+        responses={200: {'description': 'Streamed NDJSON or CSV file'}},
+        description='Stream every task matching the list filters, search and ordering as NDJSON or CSV.',
+        summary='Export tasks'
+    )
+    @action(detail=False, methods=['get'], url_path='export', pagination_class=None)
+    def export(self, request):
+        """
+        Stream all tasks matching the current filters.
+
+        Query params: export_format=ndjson|csv, plus any list filter.
+
+        Returns:
+            200: Streamed file
+            400: Invalid export format
+        """
+        serializer = TaskExportSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        export_format = serializer.validated_data['export_format']
+
+        columns = [column for column, _ in EXPORT_FIELDS]
+        rows = (
+            self.filter_queryset(self.get_queryset())
+            .values_list(*[lookup for _, lookup in EXPORT_FIELDS])
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+
+        render_rows, content_type = EXPORT_FORMATS[export_format]
+        lines = render_rows(rows, columns)
+        if isinstance(request._request, ASGIRequest):
+            lines = aiter_lines(lines)
+        response = StreamingHttpResponse(lines, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="tasks.{export_format}"'
+        return response
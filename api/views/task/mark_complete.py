@@ -2,8 +2,9 @@ from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiExample
-from api.models import Task, Status
+from api.cache import status_cache
 from api.serializers.task import TaskSerializer, MarkTasksAsCompleteSerializer
+from .transition import ids_condition, transition_tasks
 
 
 @extend_schema(
@@ -44,40 +45,35 @@ def mark_tasks_as_complete(request):
     task_ids = serializer.validated_data['task_ids']
 
     # Find the "Completado" status (case-insensitive)
-    try:
-        completed_status = Status.objects.get(name__iexact='completado')
-    except Status.DoesNotExist:
+    completed_status = status_cache.get_by_name('completado')
+    if completed_status is None:
         return Response(
             {'error': 'Completado status not found. Please create a status with name "Completado".'},
             status=status.HTTP_404_NOT_FOUND
         )
 
-    # Get all requested tasks
-    tasks = Task.objects.filter(id__in=task_ids).select_related('status')
+    rows = transition_tasks(
+        ids_condition(task_ids),
+        completed_status,
+        'SELECT requested.task_id, requested.name, requested.previous_status_id, updated.task_id IS NOT NULL '
+        'FROM requested LEFT JOIN updated USING (task_id) '
+        'ORDER BY requested.created_at DESC, requested.task_id DESC'
+    )
 
-    # Separate already completed from pending
-    already_completed_tasks = []
     to_complete_tasks = []
-
-    for task in tasks:
-        task_data = {
-            'id': task.id,
-            'name': task.name,
-            'status': task.status.name
-        }
-        if task.status.id == completed_status.id:
-            already_completed_tasks.append(task_data)
+    already_completed_tasks = []
+    for task_id, name, previous_status_id, updated in rows:
+        if updated:
+            to_complete_tasks.append({
+                'id': task_id,
+                'name': name,
+                'status': completed_status.name,
+                'previous_status': status_cache.get(previous_status_id).name,
+            })
         else:
-            to_complete_tasks.append(task_data)
+            already_completed_tasks.append({'id': task_id, 'name': name, 'status': completed_status.name})
 
-    # Update only non-completed tasks
-    updated_count = 0
-    to_complete_ids = [task['id'] for task in to_complete_tasks]
-    if to_complete_ids:
-        updated_count = Task.objects.filter(id__in=to_complete_ids).update(status=completed_status)
-        # Update the status in our data structure after processing
-        for task in to_complete_tasks:
-            task['status'] = completed_status.name
+    updated_count = len(to_complete_tasks)
 
     # Build response
     response_data = {
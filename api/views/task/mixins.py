@@ -0,0 +1,24 @@
+from .archive import TaskArchiveMixin
+from .bulk import TaskBulkMixin
+from .changes import TaskChangesMixin
+from .conditional import TaskConditionalGetMixin
+from .export import TaskExportMixin
+from .sparse import TaskSparseFieldsMixin
+from .stats import TaskStatsMixin
+from .transition import TaskTransitionMixin
+
+
+class TaskReadMixin(TaskSparseFieldsMixin, TaskConditionalGetMixin, TaskArchiveMixin):
+    """
+    How Task reads are served: sparse columns, ETag / Last-Modified
+    validators and ?include_archived=.
+    The sparse fields mixin overrides list hooks of the conditional GET
+    mixin, so it comes first.
+    """
+
+
+class TaskActionsMixin(TaskExportMixin, TaskBulkMixin, TaskTransitionMixin, TaskStatsMixin, TaskChangesMixin):
+    """
+    Collection actions of the Task ViewSet: export, bulk, transition,
+    stats and changes.
+    """
@@ -0,0 +1,64 @@
+from collections import defaultdict
+from datetime import timedelta
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+from api.cache import status_cache
+from api.models import TaskDailyCount
+
+
+class TaskStatsMixin:
+    """
+    Adds a statistics action to the Task ViewSet.
+    Counts are read from the task_daily_count summary table, so the cost
+    depends on the number of statuses and days, not on the number of tasks.
+    """
+
+    @extend_schema(
+        request=None,
+        responses={
+            200: {'description': 'Task counts in total, by status, by status color, by creation day and by creation week (UTC, weeks start on Monday)'},
+        },
+        description='Task counts by status, status color, creation day and creation week, served from a summary table.',
+        summary='Task statistics'
+    )
+    @action(detail=False, methods=['get'], url_path='stats', pagination_class=None, filter_backends=[])
+    def stats(self, request):
+        """
+        Return task counts by status, color, day and week.
+
+        Returns:
+            200: Task statistics
+        """
+        by_status = defaultdict(int)
+        by_day = defaultdict(int)
+        by_week = defaultdict(int)
+
+        rows = TaskDailyCount.objects.filter(count__gt=0).values_list('status_id', 'day', 'count')
+        for status_id, day, count in rows:
+            by_status[status_id] += count
+            by_day[day] += count
+            by_week[day - timedelta(days=day.weekday())] += count
+
+        by_color = defaultdict(int)
+        statuses = []
+        for task_status in status_cache.all():
+            count = by_status.get(task_status.pk, 0)
+            by_color[task_status.hexa_color] += count
+            statuses.append({
+                'status': task_status.pk,
+                'status_name': task_status.name,
+                'status_color': task_status.hexa_color,
+                'count': count,
+            })
+
+        response_data = {
+            'total': sum(by_status.values()),
+            'by_status': statuses,
+            'by_color': [{'color': color, 'count': count} for color, count in sorted(by_color.items())],
+            'by_day': [{'day': day, 'count': count} for day, count in sorted(by_day.items())],
+            'by_week': [{'week': week, 'count': count} for week, count in sorted(by_week.items())],
+        }
+
+        return Response(response_data, status=status.HTTP_200_OK)
@@ -0,0 +1,16 @@
+from django.http import JsonResponse
+
+
+def task_stream(request):
+    """
+    Placeholder for GET /api/tasks/stream/ under WSGI and the development
+    server. The stream is served by api.streams.TaskStreamApp, which
+    todo_challenge/asgi.py routes this path to.
+
+    Returns:
+        501: The server is not running the ASGI application
+    """
+    return JsonResponse(
+        {'detail': 'The task stream is only served by the ASGI application (SERVER_MODE=asgi).'},
+        status=501,
+    )
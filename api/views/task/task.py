@@ -1,20 +1,27 @@
-from rest_framework import viewsets, filters, status
+from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from api.models import Task, Status
+from api.filters import TaskSearchFilter, TaskOrderingFilter
+from api.pagination import TaskCursorPagination
+from api.views.mixins import CachedListMixin, RequestMetricsMixin
 from api.serializers.task import TaskSerializer, MarkTasksAsCompleteSerializer
+from .mixins import TaskActionsMixin, TaskReadMixin
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(RequestMetricsMixin, CachedListMixin, TaskReadMixin, TaskActionsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Task model.
     Provides CRUD operations: list, create, retrieve, update, partial_update, destroy.
-    Includes filtering and search capabilities.
+    Includes filtering and full-text search capabilities.
+    Lists are paginated with a cursor and cached until a task or status
+    is written.
     """
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = TaskCursorPagination
+    filter_backends = [DjangoFilterBackend, TaskSearchFilter, TaskOrderingFilter]
     filterset_fields = {
         'status': ['exact'],
         'created_at': ['exact', 'gte', 'lte', 'range'],
@@ -22,9 +29,11 @@ class TaskViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'content']
     ordering_fields = ['created_at', 'updated_at', 'name']
     ordering = ['-created_at']
+    list_cache_name = 'task-list'
+    list_cache_models = (Task, Status)
 
     def get_queryset(self):
         """
         Optionally filter tasks with select_related for performance.
         """
-        return Task.objects.select_related('status').all()
+        return self.trim_queryset(self.get_task_queryset(), self.validator_columns)
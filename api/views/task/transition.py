@@ -0,0 +1,155 @@
+from django.db import connection
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiExample
+from api.cache import list_response_cache, status_cache
+from api.models import Task
+from api.serializers.task import TaskTransitionSerializer
+
+
+def ids_condition(task_ids):
+    """
+    Select tasks by id, sent as a single array parameter.
+    """
+    pk = Task._meta.pk
+    return f'{connection.ops.quote_name(pk.column)} = ANY(%s::{pk.db_type(connection)}[])', [list(task_ids)]
+
+
+def queryset_condition(queryset):
+    """
+    Select the tasks of a queryset with a subquery.
+    """
+    sql, params = queryset.order_by().values('pk').query.sql_with_params()
+    return f'{connection.ops.quote_name(Task._meta.pk.column)} IN ({sql})', list(params)
+
+
+def transition_tasks(condition, target_status, select):
+    """
+    Move the tasks matching condition to target_status in one statement and
+    return the rows of select.
+    The tasks are locked before their status is compared, so a concurrent
+    writer cannot change it between the check and the update; tasks already
+    in target_status are left untouched. select runs over two CTEs:
+    requested (task_id, name, created_at, previous_status_id) and
+    updated (task_id).
+    """
+    quote = connection.ops.quote_name
+    table = quote(Task._meta.db_table)
+    pk = quote(Task._meta.pk.column)
+    name, created_at, status_id, updated_at = (
+        quote(Task._meta.get_field(field).column) for field in ('name', 'created_at', 'status', 'updated_at')
+    )
+    where, params = condition
+    sql = (
+        f'WITH requested AS ('
+        f'SELECT {pk} AS task_id, {name} AS name, {created_at} AS created_at, '
+        f'{status_id} AS previous_status_id FROM {table} WHERE {where} FOR UPDATE'
+        f'), updated AS ('
+        f'UPDATE {table} SET {status_id} = %s, {updated_at} = %s FROM requested '
+        f'WHERE {table}.{pk} = requested.task_id AND requested.previous_status_id <> %s '
+        f'RETURNING {table}.{pk} AS task_id'
+        f') {select}'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, target_status.pk, timezone.now(), target_status.pk])
+        rows = cursor.fetchall()
+
+    # The raw UPDATE sends no signals
+    list_response_cache.invalidate(Task)
+    return rows
+
+
+class TaskTransitionMixin:
+    """
+    Adds a bulk status transition action to the Task ViewSet.
+    The tasks are chosen by id or with the same filters as the list, and
+    are moved with a single set-based UPDATE.
+    """
+
+    @extend_schema(
+        request=TaskTransitionSerializer,
+        responses={
+            200: {'description': 'Counts of moved tasks per previous status'},
+            400: {'description': 'Invalid request data or filter'}
+        },
+        examples=[
+            OpenApiExample(
+                'Move tasks by id',
+                value={'status': 2, 'task_ids': [1, 2, 3]},
+                request_only=True,
+                description='Example: move tasks 1, 2 and 3 to status 2'
+            ),
+            OpenApiExample(
+                'Move tasks by filter',
+                value={'status': 3, 'filter': {'status': 2, 'created_at__lte': '2024-01-01T00:00:00Z'}},
+                request_only=True,
+                description='Example: move every task in status 2 created before 2024 to status 3'
+            ),
+        ],
+        description='Move many tasks to a status. Tasks are given by id or by a filter using the list filter parameters.',
+        summary='Bulk status transition'
+    )
+    @action(detail=False, methods=['post'], url_path='transition', pagination_class=None)
+    def transition(self, request):
+        """
+        Move tasks to a status with one UPDATE.
+
+        Request body: {"status": 3, "task_ids": [1, 2]} or {"status": 3, "filter": {"status": 1}}
+
+        Returns:
+            200: Tasks moved, with counts per previous status
+            400: Invalid request data or filter
+        """
+        serializer = TaskTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        target_status = serializer.validated_data['status']
+
+        if 'task_ids' in serializer.validated_data:
+            condition = ids_condition(serializer.validated_data['task_ids'])
+        else:
+            condition = queryset_condition(self.get_transition_queryset(serializer.validated_data['filter']))
+
+        rows = transition_tasks(
+            condition,
+            target_status,
+            'SELECT requested.previous_status_id, count(*), count(updated.task_id) '
+            'FROM requested LEFT JOIN updated USING (task_id) '
+            'GROUP BY requested.previous_status_id ORDER BY requested.previous_status_id'
+        )
+
+        updated_count = sum(updated for _, _, updated in rows)
+        matched_count = sum(count for _, count, _ in rows)
+        response_data = {
+            'message': f'{updated_count} task(s) moved to {target_status.name}',
+            'status': target_status.pk,
+            'status_name': target_status.name,
+            'matched_count': matched_count,
+            'updated_count': updated_count,
+            'unchanged_count': matched_count - updated_count,
+            'previous_statuses': [
+                {'status': status_id, 'status_name': status_cache.get(status_id).name, 'count': count}
+                for status_id, count, _ in rows
+            ],
+        }
+
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    def get_transition_queryset(self, filters):
+        """
+        Filter tasks with the ViewSet's filterset_fields.
+        Unknown filter names are rejected rather than ignored, so a typo
+        cannot select every task.
+        """
+        queryset = Task.objects.all()
+        filterset_class = DjangoFilterBackend().get_filterset_class(self, queryset)
+        unknown = sorted(set(filters) - set(filterset_class.base_filters))
+        if unknown:
+            raise serializers.ValidationError({'filter': [f'Unknown filter: {name}' for name in unknown]})
+
+        filterset = filterset_class(data=filters, queryset=queryset, request=self.request)
+        if not filterset.is_valid():
+            raise serializers.ValidationError({'filter': filterset.errors})
+        return filterset.qs
@@ -20,5 +20,18 @@ python manage.py create_superuser_if_none_exists
 # Collect static files (if needed)
 # python manage.py collectstatic --noinput
 
-echo "Starting Django development server..."
-python manage.py runserver 0.0.0.0:8000
+# SERVER_MODE selects how the app is served:
+#   dev  (default) Django development server
+#   wsgi gunicorn with threaded sync workers
+#   asgi gunicorn with uvicorn workers
+# Worker count, threads and timeouts are read by gunicorn.conf.py.
+case "${SERVER_MODE:-dev}" in
+  wsgi|asgi)
+    echo "Starting gunicorn (${SERVER_MODE})..."
+    exec gunicorn -c gunicorn.conf.py
+    ;;
+  *)
+    echo "Starting Django development server..."
+    exec python manage.py runserver 0.0.0.0:8000
+    ;;
+esac
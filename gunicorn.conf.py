@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration used by entrypoint.sh when SERVER_MODE is "wsgi" or
+"asgi". Every value can be overridden through the environment.
+
+- wsgi: threaded sync workers serving todo_challenge.wsgi
+- asgi: uvicorn workers serving todo_challenge.asgi
+"""
+import multiprocessing
+import os
+
+SERVER_MODE = os.getenv('SERVER_MODE', 'wsgi')
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '0'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '0'))
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-') or None
+errorlog = '-'
+
+if SERVER_MODE == 'asgi':
+    worker_class = 'uvicorn_worker.UvicornWorker'
+    wsgi_app = 'todo_challenge.asgi:application'
+else:
+    worker_class = 'gthread'
+    threads = int(os.getenv('GUNICORN_THREADS', '4'))
+    wsgi_app = 'todo_challenge.wsgi:application'
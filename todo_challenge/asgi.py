@@ -2,6 +2,8 @@
 ASGI config for todo_challenge project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests to the task stream (/api/tasks/stream/) are served by
+api.streams.TaskStreamApp; everything else goes to Django.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
@@ -13,4 +15,15 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todo_challenge.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported once Django is set up
+from api.streams import TaskStreamApp  # noqa: E402
+
+task_stream = TaskStreamApp()
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and scope['path'] == task_stream.path:
+        return await task_stream(scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -51,6 +51,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -83,6 +84,19 @@ WSGI_APPLICATION = 'todo_challenge.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
+# DB_CONN_MAX_AGE keeps connections open between requests (seconds, "none"
+# for unlimited, 0 to close after each request). It defaults to 60 under
+# gunicorn's threaded workers (SERVER_MODE=wsgi) and to 0 otherwise: the
+# development server and ASGI run each request in a new thread, where a
+# persistent connection would never be reused.
+# DB_PGBOUNCER=true targets a pgbouncer in transaction pooling mode, which
+# does not support server-side cursors.
+
+def env_bool(name, default=False):
+    return os.getenv(name, str(default)).lower() in ('1', 'true', 'yes')
+
+
+DB_CONN_MAX_AGE = os.getenv('DB_CONN_MAX_AGE', '60' if os.getenv('SERVER_MODE') == 'wsgi' else '0')
 
 DATABASES = {
     'default': {
@@ -92,8 +106,98 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', 'postgres'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        'CONN_MAX_AGE': None if DB_CONN_MAX_AGE.lower() == 'none' else int(DB_CONN_MAX_AGE),
+        'CONN_HEALTH_CHECKS': env_bool('DB_CONN_HEALTH_CHECKS', True),
+        'DISABLE_SERVER_SIDE_CURSORS': env_bool('DB_PGBOUNCER'),
+    }
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Set REDIS_URL to share the cache between worker processes; otherwise each
+# process keeps its own in-memory cache.
+
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
     }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds a cached list response (GET /api/tasks/, GET /api/status/) is kept.
+# Writes invalidate entries immediately; 0 disables the list cache. The
+# generation counters live in the cache: without REDIS_URL other workers
+# would not see a write, and the list cache stays off.
+LIST_CACHE_TIMEOUT = int(os.getenv('LIST_CACHE_TIMEOUT', '300')) if REDIS_URL else 0
+
+# Seconds a process keeps its copy of the status table. With REDIS_URL
+# every write is seen through the shared cache and copies never expire.
+STATUS_CACHE_TTL = None if REDIS_URL else int(os.getenv('STATUS_CACHE_TTL', '30'))
+
+# Task lists requested with ?count=true are counted exactly up to this many
+# rows; larger filtered results report the planner's estimate instead.
+TASK_COUNT_EXACT_LIMIT = int(os.getenv('TASK_COUNT_EXACT_LIMIT', '10000'))
+
+# Days a /api/tasks/changes/ cursor stays valid. Tombstones of deleted tasks
+# are kept one day longer and then removed by prune_task_tombstones.
+TASK_CHANGES_RETENTION_DAYS = int(os.getenv('TASK_CHANGES_RETENTION_DAYS', '30'))
+
+# Task stream (/api/tasks/stream/, served by the ASGI app only).
+# TASK_STREAM_HEARTBEAT: seconds between keep-alive messages on an idle
+# stream (and between safety reads of the change feed).
+# TASK_STREAM_BUFFER_SIZE: recent events kept per process; clients further
+# behind read the change feed instead.
+# TASK_STREAM_DB_HOST / TASK_STREAM_DB_PORT: where the LISTEN connection
+# goes when DB_HOST is a pgbouncer in transaction pooling mode.
+TASK_STREAM_HEARTBEAT = float(os.getenv('TASK_STREAM_HEARTBEAT', '15'))
+TASK_STREAM_BUFFER_SIZE = int(os.getenv('TASK_STREAM_BUFFER_SIZE', '1000'))
+TASK_STREAM_DB_HOST = os.getenv('TASK_STREAM_DB_HOST', '')
+TASK_STREAM_DB_PORT = os.getenv('TASK_STREAM_DB_PORT', '')
+
+
+# Request metrics
+# REQUEST_METRICS_ENABLED records query count and timings of every request
+# (Server-Timing header and /api/metrics/). METRICS_TOKEN, when set, is the
+# bearer token scrapers must send to /api/metrics/; when empty only staff
+# users can read it.
+
+REQUEST_METRICS_ENABLED = env_bool('REQUEST_METRICS_ENABLED', True)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+
+# Password hashing
+# PASSWORD_HASHER picks the hasher for new passwords: "pbkdf2" (Django's
+# default algorithm) or "argon2" (argon2id, requires argon2-cffi). Hashes made
+# with the other hasher or with other cost parameters still verify and are
+# rehashed with the current settings on the next successful login.
+# The argon2 defaults follow the OWASP recommendation (m=19 MiB, t=2, p=1),
+# which is far cheaper per login than PBKDF2 with 600000 iterations.
+
+PASSWORD_HASHER_CLASSES = {
+    'pbkdf2': 'api.hashers.PBKDF2PasswordHasher',
+    'argon2': 'api.hashers.Argon2PasswordHasher',
 }
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CLASSES[PASSWORD_HASHER],
+    *(path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER),
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PBKDF2_ITERATIONS = int(os.getenv('PBKDF2_ITERATIONS', '600000'))
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', '2'))
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', '19456'))
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', '1'))
 
 
 # Password validation
@@ -143,10 +247,15 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.FastJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
@@ -159,7 +268,8 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': False,
     'BLACKLIST_AFTER_ROTATION': False,
-    'UPDATE_LAST_LOGIN': True,
+    # last_login is written by api.authentication.last_login_recorder instead
+    'UPDATE_LAST_LOGIN': False,
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'AUTH_HEADER_TYPES': ('Bearer',),
@@ -168,8 +278,29 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    'TOKEN_OBTAIN_SERIALIZER': 'api.serializers.auth.TokenObtainPairSerializer',
 }
 
+# Accepted access tokens are cached per process (see api.cache.tokens).
+# AUTH_CACHE_TTL: seconds a token stays cached (0 disables the cache).
+# AUTH_CACHE_MAX_SIZE: tokens kept per process, least recently used first out.
+# AUTH_TOKEN_USER: build request.user from the token claims instead of auth_user.
+# AUTH_TOKEN_VERSIONS: embed the user's token version in issued tokens and
+# refuse tokens behind it (revocation on password change).
+# Both skip the user lookup, so a revoked token is only refused through the
+# markers kept in the cache: without REDIS_URL other workers would not see
+# them, and all three stay off.
+AUTH_CACHE_TTL = int(os.getenv('AUTH_CACHE_TTL', '60')) if REDIS_URL else 0
+AUTH_CACHE_MAX_SIZE = int(os.getenv('AUTH_CACHE_MAX_SIZE', '10000'))
+AUTH_TOKEN_USER = bool(REDIS_URL) and env_bool('AUTH_TOKEN_USER')
+AUTH_TOKEN_VERSIONS = bool(REDIS_URL)
+
+# Seconds between batched last_login writes for issued tokens; 0 writes on
+# every token request. Defaults to 5 under gunicorn (SERVER_MODE wsgi/asgi).
+LAST_LOGIN_FLUSH_INTERVAL = float(os.getenv(
+    'LAST_LOGIN_FLUSH_INTERVAL', '5' if os.getenv('SERVER_MODE') in ('wsgi', 'asgi') else '0'
+))
+
 # DRF Spectacular (OpenAPI/Swagger) Configuration
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Todo Challenge API',